@@ -12,7 +12,14 @@ from alembic import context
 from src.config.base import settings
 from src.database.common.dependencies import BaseSQL
 from src.database.postgres.core import PostgreSQLCore
-from src.models.field import Field
+from src.models.change import FieldChangeScore
+from src.models.field import Field, FieldArchive
+from src.models.job import Job
+from src.models.scene import Scene, SceneSync
+from src.models.statistics import NdviStatistics
+from src.models.time_series import NdviObservation, NdviTimeSeries
+from src.models.weather import WeatherCacheEntry
+from src.models.weather_history import WeatherHistoryDay
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -11,6 +11,7 @@ const App = (() => {
         elements.tabDraw = document.getElementById("tab-draw");
         elements.fieldsList = document.getElementById("fields-list");
         elements.btnRefresh = document.getElementById("btn-refresh");
+        elements.fieldsSummary = document.getElementById("fields-summary");
         elements.geojsonOutput = document.getElementById("geojson-output");
         elements.btnCreateField = document.getElementById("btn-create-field");
         elements.drawStatus = document.getElementById("draw-status");
@@ -155,6 +156,21 @@ const App = (() => {
         } catch (error) {
             elements.fieldsList.innerHTML = `<p class="placeholder">Failed to load fields: ${error.message}</p>`;
         }
+
+        loadSummary();
+    }
+
+    async function loadSummary() {
+        try {
+            const response = await fetch(`${API_BASE}/fields/summary`);
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+
+            const summary = await response.json();
+            const hectares = summary.total_area_m2 / 10000;
+            elements.fieldsSummary.textContent = `${summary.field_count} fields · ${hectares.toFixed(1)} ha`;
+        } catch (error) {
+            elements.fieldsSummary.textContent = "";
+        }
     }
 
     function renderFieldsList(fields) {
@@ -238,6 +254,7 @@ const App = (() => {
 
     function renderFieldsOnMap(fields) {
         MapModule.clearFields();
+        MapModule.refreshClusters();
         fields.forEach((field) => {
             MapModule.addFieldToMap(field, {
                 onSatellite: fetchSatelliteImage,
@@ -399,24 +416,17 @@ const App = (() => {
         statusEl.innerHTML = '<span class="spinner"></span> Computing SAR change detection...';
 
         try {
-            const response = await fetch(`${API_BASE}/sar-change/`, {
-                method: "POST",
-                headers: { "Content-Type": "application/json" },
-                body: JSON.stringify({
+            const updatedField = await runJob(
+                "sar-change",
+                {
                     boundary: field.boundary,
                     date_before_start: dateBeforeStart,
                     date_before_end: dateBeforeEnd,
                     date_after_start: dateAfterStart,
                     date_after_end: dateAfterEnd,
-                }),
-            });
-
-            if (!response.ok) {
-                const error = await response.json();
-                throw new Error(error.detail || `HTTP ${response.status}`);
-            }
-
-            const updatedField = await response.json();
+                },
+                (job) => (statusEl.innerHTML = progressText(job, "Computing SAR change detection...")),
+            );
             await loadFields();
             MapModule.focusField(updatedField.id);
         } catch (error) {
@@ -477,24 +487,17 @@ const App = (() => {
         resultsEl.innerHTML = "";
 
         try {
-            const response = await fetch(`${API_BASE}/ndvi-comparison/`, {
-                method: "POST",
-                headers: { "Content-Type": "application/json" },
-                body: JSON.stringify({
+            const data = await runJob(
+                "ndvi-comparison",
+                {
                     boundary: field.boundary,
                     date_before_start: dateBeforeStart,
                     date_before_end: dateBeforeEnd,
                     date_after_start: dateAfterStart,
                     date_after_end: dateAfterEnd,
-                }),
-            });
-
-            if (!response.ok) {
-                const error = await response.json();
-                throw new Error(error.detail || `HTTP ${response.status}`);
-            }
-
-            const data = await response.json();
+                },
+                (job) => (statusEl.innerHTML = progressText(job, "Computing NDVI comparison...")),
+            );
             statusEl.innerHTML = "";
             resultsEl.innerHTML = `
                 <div class="ndvi-compare-images">
@@ -519,40 +522,44 @@ const App = (() => {
         }
     }
 
-    async function fetchSarChangePopup(field, dateBeforeStart, dateBeforeEnd, dateAfterStart, dateAfterEnd) {
-        const response = await fetch(`${API_BASE}/sar-change/`, {
-            method: "POST",
-            headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({
+    async function fetchSarChangePopup(field, dateBeforeStart, dateBeforeEnd, dateAfterStart, dateAfterEnd, onProgress) {
+        const updatedField = await runJob(
+            "sar-change",
+            {
                 boundary: field.boundary,
                 date_before_start: dateBeforeStart,
                 date_before_end: dateBeforeEnd,
                 date_after_start: dateAfterStart,
                 date_after_end: dateAfterEnd,
-            }),
-        });
-
-        if (!response.ok) {
-            const error = await response.json();
-            throw new Error(error.detail || `HTTP ${response.status}`);
-        }
+            },
+            onProgress,
+        );
 
-        const updatedField = await response.json();
         await loadFields();
         MapModule.focusField(updatedField.id);
     }
 
-    async function fetchNdviComparisonPopup(field, dateBeforeStart, dateBeforeEnd, dateAfterStart, dateAfterEnd) {
-        const response = await fetch(`${API_BASE}/ndvi-comparison/`, {
-            method: "POST",
-            headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({
+    async function fetchNdviComparisonPopup(field, dateBeforeStart, dateBeforeEnd, dateAfterStart, dateAfterEnd, onProgress) {
+        return await runJob(
+            "ndvi-comparison",
+            {
                 boundary: field.boundary,
                 date_before_start: dateBeforeStart,
                 date_before_end: dateBeforeEnd,
                 date_after_start: dateAfterStart,
                 date_after_end: dateAfterEnd,
-            }),
+            },
+            onProgress,
+        );
+    }
+
+    // ---- Jobs ----
+
+    async function runJob(kind, body, onProgress = () => {}) {
+        const response = await fetch(`${API_BASE}/jobs/${kind}`, {
+            method: "POST",
+            headers: { "Content-Type": "application/json" },
+            body: JSON.stringify(body),
         });
 
         if (!response.ok) {
@@ -560,7 +567,47 @@ const App = (() => {
             throw new Error(error.detail || `HTTP ${response.status}`);
         }
 
-        return await response.json();
+        const job = await response.json();
+        if (job.status === "succeeded") return job.result;
+        if (job.status === "failed") throw new Error(job.error || "Job failed");
+
+        return new Promise((resolve, reject) => {
+            const events = new EventSource(`${API_BASE}/jobs/${job.id}/events`);
+
+            events.addEventListener("progress", (event) => onProgress(JSON.parse(event.data)));
+            events.addEventListener("result", (event) => {
+                events.close();
+                resolve(JSON.parse(event.data).result);
+            });
+            events.addEventListener("error", (event) => {
+                events.close();
+                if (event.data) {
+                    reject(new Error(JSON.parse(event.data).error || "Job failed"));
+                } else {
+                    // Connection lost, poll until the job finishes
+                    pollJob(job.id, onProgress).then(resolve, reject);
+                }
+            });
+        });
+    }
+
+    async function pollJob(jobId, onProgress) {
+        for (;;) {
+            const response = await fetch(`${API_BASE}/jobs/${jobId}`);
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+
+            const job = await response.json();
+            if (job.status === "succeeded") return job.result;
+            if (job.status === "failed") throw new Error(job.error || "Job failed");
+
+            onProgress(job);
+            await new Promise((resolve) => setTimeout(resolve, 2000));
+        }
+    }
+
+    function progressText(job, fallback) {
+        const percent = Math.round(job.progress * 100);
+        return `<span class="spinner"></span> ${job.message || fallback} (${percent}%)`;
     }
 
     async function fetchWeatherPopup(field) {
@@ -2,9 +2,16 @@ const MapModule = (() => {
     let map;
     let fieldsLayer;
     let drawnItems;
+    let imageryLayer = null;
+    let imageryKey = null;
+    let clusterLayer;
+    const clusterTiles = new Map();
 
     const UKRAINE_CENTER = [48.5, 31.5];
     const DEFAULT_ZOOM = 6;
+    // Below this zoom fields are drawn as clusters instead of polygons
+    const CLUSTER_MAX_ZOOM = 9;
+    const TILE_SIZE = 256;
 
     const FIELD_STYLE = {
         color: "#3b82f6",
@@ -32,11 +39,84 @@ const MapModule = (() => {
         }).addTo(map);
 
         fieldsLayer = L.featureGroup().addTo(map);
+        clusterLayer = L.layerGroup().addTo(map);
         drawnItems = L.featureGroup().addTo(map);
 
+        map.on("moveend", updateFieldsView);
+        updateFieldsView();
+
         return map;
     }
 
+    // ---- Clusters ----
+
+    function visibleTiles(zoom) {
+        const bounds = map.getBounds();
+        const min = map.project(bounds.getNorthWest(), zoom).divideBy(TILE_SIZE).floor();
+        const max = map.project(bounds.getSouthEast(), zoom).divideBy(TILE_SIZE).floor();
+        const count = 2 ** zoom;
+
+        const tiles = [];
+        for (let x = Math.max(min.x, 0); x <= Math.min(max.x, count - 1); x++) {
+            for (let y = Math.max(min.y, 0); y <= Math.min(max.y, count - 1); y++) {
+                tiles.push(`${zoom}/${x}/${y}`);
+            }
+        }
+        return tiles;
+    }
+
+    async function loadClusterTile(key) {
+        if (!clusterTiles.has(key)) {
+            clusterTiles.set(
+                key,
+                fetch(`/api/v1/fields/clusters/${key}`)
+                    .then((response) => (response.ok ? response.json() : { clusters: [] }))
+                    .catch(() => {
+                        clusterTiles.delete(key);
+                        return { clusters: [] };
+                    })
+            );
+        }
+        return clusterTiles.get(key);
+    }
+
+    function clusterMarker(cluster) {
+        const size = Math.min(56, 24 + Math.round(Math.log10(cluster.count) * 12));
+        const marker = L.marker([cluster.latitude, cluster.longitude], {
+            icon: L.divIcon({
+                className: "field-cluster",
+                html: `<span>${cluster.count}</span>`,
+                iconSize: [size, size],
+            }),
+        });
+
+        const [minLon, minLat, maxLon, maxLat] = cluster.extent;
+        marker.on("click", () => map.fitBounds([[minLat, minLon], [maxLat, maxLon]], { padding: [50, 50] }));
+        return marker;
+    }
+
+    async function updateFieldsView() {
+        const zoom = Math.round(map.getZoom());
+        if (zoom > CLUSTER_MAX_ZOOM) {
+            clusterLayer.clearLayers();
+            if (!map.hasLayer(fieldsLayer)) fieldsLayer.addTo(map);
+            return;
+        }
+
+        map.removeLayer(fieldsLayer);
+        const tiles = await Promise.all(visibleTiles(zoom).map(loadClusterTile));
+
+        // A newer move may have switched back to polygons meanwhile
+        if (Math.round(map.getZoom()) !== zoom) return;
+        clusterLayer.clearLayers();
+        tiles.forEach((tile) => tile.clusters.forEach((cluster) => clusterMarker(cluster).addTo(clusterLayer)));
+    }
+
+    function refreshClusters() {
+        clusterTiles.clear();
+        updateFieldsView();
+    }
+
     function getMap() {
         return map;
     }
@@ -49,6 +129,32 @@ const MapModule = (() => {
         return fieldsLayer;
     }
 
+    function toggleImageryLayer(field, product) {
+        const key = `${field.id}/${product}`;
+        clearImageryLayer();
+        if (imageryKey === key) {
+            imageryKey = null;
+            return false;
+        }
+
+        const bounds = L.geoJSON(field.boundary).getBounds();
+        imageryLayer = L.tileLayer(`/api/v1/fields/${field.id}/tiles/${product}/{z}/{x}/{y}.png`, {
+            bounds: bounds.pad(0.05),
+            maxZoom: 18,
+            opacity: 0.9,
+            attribution: "Sentinel-2 via Google Earth Engine",
+        }).addTo(map);
+        imageryKey = key;
+        return true;
+    }
+
+    function clearImageryLayer() {
+        if (imageryLayer) {
+            map.removeLayer(imageryLayer);
+            imageryLayer = null;
+        }
+    }
+
     function clearFields() {
         fieldsLayer.clearLayers();
     }
@@ -149,6 +255,24 @@ const MapModule = (() => {
             togglePopupNdviCompareForm(field, ndviCompareSection, onNdviCompare);
         });
 
+        const ndviLayerBtn = document.createElement("button");
+        ndviLayerBtn.className = "btn btn-sm btn-ndvi";
+        ndviLayerBtn.textContent = "NDVI Layer";
+        ndviLayerBtn.title = "Show zoomable NDVI tiles on the map";
+        ndviLayerBtn.addEventListener("click", (event) => {
+            event.stopPropagation();
+            toggleImageryLayer(field, "ndvi");
+        });
+
+        const rgbLayerBtn = document.createElement("button");
+        rgbLayerBtn.className = "btn btn-sm btn-satellite";
+        rgbLayerBtn.textContent = "RGB Layer";
+        rgbLayerBtn.title = "Show zoomable RGB tiles on the map";
+        rgbLayerBtn.addEventListener("click", (event) => {
+            event.stopPropagation();
+            toggleImageryLayer(field, "rgb");
+        });
+
         const deleteBtn = document.createElement("button");
         deleteBtn.className = "btn btn-sm btn-danger";
         deleteBtn.textContent = "Delete";
@@ -161,6 +285,8 @@ const MapModule = (() => {
         actions.appendChild(ndviBtn);
         actions.appendChild(sarBtn);
         actions.appendChild(ndviCompareBtn);
+        actions.appendChild(rgbLayerBtn);
+        actions.appendChild(ndviLayerBtn);
         actions.appendChild(deleteBtn);
         container.appendChild(actions);
 
@@ -256,7 +382,9 @@ const MapModule = (() => {
             statusEl.innerHTML = '<span class="spinner"></span> Computing SAR change detection...';
 
             try {
-                await onSar(field, beforeStart, beforeEnd, afterStart, afterEnd);
+                await onSar(field, beforeStart, beforeEnd, afterStart, afterEnd, (job) => {
+                    statusEl.innerHTML = `<span class="spinner"></span> ${job.message || "Computing SAR change detection..."} (${Math.round(job.progress * 100)}%)`;
+                });
             } catch (error) {
                 statusEl.innerHTML = `<span class="status-message error">Error: ${error.message}</span>`;
                 runBtn.disabled = false;
@@ -311,7 +439,9 @@ const MapModule = (() => {
             resultsEl.innerHTML = "";
 
             try {
-                const data = await onNdviCompare(field, beforeStart, beforeEnd, afterStart, afterEnd);
+                const data = await onNdviCompare(field, beforeStart, beforeEnd, afterStart, afterEnd, (job) => {
+                    statusEl.innerHTML = `<span class="spinner"></span> ${job.message || "Computing NDVI comparison..."} (${Math.round(job.progress * 100)}%)`;
+                });
                 statusEl.innerHTML = "";
                 resultsEl.innerHTML = `
                     <div class="ndvi-compare-images">
@@ -341,8 +471,11 @@ const MapModule = (() => {
         fieldsLayer.eachLayer((group) => {
             group.eachLayer((layer) => {
                 if (layer.fieldId === fieldId) {
+                    const onMap = map.hasLayer(fieldsLayer);
                     map.fitBounds(layer.getBounds(), { padding: [50, 50] });
-                    layer.openPopup();
+                    // Polygons are only added back to the map after zooming past the cluster zoom
+                    if (onMap) layer.openPopup();
+                    else map.once("moveend", () => layer.openPopup());
                 }
             });
         });
@@ -354,6 +487,9 @@ const MapModule = (() => {
         getDrawnItems,
         getFieldsLayer,
         clearFields,
+        refreshClusters,
+        toggleImageryLayer,
+        clearImageryLayer,
         addFieldToMap,
         focusField,
     };
@@ -0,0 +1,134 @@
+"""
+Benchmark of the active field queries while soft-deleted fields accumulate,
+with the deleted fields kept in `fields` and with them archived.
+
+Recreates the field tables in a scratch PostGIS database, inserts `--active` active
+fields and then `--steps` times `--step` deleted fields. After every step the first page
+of `GET /fields/` (count and rows) and its validators query are timed.
+
+Usage:
+    python -m scripts.benchmark_field_archive --database fields_benchmark
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import cast
+
+from sqlalchemy import Table, text
+
+from src.config.base import settings
+from src.database.common.dependencies import BaseSQL
+from src.database.postgres.crud import field as crud_field
+from src.database.postgres.handler import PostgreSQLHandler as DatabaseHandler
+from src.models.field import Field, FieldArchive
+
+INSERT_FIELDS = text(
+    """
+    INSERT INTO fields (id, boundary, deletion_date)
+    SELECT gen_random_uuid(), ST_MakeEnvelope(x, y, x + 0.001, y + 0.001, 4326), :deleted
+    FROM (
+        SELECT random() * 360 - 180 AS x, random() * 170 - 85 AS y
+        FROM generate_series(1, :count)
+    ) AS points
+    """
+)
+
+
+async def _reset(db_handler: DatabaseHandler, active: int) -> None:
+    tables = [cast(Table, Field.__table__), cast(Table, FieldArchive.__table__)]
+    async with db_handler.engine.begin() as connection:
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
+        await connection.run_sync(BaseSQL.metadata.drop_all, tables=tables)
+        await connection.run_sync(BaseSQL.metadata.create_all, tables=tables)
+        await connection.execute(text("SELECT setseed(0.42)"))
+        await connection.execute(INSERT_FIELDS, {"deleted": None, "count": active})
+
+
+async def _vacuum(db_handler: DatabaseHandler) -> None:
+    async with db_handler.engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        await connection.execute(text("VACUUM ANALYZE fields"))
+        await connection.execute(text("VACUUM ANALYZE fields_archive"))
+
+
+async def _time_active_queries(
+    db_handler: DatabaseHandler, repeat: int
+) -> tuple[float, float]:
+    """Median milliseconds of the first active page and of its validators."""
+    page_times, validator_times = [], []
+    async with db_handler.session_factory() as db:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            await crud_field.get_fields(db=db, limit=50, offset=0)
+            page_times.append((time.perf_counter() - started) * 1000)
+
+            started = time.perf_counter()
+            await crud_field.get_fields_validators(db=db)
+            validator_times.append((time.perf_counter() - started) * 1000)
+
+    return statistics.median(page_times), statistics.median(validator_times)
+
+
+async def _run(db_handler: DatabaseHandler, args, archive: bool) -> list[tuple]:
+    await _reset(db_handler, args.active)
+    deleted_at = datetime.now() - timedelta(days=settings.field_archive_after_days + 1)
+    rows = []
+
+    for step in range(1, args.steps + 1):
+        async with db_handler.engine.begin() as connection:
+            await connection.execute(
+                INSERT_FIELDS, {"deleted": deleted_at, "count": args.step}
+            )
+        if archive:
+            async with db_handler.session_factory() as db:
+                while await crud_field.archive_deleted_fields(
+                    deleted_before=datetime.now(), limit=10000, db=db
+                ):
+                    pass
+        await _vacuum(db_handler)
+
+        rows.append(
+            (step * args.step, *await _time_active_queries(db_handler, args.repeat))
+        )
+
+    return rows
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--database", required=True, help="Scratch database, recreated")
+    parser.add_argument("--active", type=int, default=10000)
+    parser.add_argument("--step", type=int, default=50000)
+    parser.add_argument("--steps", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.database == settings.postgres_database:
+        parser.error("refusing to recreate the tables of the application database")
+
+    db_handler = DatabaseHandler(database=args.database)
+    try:
+        kept = await _run(db_handler, args, archive=False)
+        archived = await _run(db_handler, args, archive=True)
+    finally:
+        await db_handler.engine.dispose()
+
+    print(f"{args.active} active fields, median of {args.repeat} runs in ms")
+    print(
+        f"{'deleted':>10} | {'page kept':>10} {'validators kept':>16} | "
+        f"{'page archived':>14} {'validators archived':>20}"
+    )
+    for (deleted, page, validators), (_, page_archived, validators_archived) in zip(
+        kept, archived
+    ):
+        print(
+            f"{deleted:>10} | {page:>10.2f} {validators:>16.2f} | "
+            f"{page_archived:>14.2f} {validators_archived:>20.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
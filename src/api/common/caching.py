@@ -0,0 +1,60 @@
+from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+
+def is_not_modified(
+    request: Request, etag: str, modified: Optional[float] = None
+) -> bool:
+    """
+    Evaluate the conditional GET headers of a request. `If-None-Match` takes precedence
+    over `If-Modified-Since` and uses weak comparison, as required by RFC 9110
+    (compressed responses carry the weak form of the ETag). Without `modified`
+    only `If-None-Match` is evaluated.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag.removeprefix("W/") in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None and modified is not None:
+        try:
+            return int(modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+
+    return False
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    etag: str,
+    modified: Optional[datetime | float] = None,
+    cache_control: str = "no-cache",
+) -> Optional[Response]:
+    """
+    Set the cache validators on `response` and return an empty 304 response
+    if the client's copy is still current, else None.
+
+    `Last-Modified` is only sent when `modified` is given. Leave it out when the time
+    can go backwards, e.g. the latest update of a list that can lose its newest item.
+
+    The default `no-cache` lets clients store responses but revalidate them on every use,
+    which only costs a 304 while the resource is unchanged.
+    """
+    if isinstance(modified, datetime):
+        modified = modified.timestamp()
+
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if modified is not None:
+        headers["Last-Modified"] = formatdate(modified, usegmt=True)
+
+    if is_not_modified(request, etag, modified):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,97 @@
+import gzip
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Already compressed, or streamed and must not be buffered (Server-Sent Events)
+SKIPPED_CONTENT_TYPES = ("image/", "text/event-stream", "application/zip")
+
+
+def _accepted_encoding(accept_encoding: str) -> str | None:
+    encodings = {
+        part.split(";")[0].strip().lower()
+        for part in accept_encoding.split(",")
+        if not part.strip().endswith(";q=0")
+    }
+    if "br" in encodings:
+        return "br"
+    if "gzip" in encodings:
+        return "gzip"
+    return None
+
+
+class CompressionMiddleware:
+    """
+    Compress single-body responses of at least `minimum_size` bytes with brotli,
+    or gzip for clients that do not accept brotli. Streamed responses, already
+    compressed media and responses with a Content-Encoding are passed through.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1000,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = _accepted_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message = {}
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                start_message = message
+                passthrough = "content-encoding" in headers or headers.get(
+                    "content-type", ""
+                ).startswith(SKIPPED_CONTENT_TYPES)
+                if passthrough:
+                    await send(message)
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < self.minimum_size:
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            if encoding == "br":
+                body = brotli.compress(body, quality=self.brotli_quality)
+            else:
+                body = gzip.compress(body, compresslevel=self.gzip_level)
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            headers.add_vary_header("Accept-Encoding")
+            # The compressed bytes differ from the identity representation,
+            # so a strong validator becomes a weak one
+            if headers.get("etag", "").startswith('"'):
+                headers["ETag"] = f'W/{headers["etag"]}'
+
+            await send(start_message)
+            await send({**message, "body": body})
+
+        await self.app(scope, receive, send_compressed)
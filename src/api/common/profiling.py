@@ -0,0 +1,89 @@
+import hmac
+import random
+import threading
+from typing import Optional
+
+from fastapi.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utils import profiling
+
+PROFILE_HEADER = "x-profile"
+
+
+def is_authorized(value: Optional[str], token: Optional[str]) -> bool:
+    """Whether an `X-Profile` header value equals the token, compared in constant time."""
+    if value is None or not token:
+        return False
+    return hmac.compare_digest(value.encode(), token.encode())
+
+
+class ProfilingMiddleware:
+    """
+    Profile requests with a sampling profiler: those with an authorized `X-Profile`
+    header and a `sample_rate` share of all requests. Profiles are stored in speedscope
+    format and their name is returned in the `X-Profile-Id` response header.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        directory: str,
+        token: str,
+        sample_rate: float = 0.0,
+        interval: float = 0.005,
+        max_files: int = 100,
+        max_concurrent: int = 2,
+    ) -> None:
+        self.app = app
+        self.directory = directory
+        self.token = token
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.max_files = max_files
+        # Every profiled request samples in its own thread
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._wanted(scope):
+            await self.app(scope, receive, send)
+            return
+
+        if not self._slots.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+
+        name = profiling.new_profile_name(scope["method"])
+        sampler = profiling.Sampler(self.interval)
+
+        async def send_profiled(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Profile-Id", name)
+            await send(message)
+
+        try:
+            sampler.start()
+            try:
+                await self.app(scope, receive, send_profiled)
+            finally:
+                sampler.stop()
+
+            route = scope.get("route")
+            title = f'{scope["method"]} {getattr(route, "path", scope["path"])}'
+            await run_in_threadpool(
+                profiling.save_profile,
+                sampler,
+                name,
+                title,
+                self.directory,
+                self.max_files,
+            )
+        finally:
+            self._slots.release()
+
+    def _wanted(self, scope: Scope) -> bool:
+        value = Headers(scope=scope).get(PROFILE_HEADER)
+        if value is not None:
+            return is_authorized(value, self.token)
+        return self.sample_rate > 0 and random.random() < self.sample_rate
@@ -0,0 +1,50 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utils import instrumentation
+
+
+class TimingMiddleware:
+    """
+    Record the duration of every request per route and, with `server_timing`, report
+    the time spent per upstream (PostgreSQL, GEE, ...) in a `Server-Timing` header.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool = True) -> None:
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = instrumentation.RequestTimings()
+        token = instrumentation.start_request(timings)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_timed(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.server_timing:
+                    MutableHeaders(scope=message).append(
+                        "Server-Timing",
+                        timings.server_timing(time.perf_counter() - started),
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_timed)
+        finally:
+            instrumentation.end_request(token)
+            # The route template, not the path, keeps the label values bounded
+            route = scope.get("route")
+            instrumentation.REQUEST_DURATION.labels(
+                scope["method"],
+                getattr(route, "path", "other"),
+                str(status),
+            ).observe(time.perf_counter() - started)
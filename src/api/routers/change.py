@@ -0,0 +1,44 @@
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi_pagination import Params
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.schemas.change import FieldChangeScoreRead
+from src.common.dependencies import get_read_db
+from src.database.postgres.crud import change as crud_change
+from src.services.change_scan import run_change_scan, scan_lock
+
+router = APIRouter(prefix="/changes", tags=["changes"])
+
+
+@router.get("/", response_model=list[FieldChangeScoreRead])
+async def list_biggest_changes(
+    db: AsyncSession = Depends(get_read_db), params: Params = Depends()
+):
+    """
+    Retrieve the active fields with the biggest changes found by the last change scans.
+
+    ### Returns
+    - **list[FieldChangeScoreRead]**: NDVI and SAR VV deltas against the baseline period
+        and the combined score, biggest changes first.
+    """
+    return await crud_change.get_change_scores(
+        db=db, limit=params.size, offset=(params.page - 1) * params.size
+    )
+
+
+@router.post("/scan", status_code=202)
+async def trigger_change_scan(background_tasks: BackgroundTasks):
+    """
+    Start a change scan over all active fields in the background.
+    The scan is skipped if another worker is already scanning.
+
+    ### Raises
+    - **HTTPException**:
+        - If a scan is already running in this worker (409).
+    """
+    # Early answer only, run_change_scan itself skips when a scan holds the locks
+    if scan_lock.locked():
+        raise HTTPException(status_code=409, detail="A change scan is already running")
+
+    background_tasks.add_task(run_change_scan)
+    return {"message": "Change scan has been started"}
@@ -1,19 +1,31 @@
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi_pagination import Params
 from fastapi_pagination.links import Page
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.schemas.field import FieldRead, FieldCreate
-from src.common.dependencies import get_db
+from src.api.common.caching import conditional_response
+from src.api.schemas.field import (
+    FieldBatchRequest,
+    FieldBatchResponse,
+    FieldClusterTile,
+    FieldCreate,
+    FieldRead,
+    FieldSpatialMutationRequest,
+    FieldSpatialMutationResponse,
+    FieldSummary,
+)
+from src.common.dependencies import get_db, get_read_db
+from src.config.base import settings
 from src.common.exceptions import (
     FieldNotFoundException,
     InvalidGeoJSONException,
     SelfIntersectionException,
 )
 from src.database.postgres.crud import field as crud_field
+from src.services import field_batch, field_cache, field_clusters, field_summary
 from src.api.common.decorators import validate_filter_by
 
 router = APIRouter(prefix="/fields", tags=["fields"])
@@ -22,7 +34,9 @@ router = APIRouter(prefix="/fields", tags=["fields"])
 @router.get("/", response_model=Page[FieldRead])
 @validate_filter_by
 async def list_fields(
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
     boundary: Optional[str] = None,
     filter_by: Optional[str] = None,
     params: Params = Depends(),
@@ -36,25 +50,121 @@ async def list_fields(
         which retrieves only active fields. Possible values: `deleted`, or `all`.
 
     ### Returns
-    - **Page[FieldRead]**: A paginated list of fields.
+    - **Page[FieldRead]**: A paginated list of fields. Supports conditional GETs (`ETag` / `304`).
 
     ### Raises
     - **HTTPException**:
+        - **400**: If the boundary filter is not a valid polygon.
         - **500**: If an unexpected error occurs during the database query.
     """
+    try:
+        total, last_updated = await crud_field.get_fields_validators(
+            db=db, boundary=boundary, filter_by=filter_by
+        )
+    except (InvalidGeoJSONException, SelfIntersectionException) as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    # ETag only: the latest update goes back in time when the newest field leaves the list
+    modified = last_updated.timestamp() if last_updated else 0.0
+    not_modified = conditional_response(
+        request, response, etag=f'"{total:x}-{int(modified * 1e6):x}"'
+    )
+    if not_modified:
+        return not_modified
+
     fields, total = await crud_field.get_fields(
         db=db,
         limit=params.size,
         offset=(params.page - 1) * params.size,
         boundary=boundary,
         filter_by=filter_by,
+        total=total,
     )
 
     return Page.create(items=fields, params=params, total=total)
 
 
+@router.get("/summary", response_model=FieldSummary)
+@validate_filter_by
+async def get_fields_summary(
+    db: AsyncSession = Depends(get_db),
+    bbox: Optional[str] = None,
+    boundary: Optional[str] = None,
+    filter_by: Optional[str] = None,
+):
+    """
+    Retrieve portfolio totals of the fields, computed server-side by one aggregate query.
+
+    ### Arguments
+    - **bbox** (`Optional[str]`): `min_lon,min_lat,max_lon,max_lat`, fields whose bounding box
+        overlaps it. Defaults to `None`.
+    - **boundary** (`Optional[str]`): Filter fields by GeoJSON boundary. Defaults to `None`.
+    - **filter_by** (`Optional[str]`): Same as for the field list. Defaults to `None`, active fields only.
+
+    ### Returns
+    - **FieldSummary**: Field count, counts per deletion state, total geodesic area
+        in square meters and the overall extent.
+
+    ### Raises
+    - **HTTPException**:
+        - **400**: If the bbox or the boundary is invalid.
+    """
+    bbox_values = None
+    if bbox is not None:
+        try:
+            min_lon, min_lat, max_lon, max_lat = (
+                float(value) for value in bbox.split(",")
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400, detail="bbox must be min_lon,min_lat,max_lon,max_lat"
+            ) from e
+        bbox_values = (min_lon, min_lat, max_lon, max_lat)
+
+    try:
+        return await field_summary.get_fields_summary(
+            db=db, boundary=boundary, filter_by=filter_by, bbox=bbox_values
+        )
+    except (InvalidGeoJSONException, SelfIntersectionException) as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+@router.get("/clusters/{z}/{x}/{y}", response_model=FieldClusterTile)
+async def get_field_clusters(
+    z: int,
+    x: int,
+    y: int,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Aggregate the active fields of an XYZ map tile into grid cell clusters, for low-zoom map views.
+
+    Each field is counted in the tile containing its centroid. The tile is split into
+    `field_cluster_grid_cells` x `field_cluster_grid_cells` cells and every non-empty cell
+    becomes one cluster. Results are cached per tile until the next field write.
+
+    ### Arguments
+    - **z** / **x** / **y** (`int`): The tile coordinates, z up to `field_cluster_max_zoom`.
+
+    ### Returns
+    - **FieldClusterTile**: Per cluster the field count, the mean centroid and the extent of its fields.
+
+    ### Raises
+    - **HTTPException**:
+        - If the tile coordinates are out of range (400).
+    """
+    if not 0 <= z <= settings.field_cluster_max_zoom or not (
+        0 <= x < 2**z and 0 <= y < 2**z
+    ):
+        raise HTTPException(status_code=400, detail="Tile coordinates out of range")
+
+    clusters = await field_clusters.get_tile_clusters(z, x, y, db=db)
+    return {"z": z, "x": x, "y": y, "clusters": clusters}
+
+
 @router.get("/{field_id}", response_model=FieldRead)
 async def get_field(
+    request: Request,
+    response: Response,
     field_id: UUID,
     db: AsyncSession = Depends(get_db),
     include_deleted: bool = False,
@@ -67,19 +177,28 @@ async def get_field(
     - **include_deleted** (`bool`): Whether to include soft-deleted fields in the result. Defaults to `False`.
 
     ### Returns
-    - **FieldRead**: The field data.
+    - **FieldRead**: The field data, cached per process until the field changes.
+      Supports conditional GETs (`ETag` / `304`).
 
     ### Raises
     - **HTTPException**:
         - If the field is not found (404).
     """
     try:
-        return await crud_field.get_field(
+        field = await field_cache.get_field(
             field_id=field_id, db=db, include_deleted=include_deleted
         )
     except FieldNotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
 
+    not_modified = conditional_response(
+        request,
+        response,
+        etag=f'"{field.id.hex}-{field.version}"',
+        modified=field.updated_at,
+    )
+    return not_modified or field
+
 
 @router.post("/", response_model=FieldRead)
 async def create_field(field: FieldCreate, db: AsyncSession = Depends(get_db)):
@@ -104,6 +223,80 @@ async def create_field(field: FieldCreate, db: AsyncSession = Depends(get_db)):
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
+@router.post("/batch", response_model=FieldBatchResponse)
+async def apply_field_batch(
+    request: FieldBatchRequest, db: AsyncSession = Depends(get_db)
+):
+    """
+    Create, update, soft-delete and restore many fields in one transaction.
+
+    Operations are applied with set-based statements: one multi-row insert for the creates,
+    one bulk UPDATE by primary key for the updates and one statement each for deletes and restores.
+
+    ### Arguments
+    - **operations** (`list`): Up to `field_batch_max_operations` operations, each one of
+        `{"op": "create", "field": {...}}`, `{"op": "update", "id": ..., "field": {...}}`,
+        `{"op": "delete", "id": ...}` or `{"op": "restore", "id": ...}`.
+    - **atomic** (`bool`): Apply nothing if any operation fails. Defaults to `False`,
+        which applies the valid operations.
+
+    ### Returns
+    - **FieldBatchResponse**: One result per operation, in order: `applied`, `failed` with the error,
+        or `skipped` (atomic batch with failures). Created fields get their new `id`.
+
+    ### Raises
+    - **HTTPException**:
+        - If too many operations are sent (400).
+    """
+    if len(request.operations) > settings.field_batch_max_operations:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.field_batch_max_operations} operations per request",
+        )
+
+    results = await field_batch.apply_field_batch(request=request, db=db)
+
+    return {
+        "applied": sum(result["status"] == "applied" for result in results),
+        "failed": sum(result["status"] == "failed" for result in results),
+        "results": results,
+    }
+
+
+@router.post("/batch/spatial", response_model=FieldSpatialMutationResponse)
+async def apply_spatial_field_mutation(
+    request: FieldSpatialMutationRequest, db: AsyncSession = Depends(get_db)
+):
+    """
+    Soft-delete or restore all fields within (or intersecting) a boundary in one statement.
+
+    ### Arguments
+    - **action** (`str`): `delete` or `restore`.
+    - **boundary** (`dict`): The GeoJSON polygon to select fields with.
+    - **predicate** (`str`): `within` (default) for fields entirely inside the boundary,
+        or `intersects`.
+
+    ### Returns
+    - **FieldSpatialMutationResponse**: The number and IDs of the changed fields.
+
+    ### Raises
+    - **HTTPException**:
+        - If the GeoJSON is invalid (400).
+        - If the geometry is self-intersecting and cannot be fixed (400).
+    """
+    try:
+        field_ids = await crud_field.set_deleted_by_boundary(
+            boundary=request.boundary,
+            deleted=request.action == "delete",
+            predicate=request.predicate,
+            db=db,
+        )
+    except (InvalidGeoJSONException, SelfIntersectionException) as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return FieldSpatialMutationResponse(affected=len(field_ids), field_ids=field_ids)
+
+
 @router.delete("/{field_id}")
 async def delete_field(field_id: UUID, db: AsyncSession = Depends(get_db)):
     """
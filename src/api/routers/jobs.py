@@ -0,0 +1,95 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.schemas.job import JobRead
+from src.api.schemas.ndvi_comparison import NdviComparisonRequest
+from src.api.schemas.sar import SarChangeRequest
+from src.common.dependencies import get_db
+from src.common.exceptions import JobQueueFullException
+from src.services import jobs
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+async def _submit(kind: str, params: dict, db: AsyncSession):
+    try:
+        return await jobs.submit_job(kind=kind, params=params, db=db)
+    except JobQueueFullException as e:
+        raise HTTPException(status_code=503, detail=str(e)) from e
+
+
+@router.post("/ndvi-comparison", response_model=JobRead, status_code=202)
+async def submit_ndvi_comparison(
+    request: NdviComparisonRequest, db: AsyncSession = Depends(get_db)
+):
+    """
+    Queue an NDVI comparison (see `POST /ndvi-comparison/`) and return immediately.
+
+    ### Arguments
+    - **request** (`NdviComparisonRequest`): The boundary and the before/after periods.
+
+    ### Returns
+    - **JobRead**: The queued job. An identical job that is running or recently
+        succeeded is returned instead of queueing a new one.
+
+    ### Raises
+    - **HTTPException**:
+        - If the job queue is full (503).
+    """
+    return await _submit("ndvi_comparison", request.model_dump(mode="json"), db)
+
+
+@router.post("/sar-change", response_model=JobRead, status_code=202)
+async def submit_sar_change(
+    sar_request: SarChangeRequest, db: AsyncSession = Depends(get_db)
+):
+    """
+    Queue a SAR change detection (see `POST /sar-change/`) and return immediately.
+    The result of the job is the updated field.
+
+    ### Raises
+    - **HTTPException**:
+        - If the job queue is full (503).
+    """
+    return await _submit("sar_change", sar_request.model_dump(mode="json"), db)
+
+
+@router.get("/{job_id}", response_model=JobRead)
+async def get_job(job_id: UUID, db: AsyncSession = Depends(get_db)):
+    """
+    Poll a job for its status, progress and result.
+
+    ### Raises
+    - **HTTPException**:
+        - If the job is not found (404).
+    """
+    state = await jobs.get_job_state(job_id, db)
+    if state is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} does not exist")
+    return state
+
+
+@router.get("/{job_id}/events", response_class=StreamingResponse)
+async def stream_job_events(job_id: UUID, db: AsyncSession = Depends(get_db)):
+    """
+    Subscribe to a job with Server-Sent Events.
+
+    ### Returns
+    - **text/event-stream**: `progress` events with the job state on every change,
+        then a final `result` or `error` event.
+
+    ### Raises
+    - **HTTPException**:
+        - If the job is not found (404).
+    """
+    if await jobs.get_job_state(job_id, db) is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} does not exist")
+
+    return StreamingResponse(
+        jobs.stream_job(job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
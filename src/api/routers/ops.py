@@ -0,0 +1,84 @@
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import FileResponse
+
+from src.api.common.profiling import is_authorized
+from src.config.base import settings
+from src.services import field_cache, map_tiles, weather_cache
+from src.services.gee_client import client as gee_client
+from src.utils import geometry, profiling
+
+router = APIRouter(prefix="/ops", tags=["ops"])
+
+
+@router.get("/metrics")
+async def get_metrics():
+    """
+    Operational metrics of the service.
+
+    ### Returns
+    - **field_cache**: Size, hits and misses of the field-by-ID cache.
+    - **gee**: GEE client calls, retries, failures, circuit breaker state and quota queue wait.
+    - **geometry_cache**: Size, hits and misses of the canonical boundary cache.
+    - **map_tile_templates**: Size, hits and misses of the map tile template cache.
+    - **weather_cache**: Memory/database hits, hit ratio and upstream Open-Meteo call rate.
+    """
+    return {
+        "field_cache": field_cache.get_cache_stats(),
+        "gee": gee_client.get_metrics(),
+        "geometry_cache": geometry.get_cache_stats(),
+        "map_tile_templates": map_tiles.templates.stats(),
+        "weather_cache": weather_cache.get_metrics(),
+    }
+
+
+def _check_profiling_access(x_profile: Optional[str]) -> None:
+    if not settings.profiling_enabled:
+        raise HTTPException(status_code=404, detail="Profiling is disabled")
+    if not is_authorized(x_profile, settings.profiling_token):
+        raise HTTPException(status_code=403, detail="Invalid profiling token")
+
+
+@router.get("/profiles")
+async def list_profiles(x_profile: Optional[str] = Header(default=None)):
+    """
+    List the stored request profiles, newest first.
+
+    ### Arguments
+    - **X-Profile** (`Optional[str]`, header): The profiling token.
+
+    ### Returns
+    - **list**: Name, size in bytes and creation time of each profile.
+
+    ### Raises
+    - **HTTPException**:
+        - If profiling is disabled (404).
+        - If the profiling token is missing or wrong (403).
+    """
+    _check_profiling_access(x_profile)
+    return profiling.list_profiles(settings.profiling_dir)
+
+
+@router.get("/profiles/{name}")
+async def get_profile(name: str, x_profile: Optional[str] = Header(default=None)):
+    """
+    Download a request profile, to be opened in https://www.speedscope.app.
+
+    ### Arguments
+    - **name** (`str`): The profile name, as in the `X-Profile-Id` response header.
+    - **X-Profile** (`Optional[str]`, header): The profiling token.
+
+    ### Returns
+    - **FileResponse**: The profile in speedscope JSON format.
+
+    ### Raises
+    - **HTTPException**:
+        - If profiling is disabled or the profile does not exist (404).
+        - If the profiling token is missing or wrong (403).
+    """
+    _check_profiling_access(x_profile)
+    path = profiling.get_profile_path(settings.profiling_dir, name)
+    if path is None:
+        raise HTTPException(status_code=404, detail=f"Profile {name} does not exist")
+    return FileResponse(path, media_type="application/json", filename=path.name)
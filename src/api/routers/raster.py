@@ -0,0 +1,286 @@
+import re
+from typing import Literal, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.common.caching import conditional_response
+from src.api.schemas.raster import RasterCacheRequest, RasterStackRead
+from src.common.dependencies import get_db
+from src.common.exceptions import FieldNotFoundException, RasterNotCachedException
+from src.database.postgres.crud import field as crud_field
+from src.services import raster_cache
+from src.services.google_earth import (
+    NDVI_DIFF_VIS,
+    NDVI_VIS,
+    RGB_VIS,
+    SAR_DIFF_VIS,
+    SAR_VV_VIS,
+)
+from src.utils import rendering
+from src.utils.conversion import convert_wkb_to_geojson
+
+router = APIRouter(prefix="/fields", tags=["rasters"])
+
+HEX_COLOR = re.compile(r"^[0-9a-fA-F]{6}$")
+
+
+def _parse_palette(palette: Optional[str], default: list[str]) -> list[str]:
+    if palette is None:
+        return default
+
+    colors = [color.strip().lstrip("#") for color in palette.split(",")]
+    if len(colors) < 2 or not all(HEX_COLOR.match(color) for color in colors):
+        raise HTTPException(
+            status_code=400,
+            detail="palette must be a comma-separated list of at least two hex colors",
+        )
+    return colors
+
+
+def _load_stack(field_id: UUID, key: str):
+    try:
+        return raster_cache.load_band_stack(field_id=field_id, key=key)
+    except RasterNotCachedException as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+
+def _stack_version(field_id: UUID, key: str) -> tuple[str, float]:
+    try:
+        return raster_cache.get_stack_version(field_id=field_id, key=key)
+    except RasterNotCachedException as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+
+def _png_response(content: bytes, response: Response) -> Response:
+    # A returned response does not inherit the validators set on the injected one
+    return Response(
+        content=content, media_type="image/png", headers=dict(response.headers)
+    )
+
+
+def _render_product(
+    stack,
+    metadata: dict,
+    product: str,
+    vis_min: Optional[float],
+    vis_max: Optional[float],
+    palette: list[str],
+) -> bytes:
+    if product == "rgb":
+        rgba = rendering.stretch_rgb(
+            raster_cache.get_band(stack, metadata, "B4"),
+            raster_cache.get_band(stack, metadata, "B3"),
+            raster_cache.get_band(stack, metadata, "B2"),
+            vmin=RGB_VIS["min"] if vis_min is None else vis_min,
+            vmax=RGB_VIS["max"] if vis_max is None else vis_max,
+        )
+        return rendering.encode_png(rgba)
+
+    if product == "ndvi":
+        values = rendering.normalized_difference(
+            raster_cache.get_band(stack, metadata, "B8"),
+            raster_cache.get_band(stack, metadata, "B4"),
+        )
+        vis = NDVI_VIS
+    else:
+        values = raster_cache.get_band(stack, metadata, "VV")
+        vis = SAR_VV_VIS
+
+    rgba = rendering.apply_palette(
+        values,
+        vmin=vis["min"] if vis_min is None else vis_min,
+        vmax=vis["max"] if vis_max is None else vis_max,
+        palette=palette,
+    )
+    return rendering.encode_png(rgba)
+
+
+def _render_difference(
+    before,
+    before_metadata: dict,
+    after,
+    after_metadata: dict,
+    vis_min: Optional[float],
+    vis_max: Optional[float],
+    palette: list[str],
+) -> bytes:
+    if before_metadata["sensor"] == "s2":
+        values = rendering.normalized_difference(
+            raster_cache.get_band(after, after_metadata, "B8"),
+            raster_cache.get_band(after, after_metadata, "B4"),
+        ) - rendering.normalized_difference(
+            raster_cache.get_band(before, before_metadata, "B8"),
+            raster_cache.get_band(before, before_metadata, "B4"),
+        )
+        vis = NDVI_DIFF_VIS
+    else:
+        values = raster_cache.get_band(
+            after, after_metadata, "VV"
+        ) - raster_cache.get_band(before, before_metadata, "VV")
+        vis = SAR_DIFF_VIS
+
+    rgba = rendering.apply_palette(
+        values,
+        vmin=vis["min"] if vis_min is None else vis_min,
+        vmax=vis["max"] if vis_max is None else vis_max,
+        palette=palette,
+    )
+    return rendering.encode_png(rgba)
+
+
+@router.post("/{field_id}/rasters/", response_model=RasterStackRead)
+async def cache_raster(
+    field_id: UUID, request: RasterCacheRequest, db: AsyncSession = Depends(get_db)
+):
+    """
+    Download a field's band stack from GEE into the local raster cache.
+
+    ### Arguments
+    - **field_id** (`UUID`): The UUID of the field.
+    - **request** (`RasterCacheRequest`): `s2` (B2/B3/B4/B8) or `s1` (VV), with an optional date range
+        for a median composite. Without dates the newest clear Sentinel-2 scene is used.
+
+    ### Returns
+    - **RasterStackRead**: The cached stack metadata. Its `key` is used by the render endpoints.
+
+    ### Raises
+    - **HTTPException**:
+        - If the field is not found (404).
+    """
+    try:
+        field = await crud_field.get_field(field_id=field_id, db=db)
+    except FieldNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+    return await run_in_threadpool(
+        raster_cache.cache_band_stack,
+        field_id=field_id,
+        boundary=convert_wkb_to_geojson(field.boundary),
+        sensor=request.sensor,
+        date_start=request.date_start,
+        date_end=request.date_end,
+    )
+
+
+@router.get("/{field_id}/rasters/", response_model=list[RasterStackRead])
+async def list_rasters(field_id: UUID):
+    """
+    List the band stacks cached locally for a field.
+    """
+    return raster_cache.list_band_stacks(field_id=field_id)
+
+
+@router.get("/{field_id}/rasters/{key}/render", response_class=Response)
+async def render_raster(
+    request: Request,
+    response: Response,
+    field_id: UUID,
+    key: str,
+    product: Literal["rgb", "ndvi", "vv"] = "ndvi",
+    vis_min: Optional[float] = Query(None, alias="min"),
+    vis_max: Optional[float] = Query(None, alias="max"),
+    palette: Optional[str] = None,
+):
+    """
+    Render a cached band stack to PNG locally, without a GEE round trip.
+
+    ### Arguments
+    - **field_id** (`UUID`): The UUID of the field.
+    - **key** (`str`): The cached stack key.
+    - **product** (`str`): `rgb` or `ndvi` for Sentinel-2 stacks, `vv` for Sentinel-1 stacks.
+    - **min** / **max** (`Optional[float]`): Stretch range. Defaults to the GEE thumbnail range of the product.
+    - **palette** (`Optional[str]`): Comma-separated hex colors (`ndvi` and `vv` only).
+
+    ### Returns
+    - **image/png**: The rendered image. Supports conditional GETs, a 304 skips rendering.
+
+    ### Raises
+    - **HTTPException**:
+        - If the stack is not cached (404).
+        - If the product does not match the stack's bands or the palette is invalid (400).
+    """
+    version, modified = _stack_version(field_id, key)
+    not_modified = conditional_response(
+        request, response, etag=f'"{version}"', modified=modified
+    )
+    if not_modified:
+        return not_modified
+
+    stack, metadata = _load_stack(field_id, key)
+
+    if product == "vv" and metadata["sensor"] != "s1":
+        raise HTTPException(status_code=400, detail="vv requires a Sentinel-1 stack")
+    if product != "vv" and metadata["sensor"] != "s2":
+        raise HTTPException(
+            status_code=400, detail=f"{product} requires a Sentinel-2 stack"
+        )
+
+    # Rendering and PNG encoding are CPU-bound, keep them off the event loop
+    vis = SAR_VV_VIS if product == "vv" else NDVI_VIS
+    colors = [] if product == "rgb" else _parse_palette(palette, vis["palette"])
+    content = await run_in_threadpool(
+        _render_product, stack, metadata, product, vis_min, vis_max, colors
+    )
+    return _png_response(content, response)
+
+
+@router.get(
+    "/{field_id}/rasters/{before_key}/diff/{after_key}", response_class=Response
+)
+async def render_raster_difference(
+    request: Request,
+    response: Response,
+    field_id: UUID,
+    before_key: str,
+    after_key: str,
+    vis_min: Optional[float] = Query(None, alias="min"),
+    vis_max: Optional[float] = Query(None, alias="max"),
+    palette: Optional[str] = None,
+):
+    """
+    Render the difference between two cached stacks of the same sensor to PNG locally.
+    NDVI difference for Sentinel-2 stacks, VV backscatter difference for Sentinel-1 stacks.
+
+    ### Raises
+    - **HTTPException**:
+        - If a stack is not cached (404).
+        - If the stacks have different sensors or shapes, or the palette is invalid (400).
+    """
+    before_version, before_modified = _stack_version(field_id, before_key)
+    after_version, after_modified = _stack_version(field_id, after_key)
+    not_modified = conditional_response(
+        request,
+        response,
+        etag=f'"{before_version}-{after_version}"',
+        modified=max(before_modified, after_modified),
+    )
+    if not_modified:
+        return not_modified
+
+    before, before_metadata = _load_stack(field_id, before_key)
+    after, after_metadata = _load_stack(field_id, after_key)
+
+    if before_metadata["sensor"] != after_metadata["sensor"]:
+        raise HTTPException(
+            status_code=400, detail="Both stacks must come from the same sensor"
+        )
+    if before.shape != after.shape:
+        raise HTTPException(
+            status_code=400, detail="Both stacks must have the same dimensions"
+        )
+
+    vis = NDVI_DIFF_VIS if before_metadata["sensor"] == "s2" else SAR_DIFF_VIS
+    content = await run_in_threadpool(
+        _render_difference,
+        before,
+        before_metadata,
+        after,
+        after_metadata,
+        vis_min,
+        vis_max,
+        _parse_palette(palette, vis["palette"]),
+    )
+    return _png_response(content, response)
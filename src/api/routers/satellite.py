@@ -1,14 +1,16 @@
-from datetime import timedelta, datetime
+from datetime import datetime
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.services import comparison, field_matching
 from src.services.google_earth import (
+    THUMBNAIL_URL_TTL,
     get_latest_sentinel_image,
     get_ndvi_image,
-    get_ndvi_comparison,
-    get_sar_change_detection,
 )
+from src.services.scene_catalog import resolve_latest_scene_id
 from src.api.schemas.satellite import SatelliteCreate
 from src.api.schemas.sar import SarChangeRequest
 from src.api.schemas.ndvi_comparison import (
@@ -17,11 +19,21 @@ from src.api.schemas.ndvi_comparison import (
 )
 from src.api.schemas.field import FieldRead, FieldCreate, FieldUpdate
 from src.common.dependencies import get_db
+from src.common.exceptions import InvalidGeoJSONException, SelfIntersectionException
 from src.database.postgres.crud import field as crud_field
+from src.utils.conversion import convert_wkb_to_geojson
+from src.utils.geometry import CanonicalGeometry, canonicalize
 
 router = APIRouter(tags=["satellite"])
 
 
+def _canonicalize(boundary: dict) -> CanonicalGeometry:
+    try:
+        return canonicalize(boundary)
+    except (InvalidGeoJSONException, SelfIntersectionException) as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
 @router.post("/satellite-image/", response_model=FieldRead)
 async def get_satellite_image(
     satellite: SatelliteCreate, db: AsyncSession = Depends(get_db)
@@ -30,11 +42,13 @@ async def get_satellite_image(
     - If field exists and has an image, check if it is expired.
     - If expired or missing, fetch a new image, and update the field.
     - If no field exists, create one, fetch an image, and store it.
+    - A field with a near-identical boundary counts as existing.
     """
+    # Validated once, the CRUD calls below reuse it
+    geometry = _canonicalize(satellite.boundary)
+
     # Check if boundary exists in the database
-    existing_field = await crud_field.get_field_by_boundary(
-        boundary=satellite.boundary, db=db
-    )
+    existing_field = await field_matching.get_matching_field(geometry=geometry, db=db)
 
     current_time = datetime.now()
 
@@ -43,14 +57,19 @@ async def get_satellite_image(
         if existing_field.image_url and existing_field.expiration_time > current_time:
             return existing_field
 
-        # If field exists but has no image or expired, fetch from GEE and update it
-        image_url = get_latest_sentinel_image(boundary=satellite.boundary)
+        # If field exists but has no image or expired, fetch from GEE and update it.
+        # A near-identical match keeps its own boundary, the image must cover it
+        boundary = convert_wkb_to_geojson(existing_field.boundary)
+        scene_id = await resolve_latest_scene_id(boundary=boundary, db=db)
+        image_url = await run_in_threadpool(
+            get_latest_sentinel_image, boundary=boundary, scene_id=scene_id
+        )
 
         updated_field = await crud_field.update_field(
             field_id=existing_field.id,  # type: ignore[arg-type]
             field=FieldUpdate(
                 image_url=image_url,
-                expiration_time=current_time + timedelta(minutes=50),
+                expiration_time=current_time + THUMBNAIL_URL_TTL,
             ),
             db=db,
         )
@@ -58,15 +77,19 @@ async def get_satellite_image(
         return updated_field
 
     # If no field found, fetch image and create it
-    image_url = get_latest_sentinel_image(boundary=satellite.boundary)
+    scene_id = await resolve_latest_scene_id(boundary=satellite.boundary, db=db)
+    image_url = await run_in_threadpool(
+        get_latest_sentinel_image, boundary=satellite.boundary, scene_id=scene_id
+    )
 
     new_field = await crud_field.create_field(
         FieldCreate(
             boundary=satellite.boundary,
             image_url=image_url,
-            expiration_time=current_time + timedelta(minutes=50),
+            expiration_time=current_time + THUMBNAIL_URL_TTL,
         ),
         db=db,
+        geometry=geometry,
     )
 
     return new_field
@@ -80,9 +103,8 @@ async def get_ndvi(satellite: SatelliteCreate, db: AsyncSession = Depends(get_db
     - If expired or missing, calculate NDVI from Sentinel-2 and update the field.
     - If no field exists, create one with the NDVI image.
     """
-    existing_field = await crud_field.get_field_by_boundary(
-        boundary=satellite.boundary, db=db
-    )
+    geometry = _canonicalize(satellite.boundary)
+    existing_field = await field_matching.get_matching_field(geometry=geometry, db=db)
 
     current_time = datetime.now()
 
@@ -90,47 +112,52 @@ async def get_ndvi(satellite: SatelliteCreate, db: AsyncSession = Depends(get_db
         if existing_field.ndvi_url and existing_field.expiration_time > current_time:
             return existing_field
 
-        ndvi_url = get_ndvi_image(boundary=satellite.boundary)
+        boundary = convert_wkb_to_geojson(existing_field.boundary)
+        scene_id = await resolve_latest_scene_id(boundary=boundary, db=db)
+        ndvi_url = await run_in_threadpool(
+            get_ndvi_image, boundary=boundary, scene_id=scene_id
+        )
 
         updated_field = await crud_field.update_field(
             field_id=existing_field.id,  # type: ignore[arg-type]
             field=FieldUpdate(
                 ndvi_url=ndvi_url,
-                expiration_time=current_time + timedelta(minutes=50),
+                expiration_time=current_time + THUMBNAIL_URL_TTL,
             ),
             db=db,
         )
 
         return updated_field
 
-    ndvi_url = get_ndvi_image(boundary=satellite.boundary)
+    scene_id = await resolve_latest_scene_id(boundary=satellite.boundary, db=db)
+    ndvi_url = await run_in_threadpool(
+        get_ndvi_image, boundary=satellite.boundary, scene_id=scene_id
+    )
 
     new_field = await crud_field.create_field(
         FieldCreate(
             boundary=satellite.boundary,
             ndvi_url=ndvi_url,
-            expiration_time=current_time + timedelta(minutes=50),
+            expiration_time=current_time + THUMBNAIL_URL_TTL,
         ),
         db=db,
+        geometry=geometry,
     )
 
     return new_field
 
 
 @router.post("/ndvi-comparison/", response_model=NdviComparisonResponse)
-async def compare_ndvi(request: NdviComparisonRequest):
+async def compare_ndvi(
+    request: NdviComparisonRequest, db: AsyncSession = Depends(get_db)
+):
     """
     Compare NDVI between two time periods for a given boundary.
     Returns three thumbnail URLs: NDVI before, NDVI after, and the difference map.
     Green in the diff = vegetation recovery, red = vegetation loss.
+    For long date ranges prefer `POST /jobs/ndvi-comparison`.
     """
-    result = get_ndvi_comparison(
-        boundary=request.boundary,
-        date_before_start=request.date_before_start,
-        date_before_end=request.date_before_end,
-        date_after_start=request.date_after_start,
-        date_after_end=request.date_after_end,
-    )
+    result = await comparison.compare_ndvi(request=request, db=db)
     return NdviComparisonResponse(**result)
 
 
@@ -142,39 +169,6 @@ async def get_sar_change(
     Compute SAR (Sentinel-1) change detection between two date ranges.
     Compares VV backscatter to detect physical changes on the ground
     (destruction, land use change, etc.).
+    For long date ranges prefer `POST /jobs/sar-change`.
     """
-    existing_field = await crud_field.get_field_by_boundary(
-        boundary=sar_request.boundary, db=db
-    )
-
-    sar_url = get_sar_change_detection(
-        boundary=sar_request.boundary,
-        date_before_start=sar_request.date_before_start,
-        date_before_end=sar_request.date_before_end,
-        date_after_start=sar_request.date_after_start,
-        date_after_end=sar_request.date_after_end,
-    )
-
-    current_time = datetime.now()
-
-    if existing_field:
-        updated_field = await crud_field.update_field(
-            field_id=existing_field.id,  # type: ignore[arg-type]
-            field=FieldUpdate(
-                sar_change_url=sar_url,
-                expiration_time=current_time + timedelta(minutes=50),
-            ),
-            db=db,
-        )
-        return updated_field
-
-    new_field = await crud_field.create_field(
-        FieldCreate(
-            boundary=sar_request.boundary,
-            sar_change_url=sar_url,
-            expiration_time=current_time + timedelta(minutes=50),
-        ),
-        db=db,
-    )
-
-    return new_field
+    return await comparison.detect_sar_change(request=sar_request, db=db)
@@ -0,0 +1,92 @@
+import json
+from datetime import date, datetime, time
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi_pagination import Params
+from fastapi_pagination.links import Page
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.schemas.scene import (
+    SceneCollection,
+    SceneRead,
+    SceneSyncRequest,
+    SceneSyncResponse,
+    SceneSyncResult,
+)
+from src.common.dependencies import get_db, get_read_db
+from src.common.exceptions import InvalidGeoJSONException, SelfIntersectionException
+from src.database.postgres.crud import scene as crud_scene
+from src.services.scene_catalog import sync_scene_catalog
+
+router = APIRouter(prefix="/scenes", tags=["scenes"])
+
+
+@router.get("/", response_model=Page[SceneRead])
+async def list_scenes(
+    db: AsyncSession = Depends(get_read_db),
+    collection: SceneCollection = "COPERNICUS/S2_HARMONIZED",
+    boundary: Optional[str] = None,
+    date_start: Optional[date] = None,
+    date_end: Optional[date] = None,
+    max_cloud: Optional[float] = None,
+    params: Params = Depends(),
+):
+    """
+    Retrieve a paginated list of catalogued scenes, newest first.
+
+    ### Arguments
+    - **collection** (`str`): The image collection. Defaults to `COPERNICUS/S2_HARMONIZED`.
+    - **boundary** (`Optional[str]`): Only scenes whose footprint intersects this GeoJSON boundary.
+    - **date_start** (`Optional[date]`): Only scenes acquired on or after this date.
+    - **date_end** (`Optional[date]`): Only scenes acquired before this date.
+    - **max_cloud** (`Optional[float]`): Only scenes with `CLOUDY_PIXEL_PERCENTAGE` below this value.
+
+    ### Returns
+    - **Page[SceneRead]**: A paginated list of scenes.
+
+    ### Raises
+    - **HTTPException**:
+        - If the boundary is not a valid GeoJSON polygon (400).
+    """
+    try:
+        scenes, total = await crud_scene.get_scenes(
+            db=db,
+            collection=collection,
+            boundary=json.loads(boundary) if boundary else None,
+            start=datetime.combine(date_start, time()) if date_start else None,
+            end=datetime.combine(date_end, time()) if date_end else None,
+            max_cloud=max_cloud,
+            limit=params.size,
+            offset=(params.page - 1) * params.size,
+        )
+    except (
+        ValueError,
+        InvalidGeoJSONException,
+        SelfIntersectionException,
+    ) as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return Page.create(items=scenes, params=params, total=total)
+
+
+@router.post("/sync", response_model=SceneSyncResponse)
+async def sync_scenes(request: SceneSyncRequest, db: AsyncSession = Depends(get_db)):
+    """
+    Incrementally sync the local scene catalog for a boundary.
+    Only scenes newer than the last sync covering the boundary are fetched from GEE.
+    Once synced, the satellite endpoints pick exact scene IDs from the catalog
+    instead of filtering the collections on every call.
+    """
+    results = []
+    for collection in request.collections:
+        added, synced_at = await sync_scene_catalog(
+            boundary=request.boundary, collection=collection, db=db
+        )
+        results.append(
+            SceneSyncResult(
+                collection=collection, scenes_added=added, synced_at=synced_at
+            )
+        )
+
+    return SceneSyncResponse(results=results)
@@ -0,0 +1,108 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.schemas.statistics import (
+    NdviStatisticsRequest,
+    NdviStatisticsResponse,
+    WeatherStatisticsRequest,
+    WeatherStatisticsResponse,
+)
+from src.common.dependencies import get_db
+from src.config.base import settings
+from src.services import statistics as statistics_service
+from src.services.google_earth import NDVI_HISTOGRAM_BINS, NDVI_HISTOGRAM_RANGE
+from src.services.weather_history import get_weather_indices
+
+router = APIRouter(prefix="/statistics", tags=["statistics"])
+
+
+@router.post("/ndvi/", response_model=NdviStatisticsResponse)
+async def get_ndvi_statistics(
+    request: NdviStatisticsRequest, db: AsyncSession = Depends(get_db)
+):
+    """
+    Compute NDVI zonal statistics for many fields in bulk.
+
+    ### Arguments
+    - **field_ids** (`list[UUID]`): The fields to score.
+    - **date_start** / **date_end** (`date`): The date range of the median NDVI composite.
+    - **refresh** (`bool`): Recompute statistics already stored for the date range. Defaults to `False`.
+
+    ### Returns
+    - **NdviStatisticsResponse**: Mean, median, p10/p25/p75/p90, pixel count and histogram per field,
+        as parallel columns. Fields without imagery in the date range have null statistics,
+        fields that could not be computed on GEE also have an `error`,
+        fields that do not exist or are deleted are listed in `not_found`.
+    """
+    columns, not_found = await statistics_service.get_ndvi_statistics(
+        field_ids=request.field_ids,
+        date_start=request.date_start,
+        date_end=request.date_end,
+        refresh=request.refresh,
+        db=db,
+    )
+
+    return NdviStatisticsResponse(
+        date_start=request.date_start,
+        date_end=request.date_end,
+        histogram_range=NDVI_HISTOGRAM_RANGE,
+        histogram_bins=NDVI_HISTOGRAM_BINS,
+        not_found=not_found,
+        **columns,
+    )
+
+
+@router.post("/weather/", response_model=WeatherStatisticsResponse)
+async def get_weather_statistics(
+    request: WeatherStatisticsRequest, db: AsyncSession = Depends(get_db)
+):
+    """
+    Compute season agro-weather indices for many fields in bulk from the daily weather history.
+
+    ### Arguments
+    - **field_ids** (`list[UUID]`): The fields to score.
+    - **date_start** / **date_end** (`date`): The season, both inclusive.
+    - **base_temperature** (`float`): Base temperature of growing degree days.
+        Defaults to `gdd_base_temperature`.
+
+    ### Returns
+    - **WeatherStatisticsResponse**: Days, growing degree days, precipitation sum and frost days
+        per field, as parallel columns. Fields that do not exist or are deleted are listed in `not_found`.
+
+    ### Raises
+    - **HTTPException**:
+        - If the weather service fails (502).
+    """
+    base_temperature = request.base_temperature
+    if base_temperature is None:
+        base_temperature = settings.gdd_base_temperature
+
+    try:
+        indices, not_found = await get_weather_indices(
+            field_ids=request.field_ids,
+            date_start=request.date_start,
+            date_end=request.date_end,
+            base_temperature=base_temperature,
+            db=db,
+        )
+    except Exception as exc:
+        raise HTTPException(
+            status_code=502, detail=f"Weather service error: {exc}"
+        ) from exc
+
+    field_ids = list(indices)
+    return WeatherStatisticsResponse(
+        date_start=request.date_start,
+        date_end=request.date_end,
+        base_temperature=base_temperature,
+        field_id=field_ids,
+        days=[indices[field_id]["days"] for field_id in field_ids],
+        growing_degree_days=[
+            indices[field_id]["growing_degree_days"] for field_id in field_ids
+        ],
+        precipitation_sum=[
+            indices[field_id]["precipitation_sum"] for field_id in field_ids
+        ],
+        frost_days=[indices[field_id]["frost_days"] for field_id in field_ids],
+        not_found=not_found,
+    )
@@ -0,0 +1,118 @@
+from email.utils import formatdate
+from pathlib import Path
+from typing import Literal, Optional
+from uuid import UUID
+
+import requests
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.common.caching import is_not_modified
+from src.common.dependencies import get_db
+from src.common.exceptions import FieldNotFoundException
+from src.config.base import settings
+from src.services import field_cache, map_tiles
+from src.services.google_earth import get_map_tile_template
+from src.services.scene_catalog import resolve_latest_scene_id
+
+router = APIRouter(prefix="/fields", tags=["tiles"])
+
+
+def _tile_response(request: Request, content: bytes | Path) -> Response:
+    if isinstance(content, Path):
+        stat = content.stat()
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        modified = stat.st_mtime
+    else:
+        etag, modified = '"empty"', 0.0
+
+    # Revalidated on every use, a tile must not outlive an edit or deletion of its field
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(modified, usegmt=True),
+        "Cache-Control": "private, no-cache",
+    }
+
+    if is_not_modified(request, etag, modified):
+        return Response(status_code=304, headers=headers)
+
+    if isinstance(content, Path):
+        content = content.read_bytes()
+    return Response(content=content, media_type="image/png", headers=headers)
+
+
+@router.get("/{field_id}/tiles/{product}/{z}/{x}/{y}.png", response_class=Response)
+async def get_tile(
+    request: Request,
+    field_id: UUID,
+    product: Literal["rgb", "ndvi"],
+    z: int,
+    x: int,
+    y: int,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Serve an XYZ map tile of the latest Sentinel-2 imagery of a field, for Leaflet tile layers.
+
+    Tiles are cached on disk per field version (LRU, `map_tile_cache_max_bytes`) and
+    support conditional GETs, clients revalidate them on every use.
+    A tile fetched from GEE triggers a background prefetch of its neighbours.
+
+    ### Arguments
+    - **field_id** (`UUID`): The UUID of the field.
+    - **product** (`str`): `rgb` or `ndvi`.
+    - **z** / **x** / **y** (`int`): The tile coordinates.
+
+    ### Returns
+    - **image/png**: The 256x256 tile, transparent outside the field.
+
+    ### Raises
+    - **HTTPException**:
+        - If the field is not found (404).
+        - If the tile coordinates are out of range (400).
+        - If GEE does not return the tile (502).
+    """
+    if not 0 <= z <= settings.map_tile_max_zoom or not (
+        0 <= x < 2**z and 0 <= y < 2**z
+    ):
+        raise HTTPException(status_code=400, detail="Tile coordinates out of range")
+
+    # Checked before the disk cache, tiles of deleted fields are not served
+    try:
+        field = await field_cache.get_field(field_id=field_id, db=db)
+    except FieldNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+    version = field.version
+    cached = map_tiles.get_cached_tile(field_id, version, product, z, x, y)
+    if cached:
+        return _tile_response(request, cached)
+
+    boundary = field.boundary
+    if not map_tiles.tile_intersects(boundary, z, x, y):
+        return _tile_response(request, map_tiles.EMPTY_TILE)
+
+    template_key = (field_id, version, product)
+    template: Optional[str] = map_tiles.templates.get(template_key)
+    if template is None:
+        scene_id = await resolve_latest_scene_id(boundary=boundary, db=db)
+        template = await run_in_threadpool(
+            get_map_tile_template, boundary, product, scene_id
+        )
+        map_tiles.templates.set(template_key, template)
+
+    try:
+        path = await run_in_threadpool(
+            map_tiles.fetch_tile, field_id, version, product, z, x, y, template
+        )
+    except requests.RequestException as e:
+        # Most likely an expired map ID, the next request registers a new one
+        map_tiles.templates.pop(template_key)
+        raise HTTPException(status_code=502, detail="Failed to fetch tile") from e
+
+    map_tiles.prefetch_neighbors(
+        field_id, version, product, z, x, y, boundary, template
+    )
+
+    return _tile_response(request, path)
@@ -0,0 +1,51 @@
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.schemas.time_series import NdviTimeSeriesResponse
+from src.common.dependencies import get_db
+from src.common.exceptions import FieldNotFoundException
+from src.services.time_series import get_field_ndvi_time_series
+
+router = APIRouter(prefix="/fields", tags=["time series"])
+
+
+@router.get("/{field_id}/ndvi-time-series", response_model=NdviTimeSeriesResponse)
+async def get_ndvi_time_series(
+    field_id: UUID,
+    date_start: date,
+    date_end: Optional[date] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Retrieve the per-scene mean NDVI of a field, e.g. a full-season curve.
+
+    ### Arguments
+    - **field_id** (`UUID`): The UUID of the field.
+    - **date_start** (`date`): The first acquisition date of the series.
+    - **date_end** (`Optional[date]`): Only scenes acquired before this date. Defaults to `None` (up to now).
+
+    ### Returns
+    - **NdviTimeSeriesResponse**: One observation per clear Sentinel-2 scene, oldest first.
+
+    ### Raises
+    - **HTTPException**:
+        - If the field is not found (404).
+        - If date_start is not before date_end (400).
+    """
+    if date_end is not None and date_start >= date_end:
+        raise HTTPException(
+            status_code=400, detail="date_start must be before date_end"
+        )
+
+    try:
+        observations = await get_field_ndvi_time_series(
+            field_id=field_id, date_start=date_start, date_end=date_end, db=db
+        )
+    except FieldNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+    return {"field_id": field_id, "observations": observations}
@@ -1,45 +1,38 @@
+from datetime import date
+from typing import Any, Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from geoalchemy2.shape import to_shape
+from shapely.geometry import Point, shape
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.schemas.weather import WeatherResponse, CurrentWeather, DailyForecast
-from src.common.dependencies import get_db
+from src.api.schemas.weather import (
+    WeatherResponse,
+    CurrentWeather,
+    DailyForecast,
+    DailyForecastColumns,
+    FieldWeather,
+    WeatherBatchRequest,
+    WeatherBatchResponse,
+    WeatherColumnarResponse,
+    WeatherFormat,
+    WeatherIndicesResponse,
+)
+from src.common.dependencies import get_db, get_read_db
 from src.common.exceptions import FieldNotFoundException
+from src.config.base import settings
 from src.database.postgres.crud import field as crud_field
-from src.services.weather import get_weather_for_coordinates, describe_weather_code
+from src.services import field_cache
+from src.services.weather import describe_weather_code
+from src.services.weather_cache import get_cached_weather, get_cached_weather_many
+from src.services.weather_history import get_weather_indices
 
 router = APIRouter(prefix="/fields", tags=["weather"])
 
 
-@router.get("/{field_id}/weather", response_model=WeatherResponse)
-async def get_field_weather(
-    field_id: UUID,
-    db: AsyncSession = Depends(get_db),
-):
-    """
-    Get current weather and 7-day forecast for a field's location.
-    Computes the centroid of the field boundary and fetches weather data from Open-Meteo.
-    """
-    try:
-        field = await crud_field.get_field(field_id=field_id, db=db)
-    except FieldNotFoundException as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-
-    centroid = to_shape(field.boundary).centroid
-    latitude = centroid.y
-    longitude = centroid.x
-
-    try:
-        raw = get_weather_for_coordinates(latitude, longitude)
-    except Exception as exc:
-        raise HTTPException(
-            status_code=502, detail=f"Weather service error: {exc}"
-        ) from exc
-
-    current_data = raw["current"]
-    current = CurrentWeather(
+def _build_current_weather(current_data: dict[str, Any]) -> CurrentWeather:
+    return CurrentWeather(
         temperature=current_data["temperature_2m"],
         apparent_temperature=current_data["apparent_temperature"],
         humidity=current_data["relative_humidity_2m"],
@@ -50,6 +43,44 @@ async def get_field_weather(
         weather_description=describe_weather_code(current_data["weather_code"]),
     )
 
+
+def _build_columnar_weather_response(
+    raw: dict[str, Any], latitude: float, longitude: float
+) -> WeatherColumnarResponse:
+    # Open-Meteo already returns the daily values as arrays, they are passed through as is
+    daily_data = raw["daily"]
+    codes = {raw["current"]["weather_code"], *daily_data["weather_code"]}
+
+    return WeatherColumnarResponse(
+        latitude=latitude,
+        longitude=longitude,
+        timezone=raw.get("timezone", "UTC"),
+        current=_build_current_weather(raw["current"]),
+        daily=DailyForecastColumns(
+            date=daily_data["time"],
+            temperature_max=daily_data["temperature_2m_max"],
+            temperature_min=daily_data["temperature_2m_min"],
+            precipitation_sum=daily_data["precipitation_sum"],
+            wind_speed_max=daily_data["wind_speed_10m_max"],
+            weather_code=daily_data["weather_code"],
+        ),
+        weather_descriptions={
+            code: describe_weather_code(code) for code in codes if code is not None
+        },
+    )
+
+
+def _build_weather_response(
+    raw: dict[str, Any],
+    latitude: float,
+    longitude: float,
+    response_format: WeatherFormat = "rows",
+) -> Union[WeatherResponse, WeatherColumnarResponse]:
+    if response_format == "columnar":
+        return _build_columnar_weather_response(raw, latitude, longitude)
+
+    current = _build_current_weather(raw["current"])
+
     daily_data = raw["daily"]
     daily = [
         DailyForecast(
@@ -71,3 +102,181 @@ async def get_field_weather(
         current=current,
         daily=daily,
     )
+
+
+@router.get(
+    "/{field_id}/weather",
+    response_model=Union[WeatherResponse, WeatherColumnarResponse],
+)
+async def get_field_weather(
+    field_id: UUID,
+    response_format: WeatherFormat = Query("rows", alias="format"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get current weather and 7-day forecast for a field's location.
+    Computes the centroid of the field boundary and fetches weather data from Open-Meteo,
+    cached per weather grid cell until the next hourly model update.
+
+    With `format=columnar` the daily forecast is returned as parallel arrays
+    and weather descriptions as a lookup table by WMO code.
+    """
+    try:
+        field = await field_cache.get_field(field_id=field_id, db=db)
+    except FieldNotFoundException as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+    centroid = shape(field.boundary).centroid
+    latitude = centroid.y
+    longitude = centroid.x
+
+    try:
+        raw = await get_cached_weather(latitude, longitude, db=db)
+    except Exception as exc:
+        raise HTTPException(
+            status_code=502, detail=f"Weather service error: {exc}"
+        ) from exc
+
+    return _build_weather_response(raw, latitude, longitude, response_format)
+
+
+@router.post("/weather/batch", response_model=WeatherBatchResponse)
+async def get_fields_weather(
+    request: WeatherBatchRequest,
+    response_format: WeatherFormat = Query("rows", alias="format"),
+    db: AsyncSession = Depends(get_db),
+    read_db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Get current weather and 7-day forecast for many fields at once.
+
+    Fields sharing a weather grid cell share one forecast, and cache misses are fetched
+    from Open-Meteo with many locations per request.
+
+    ### Arguments
+    - **request** (`WeatherBatchRequest`): Up to `weather_batch_max_fields` field IDs.
+    - **format** (`str`): `rows` (default) or `columnar` for daily forecasts as parallel arrays.
+
+    ### Returns
+    - **WeatherBatchResponse**: One item per requested field, in order, with either
+        the weather or an error (field not found, weather service error).
+
+    ### Raises
+    - **HTTPException**:
+        - If too many fields are requested (400).
+    """
+    if len(request.field_ids) > settings.weather_batch_max_fields:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.weather_batch_max_fields} fields per request",
+        )
+
+    fields = await crud_field.get_fields_by_ids(field_ids=request.field_ids, db=read_db)
+    centroids: dict[UUID, Point] = {
+        field.id: to_shape(field.boundary).centroid  # type: ignore[misc, arg-type]
+        for field in fields
+    }
+
+    found = [field_id for field_id in request.field_ids if field_id in centroids]
+    payloads = await get_cached_weather_many(
+        [(centroids[field_id].y, centroids[field_id].x) for field_id in found], db=db
+    )
+    weather = dict(zip(found, payloads))
+
+    items = []
+    for field_id in request.field_ids:
+        payload = weather.get(field_id)
+        if payload is None:
+            items.append(
+                FieldWeather(
+                    field_id=field_id, error=str(FieldNotFoundException(field_id))
+                )
+            )
+        elif isinstance(payload, Exception):
+            items.append(
+                FieldWeather(
+                    field_id=field_id,
+                    error=f"Weather service error: {payload}",
+                )
+            )
+        else:
+            items.append(
+                FieldWeather(
+                    field_id=field_id,
+                    weather=_build_weather_response(
+                        payload,
+                        centroids[field_id].y,
+                        centroids[field_id].x,
+                        response_format,
+                    ),
+                )
+            )
+
+    return WeatherBatchResponse(items=items)
+
+
+@router.get("/{field_id}/weather/history", response_model=WeatherIndicesResponse)
+async def get_field_weather_history(
+    field_id: UUID,
+    date_start: date,
+    date_end: date,
+    base_temperature: Optional[float] = None,
+    include_daily: bool = Query(False),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get agro-weather indices of a field for a season from the daily weather history.
+
+    Missing days of the field's history grid cell are appended from the Open-Meteo archive
+    (recent days from the forecast API) before the indices are computed.
+
+    ### Arguments
+    - **field_id** (`UUID`): The ID of the field.
+    - **date_start** / **date_end** (`date`): The season, both inclusive.
+    - **base_temperature** (`float`): Base temperature of growing degree days.
+        Defaults to `gdd_base_temperature`.
+    - **include_daily** (`bool`): Include the daily values with running totals. Defaults to `False`.
+
+    ### Returns
+    - **WeatherIndicesResponse**: Growing degree days, precipitation sum and frost days.
+
+    ### Raises
+    - **HTTPException**:
+        - If date_start is after date_end (400).
+        - If the field is not found (404).
+        - If the weather service fails (502).
+    """
+    if date_start > date_end:
+        raise HTTPException(
+            status_code=400, detail="date_start must not be after date_end"
+        )
+
+    if base_temperature is None:
+        base_temperature = settings.gdd_base_temperature
+
+    try:
+        indices, not_found = await get_weather_indices(
+            field_ids=[field_id],
+            date_start=date_start,
+            date_end=date_end,
+            base_temperature=base_temperature,
+            include_daily=include_daily,
+            db=db,
+        )
+    except Exception as exc:
+        raise HTTPException(
+            status_code=502, detail=f"Weather service error: {exc}"
+        ) from exc
+
+    if not_found:
+        raise HTTPException(
+            status_code=404, detail=str(FieldNotFoundException(field_id))
+        )
+
+    return WeatherIndicesResponse(
+        field_id=field_id,
+        date_start=date_start,
+        date_end=date_end,
+        base_temperature=base_temperature,
+        **indices[field_id],
+    )
@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class FieldChangeScoreRead(BaseModel):
+    field_id: UUID
+    ndvi_delta: Optional[float] = None
+    vv_delta: Optional[float] = None
+    score: float
+    latest_scene_time: Optional[datetime] = None
+    scanned_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional, Any, Dict
+from typing import Annotated, Optional, Any, Dict, Literal, Union
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
@@ -32,5 +32,99 @@ class FieldRead(FieldBase):
     id: UUID
     creation_date: datetime
     deletion_date: Optional[datetime] = Field(default=None, examples=[None])
+    updated_at: datetime
+    version: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class FieldCreateOperation(BaseModel):
+    op: Literal["create"]
+    field: FieldCreate
+
+
+class FieldUpdateOperation(BaseModel):
+    op: Literal["update"]
+    id: UUID
+    field: FieldUpdate
+
+
+class FieldDeleteOperation(BaseModel):
+    op: Literal["delete"]
+    id: UUID
+
+
+class FieldRestoreOperation(BaseModel):
+    op: Literal["restore"]
+    id: UUID
+
+
+FieldOperation = Annotated[
+    Union[
+        FieldCreateOperation,
+        FieldUpdateOperation,
+        FieldDeleteOperation,
+        FieldRestoreOperation,
+    ],
+    Field(discriminator="op"),
+]
+
+
+class FieldBatchRequest(BaseModel):
+    operations: list[FieldOperation] = Field(min_length=1)
+    atomic: bool = False
+
+
+class FieldBatchResult(BaseModel):
+    op: str
+    id: Optional[UUID] = None
+    status: Literal["applied", "failed", "skipped"]
+    error: Optional[str] = None
+
+
+class FieldBatchResponse(BaseModel):
+    applied: int
+    failed: int
+    results: list[FieldBatchResult]
+
+
+class FieldSpatialMutationRequest(BaseModel):
+    action: Literal["delete", "restore"]
+    boundary: dict
+    predicate: Literal["within", "intersects"] = "within"
+
+    @field_validator("boundary", mode="before")
+    @classmethod
+    def validate_boundary(cls, value: Any) -> Optional[Dict[str, Any]]:
+        return validate_geojson(value, "Boundary")
+
+
+class FieldSpatialMutationResponse(BaseModel):
+    affected: int
+    field_ids: list[UUID]
+
+
+class FieldSummary(BaseModel):
+    field_count: int
+    active_count: int
+    deleted_count: int
+    total_area_m2: float
+    extent: Optional[tuple[float, float, float, float]] = Field(
+        default=None, description="min_lon, min_lat, max_lon, max_lat"
+    )
+
+
+class FieldCluster(BaseModel):
+    count: int
+    longitude: float
+    latitude: float
+    extent: tuple[float, float, float, float] = Field(
+        description="min_lon, min_lat, max_lon, max_lat of the clustered fields"
+    )
+
+
+class FieldClusterTile(BaseModel):
+    z: int
+    x: int
+    y: int
+    clusters: list[FieldCluster]
@@ -0,0 +1,29 @@
+from datetime import date, datetime
+from typing import Literal, Optional
+
+from pydantic import BaseModel, model_validator
+
+
+class RasterCacheRequest(BaseModel):
+    sensor: Literal["s2", "s1"] = "s2"
+    date_start: Optional[date] = None
+    date_end: Optional[date] = None
+
+    @model_validator(mode="after")
+    def validate_dates(self) -> "RasterCacheRequest":
+        if (self.date_start is None) != (self.date_end is None):
+            raise ValueError("date_start and date_end must be provided together")
+        if self.sensor == "s1" and self.date_start is None:
+            raise ValueError("Sentinel-1 stacks require date_start and date_end")
+        return self
+
+
+class RasterStackRead(BaseModel):
+    key: str
+    sensor: str
+    bands: list[str]
+    width: int
+    height: int
+    date_start: Optional[date] = None
+    date_end: Optional[date] = None
+    creation_date: datetime
@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing import Any, Dict, Literal, Optional
+
+from pydantic import BaseModel, Field, field_validator, ConfigDict
+
+from src.utils.validation import validate_geojson
+
+SceneCollection = Literal["COPERNICUS/S2_HARMONIZED", "COPERNICUS/S1_GRD"]
+
+
+class SceneRead(BaseModel):
+    scene_id: str
+    collection: str
+    tile: Optional[str] = None
+    acquisition_time: datetime
+    cloudy_pixel_percentage: Optional[float] = None
+    footprint: dict
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_validator("footprint", mode="before")
+    @classmethod
+    def validate_footprint(cls, value: Any) -> Optional[Dict[str, Any]]:
+        return validate_geojson(value, "Footprint")
+
+
+class SceneSyncRequest(BaseModel):
+    boundary: dict
+    collections: list[SceneCollection] = Field(
+        default=["COPERNICUS/S2_HARMONIZED", "COPERNICUS/S1_GRD"]
+    )
+
+    @field_validator("boundary", mode="before")
+    @classmethod
+    def validate_boundary(cls, value: Any) -> Optional[Dict[str, Any]]:
+        return validate_geojson(value, "Boundary")
+
+
+class SceneSyncResult(BaseModel):
+    collection: str
+    scenes_added: int
+    synced_at: datetime
+
+
+class SceneSyncResponse(BaseModel):
+    results: list[SceneSyncResult]
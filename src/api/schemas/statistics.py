@@ -0,0 +1,65 @@
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class NdviStatisticsRequest(BaseModel):
+    field_ids: list[UUID] = Field(min_length=1, max_length=10000)
+    date_start: date
+    date_end: date
+    refresh: bool = False
+
+    @model_validator(mode="after")
+    def validate_dates(self) -> "NdviStatisticsRequest":
+        if self.date_start >= self.date_end:
+            raise ValueError("date_start must be before date_end")
+        return self
+
+
+class NdviStatisticsResponse(BaseModel):
+    """NDVI statistics in columnar form: the i-th entry of every list belongs to field_id[i]."""
+
+    date_start: date
+    date_end: date
+    histogram_range: tuple[float, float]
+    histogram_bins: int
+    field_id: list[UUID]
+    mean: list[Optional[float]]
+    median: list[Optional[float]]
+    p10: list[Optional[float]]
+    p25: list[Optional[float]]
+    p75: list[Optional[float]]
+    p90: list[Optional[float]]
+    pixel_count: list[Optional[int]]
+    histogram: list[Optional[list[int]]]
+    error: list[Optional[str]]
+    not_found: list[UUID]
+
+
+class WeatherStatisticsRequest(BaseModel):
+    field_ids: list[UUID] = Field(min_length=1, max_length=10000)
+    date_start: date
+    date_end: date
+    base_temperature: Optional[float] = None
+
+    @model_validator(mode="after")
+    def validate_dates(self) -> "WeatherStatisticsRequest":
+        if self.date_start > self.date_end:
+            raise ValueError("date_start must not be after date_end")
+        return self
+
+
+class WeatherStatisticsResponse(BaseModel):
+    """Season weather indices in columnar form: the i-th entry of every list belongs to field_id[i]."""
+
+    date_start: date
+    date_end: date
+    base_temperature: float
+    field_id: list[UUID]
+    days: list[int]
+    growing_degree_days: list[float]
+    precipitation_sum: list[float]
+    frost_days: list[int]
+    not_found: list[UUID]
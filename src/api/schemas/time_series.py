@@ -0,0 +1,19 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class NdviObservationRead(BaseModel):
+    scene_id: str
+    acquisition_time: datetime
+    ndvi_mean: float
+    cloudy_pixel_percentage: Optional[float] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class NdviTimeSeriesResponse(BaseModel):
+    field_id: UUID
+    observations: list[NdviObservationRead]
@@ -1,4 +1,11 @@
-from pydantic import BaseModel
+from datetime import date
+from typing import Literal, Optional, Union
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+WeatherFormat = Literal["rows", "columnar"]
 
 
 class CurrentWeather(BaseModel):
@@ -28,3 +35,59 @@ class WeatherResponse(BaseModel):
     timezone: str
     current: CurrentWeather
     daily: list[DailyForecast]
+
+
+class DailyForecastColumns(BaseModel):
+    """Daily forecast as parallel arrays: the i-th entry of every list belongs to date[i]."""
+
+    date: list[str]
+    temperature_max: list[Optional[float]]
+    temperature_min: list[Optional[float]]
+    precipitation_sum: list[Optional[float]]
+    wind_speed_max: list[Optional[float]]
+    weather_code: list[Optional[int]]
+
+
+class WeatherColumnarResponse(BaseModel):
+    latitude: float
+    longitude: float
+    timezone: str
+    current: CurrentWeather
+    daily: DailyForecastColumns
+    weather_descriptions: dict[int, str]
+
+
+class WeatherBatchRequest(BaseModel):
+    field_ids: list[UUID] = Field(min_length=1)
+
+
+class FieldWeather(BaseModel):
+    field_id: UUID
+    weather: Optional[Union[WeatherResponse, WeatherColumnarResponse]] = None
+    error: Optional[str] = None
+
+
+class WeatherBatchResponse(BaseModel):
+    items: list[FieldWeather]
+
+
+class WeatherHistoryDay(BaseModel):
+    date: date
+    temperature_max: Optional[float]
+    temperature_min: Optional[float]
+    precipitation_sum: Optional[float]
+    growing_degree_days: float
+    precipitation_cumulative: float
+    frost_days: int
+
+
+class WeatherIndicesResponse(BaseModel):
+    field_id: UUID
+    date_start: date
+    date_end: date
+    base_temperature: float
+    days: int
+    growing_degree_days: float
+    precipitation_sum: float
+    frost_days: int
+    daily: Optional[list[WeatherHistoryDay]] = None
@@ -1,8 +1,18 @@
-from typing import AsyncGenerator
+import logging
+from typing import AsyncGenerator, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config.base import settings
 from src.database.postgres.handler import PostgreSQLHandler as DatabaseHandler
+from src.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Whether the read replica is usable, rechecked when the entry expires
+_replica_usable = TTLCache(maxsize=1, ttl=settings.replica_lag_check_seconds)
+# Shared by all replica sessions and lag checks of the process, see close_replica
+_replica_handler: Optional[DatabaseHandler] = None
 
 
 async def get_database_dependency() -> DatabaseHandler:
@@ -36,3 +46,54 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield async_session
     finally:
         await async_session.close()
+
+
+def _get_replica_handler() -> DatabaseHandler:
+    global _replica_handler  # pylint: disable=W0603
+    if _replica_handler is None:
+        _replica_handler = DatabaseHandler(replica=True)
+    return _replica_handler
+
+
+async def close_replica() -> None:
+    """Dispose of the replica engine, on application shutdown."""
+    global _replica_handler  # pylint: disable=W0603
+    if _replica_handler is not None:
+        await _replica_handler.engine.dispose()
+        _replica_handler = None
+
+
+async def _replica_is_usable(replica_handler: DatabaseHandler) -> bool:
+    usable: Optional[bool] = _replica_usable.get("replica")
+    if usable is None:
+        lag = await replica_handler.replication_lag()
+        usable = lag is not None and lag <= settings.replica_max_lag_seconds
+        if not usable:
+            logger.warning("Read replica unusable (lag %s), reading from primary", lag)
+        _replica_usable.set("replica", usable)
+    return usable
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get an asynchronous database session for read-only endpoints.
+
+    The session uses the read replica when one is configured (`postgres_replica_host`)
+    and its replication lag, checked every `replica_lag_check_seconds`, is at most
+    `replica_max_lag_seconds`. Otherwise it uses the primary, like `get_db`.
+
+    Returns:
+        AsyncSession: An asynchronous database session, for reads only.
+    """
+    db_handler: Optional[DatabaseHandler] = None
+    if settings.postgres_replica_host:
+        replica_handler = _get_replica_handler()
+        if await _replica_is_usable(replica_handler):
+            db_handler = replica_handler
+
+    async_session = (db_handler or DatabaseHandler()).session_factory()
+
+    try:
+        yield async_session
+    finally:
+        await async_session.close()
@@ -19,3 +19,22 @@ class SelfIntersectionException(Exception):
     ):
         self.message = message
         super().__init__(self.message)
+
+
+class RasterNotCachedException(Exception):
+    def __init__(self, field_id: UUID, key: str):
+        self.field_id = field_id
+        self.key = key
+        super().__init__(f"Raster '{key}' is not cached for field with ID {field_id}")
+
+
+class GeeUnavailableException(Exception):
+    def __init__(self, retry_after: float = 0):
+        self.retry_after = retry_after
+        super().__init__("Google Earth Engine is temporarily unavailable, retry later")
+
+
+class JobQueueFullException(Exception):
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        super().__init__(f"The job queue is full ({queue_size} jobs), retry later")
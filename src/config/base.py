@@ -1,4 +1,5 @@
 import os
+from datetime import date
 from typing import ClassVar, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -17,7 +18,120 @@ class Settings(BaseSettings):
     postgres_password: Optional[str] = None
     postgres_host: Optional[str] = None
     postgres_port: int = 5432
+    # Optional read replica for read-only endpoints, same database and credentials
+    postgres_replica_host: Optional[str] = None
+    postgres_replica_port: Optional[int] = None
+    replica_max_lag_seconds: float = 5
+    replica_lag_check_seconds: float = 5
     gee_project: Optional[str] = None
 
+    scene_catalog_enabled: bool = True
+    scene_catalog_start_date: date = date(2021, 1, 1)
+    scene_catalog_sync_overlap_days: int = 5
+    scene_catalog_sync_limit: int = 5000
+    scene_catalog_max_age_hours: int = 24
+
+    gee_requests_per_second: float = 10
+    gee_burst: int = 20
+    gee_max_queue_wait_seconds: float = 10
+    gee_max_retries: int = 3
+    gee_backoff_base_seconds: float = 0.5
+    gee_backoff_max_seconds: float = 8
+    gee_circuit_failure_threshold: int = 5
+    gee_circuit_reset_seconds: float = 30
+
+    thumbnail_min_scale: float = 10
+    thumbnail_max_dimension: int = 1024
+    thumbnail_tiling_enabled: bool = False
+    thumbnail_tile_size: int = 1024
+    thumbnail_tile_workers: int = 4
+    thumbnail_tiling_max_pixels: int = 64_000_000
+    thumbnail_dir: str = "./cache/thumbnails"
+    # Soft limit, thumbnails with unexpired URLs are kept
+    thumbnail_max_files: int = 1000
+
+    map_tile_cache_dir: str = "./cache/tiles"
+    map_tile_cache_max_bytes: int = 1024**3
+    map_tile_max_age_hours: int = 24
+    map_tile_max_zoom: int = 18
+    map_tile_template_ttl_minutes: int = 50
+    map_tile_template_cache_size: int = 1000
+    map_tile_prefetch_workers: int = 4
+    map_tile_timeout_seconds: float = 10
+
+    job_workers: int = 2
+    job_queue_size: int = 100
+    job_result_ttl_minutes: int = 50
+    job_timeout_minutes: int = 30
+    job_poll_interval_seconds: float = 1
+    job_keepalive_seconds: float = 15
+
+    weather_timeout_seconds: float = 10
+    weather_connect_timeout_seconds: float = 5
+    weather_pool_timeout_seconds: float = 10
+    weather_max_connections: int = 20
+    weather_max_keepalive_connections: int = 10
+    weather_grid_degrees: float = 0.01
+    weather_update_offset_minutes: int = 10
+    weather_cache_size: int = 10000
+    weather_batch_chunk_size: int = 100
+    weather_batch_concurrency: int = 4
+    weather_batch_max_fields: int = 1000
+    weather_history_grid_degrees: float = 0.1
+    weather_archive_lag_days: int = 5
+    gdd_base_temperature: float = 10
+    gdd_upper_temperature: float = 30
+
+    geometry_cache_size: int = 10000
+    field_batch_max_operations: int = 1000
+    field_summary_cache_size: int = 1000
+    field_summary_cache_ttl_seconds: float = 60
+    field_cluster_grid_cells: int = 4
+    field_cluster_max_zoom: int = 12
+    field_cluster_cache_size: int = 10000
+    field_cluster_cache_ttl_seconds: float = 300
+    field_cache_size: int = 1000
+    field_cache_ttl_seconds: float = 60
+    field_events_enabled: bool = True
+    field_events_reconnect_seconds: float = 5
+    # Opt-in: archiving drops the NDVI statistics, time series and change scores of a field
+    field_archive_enabled: bool = False
+    field_archive_after_days: int = 30
+    field_archive_interval_minutes: int = 60
+    field_archive_batch_size: int = 1000
+    boundary_match_enabled: bool = False
+    boundary_match_min_iou: float = 0.95
+    boundary_match_max_hausdorff_meters: float = 5
+
+    compression_minimum_size: int = 1000
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 5
+    server_timing_enabled: bool = True
+
+    # Opt-in sampling profiler, see ProfilingMiddleware; enabling it requires a token
+    profiling_enabled: bool = False
+    profiling_token: Optional[str] = None
+    profiling_sample_rate: float = 0.0
+    profiling_interval_ms: float = 5
+    profiling_max_files: int = 100
+    profiling_max_concurrent: int = 2
+    profiling_dir: str = "./cache/profiles"
+
+    raster_cache_dir: str = "./cache/rasters"
+    raster_scale_meters: float = 10
+    # Stacks over this size are downloaded at a coarser scale, computePixels caps requests at 48 MB
+    raster_max_bytes: int = 48 * 1024 * 1024
+
+    zonal_statistics_chunk_size: int = 1000
+    ndvi_time_series_refresh_minutes: int = 60
+
+    change_scan_enabled: bool = False
+    change_scan_interval_minutes: int = 360
+    change_scan_baseline_start: date = date(2021, 6, 1)
+    change_scan_baseline_end: date = date(2021, 9, 1)
+    change_scan_recent_days: int = 90
+    change_scan_chunk_size: int = 200
+    change_scan_workers: int = 4
+
 
 settings = Settings()
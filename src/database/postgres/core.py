@@ -16,6 +16,16 @@ from src.config.base import settings
 
 logger = logging.getLogger(__name__)
 
+# The last replay time alone grows while the primary is idle, so a replica
+# that replayed all received WAL counts as up to date
+REPLICATION_LAG_QUERY = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+END
+"""
+
 
 class PostgreSQLCore:
     """
@@ -28,7 +38,10 @@ class PostgreSQLCore:
     """
 
     def __init__(
-        self, db_url: Optional[URL] = None, database: Optional[str] = None
+        self,
+        db_url: Optional[URL] = None,
+        database: Optional[str] = None,
+        replica: bool = False,
     ) -> None:
         """
         Initializes the PostgreSQLCore with a database URL and connects to it.
@@ -36,11 +49,13 @@ class PostgreSQLCore:
         Args:
             db_url (str, optional): The database URL. Defaults to None.
             database (str, optional): The name of the database to connect to. Defaults to None.
+            replica (bool, optional): Connect to the read replica instead of the primary.
+                Defaults to False.
         """
         self.db_url = (
             db_url
             if db_url
-            else self.build_db_url(database or settings.postgres_database)
+            else self.build_db_url(database or settings.postgres_database, replica)
         )
         self.base_model = BaseSQL
         self.engine = create_async_engine(self.db_url)
@@ -49,16 +64,27 @@ class PostgreSQLCore:
         )
 
     @staticmethod
-    def build_db_url(database: str) -> URL:
+    def build_db_url(database: str, replica: bool = False) -> URL:
         """
         Builds the database URL using the provided database name and settings.
 
         Args:
             database (str): The name of the database.
+            replica (bool, optional): Build the URL of the read replica. Defaults to False.
 
         Returns:
             str: The constructed database URL.
         """
+        if replica:
+            return URL.create(
+                drivername="postgresql+asyncpg",
+                username=settings.postgres_username,
+                password=settings.postgres_password,
+                host=settings.postgres_replica_host,
+                port=int(settings.postgres_replica_port or settings.postgres_port),
+                database=database,
+            )
+
         if settings.cloud_sql_connection:
             return URL.create(
                 drivername="postgresql+asyncpg",
@@ -93,3 +119,19 @@ class PostgreSQLCore:
         except SQLAlchemyError as e:
             logger.error("Database health check failed: %s", e)
             return False
+
+    async def replication_lag(self) -> Optional[float]:
+        """
+        Returns the replication lag of the database in seconds.
+
+        Returns:
+            float: 0 for a primary or a replica that replayed everything it received,
+                None if the lag is unknown or the database is not accessible.
+        """
+        try:
+            async with self.engine.connect() as connection:
+                lag = (await connection.execute(text(REPLICATION_LAG_QUERY))).scalar()
+                return None if lag is None else float(lag)
+        except (OSError, SQLAlchemyError) as e:
+            logger.warning("Replication lag check failed: %s", e)
+            return None
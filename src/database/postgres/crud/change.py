@@ -0,0 +1,60 @@
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import select, desc
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.change import FieldChangeScore
+from src.models.field import Field
+
+INSERT_CHUNK_SIZE = 1000
+
+
+async def get_change_scores(
+    db: AsyncSession, limit: Optional[int] = None, offset: Optional[int] = None
+) -> list[FieldChangeScore]:
+    """Change scores of active fields, biggest changes first."""
+    query = (
+        select(FieldChangeScore)
+        .join(Field, Field.id == FieldChangeScore.field_id)
+        .where(Field.deletion_date.is_(None))
+        .order_by(desc(FieldChangeScore.score))
+    )
+    if limit is not None and offset is not None:
+        query = query.limit(limit).offset(offset)
+
+    return list((await db.scalars(query)).all())
+
+
+async def get_latest_scene_times(db: AsyncSession) -> dict[UUID, Optional[datetime]]:
+    result = await db.execute(
+        select(FieldChangeScore.field_id, FieldChangeScore.latest_scene_time)
+    )
+
+    return dict(result.tuples().all())
+
+
+async def upsert_change_scores(scores: list[dict[str, Any]], db: AsyncSession) -> None:
+    # Chunked to stay below the bind parameter limit of the driver
+    for chunk_start in range(0, len(scores), INSERT_CHUNK_SIZE):
+        statement = insert(FieldChangeScore).values(
+            scores[chunk_start : chunk_start + INSERT_CHUNK_SIZE]
+        )
+        await db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[FieldChangeScore.field_id],
+                set_={
+                    column: statement.excluded[column]
+                    for column in (
+                        "ndvi_delta",
+                        "vv_delta",
+                        "score",
+                        "latest_scene_time",
+                        "scanned_at",
+                    )
+                },
+            )
+        )
+    await db.commit()
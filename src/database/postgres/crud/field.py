@@ -1,46 +1,143 @@
 import json
+import math
 from datetime import datetime
-from typing import Optional
-from uuid import UUID
-
-from sqlalchemy import select, func, desc
+from typing import Any, Callable, Literal, Optional, cast, overload
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    CursorResult,
+    and_,
+    any_,
+    bindparam,
+    delete,
+    desc,
+    func,
+    insert,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from geoalchemy2 import WKTElement
-from shapely.geometry import shape
+from sqlalchemy.orm import aliased
 
 from src.api.schemas.field import FieldCreate, FieldUpdate
 from src.common.exceptions import FieldNotFoundException
-from src.models.field import Field
-from src.utils import conversion
+from src.models.field import Field, FieldArchive
+from src.utils.geometry import METERS_PER_DEGREE, CanonicalGeometry, canonicalize
+
+INSERT_CHUNK_SIZE = 1000
+
+# Columns of fields, also in fields_archive
+FIELD_COLUMNS = [column.name for column in Field.__table__.columns]
+
+# Field writes are announced to the other processes on this channel with NOTIFY
+FIELDS_CHANGED_CHANNEL = "fields_changed"
+# Larger changes are announced as "any field", the payload is limited to 8000 bytes
+NOTIFY_MAX_FIELD_IDS = 100
+# Lets a process recognize and skip its own notifications
+PROCESS_TOKEN = uuid4().hex
+
+# Called with the changed field IDs after every committed write to fields, e.g. to
+# invalidate caches. None means that any field may have changed.
+_change_listeners: list[Callable[[Optional[list[UUID]]], None]] = []
+
+
+def on_fields_changed(listener: Callable[[Optional[list[UUID]]], None]) -> None:
+    _change_listeners.append(listener)
+
+
+def fields_changed(field_ids: Optional[list[UUID]]) -> None:
+    for listener in _change_listeners:
+        listener(field_ids)
+
+
+async def _commit_field_changes(db: AsyncSession, field_ids: list[UUID]) -> None:
+    """
+    Commit the pending field writes and notify the listeners of this and other processes.
+    Created fields need no ID, nothing can be cached for them yet.
+    """
+    payload = {
+        "origin": PROCESS_TOKEN,
+        "ids": (
+            [str(field_id) for field_id in field_ids]
+            if len(field_ids) <= NOTIFY_MAX_FIELD_IDS
+            else None
+        ),
+    }
+    # NOTIFY is transactional, the other processes receive it once the writes are visible
+    await db.execute(
+        select(func.pg_notify(FIELDS_CHANGED_CHANNEL, json.dumps(payload)))
+    )
+    await db.commit()
+    fields_changed(field_ids)
 
 
-async def get_fields(
-    db: AsyncSession,
-    limit: Optional[int] = None,
-    offset: Optional[int] = None,
-    boundary: Optional[str] = None,
-    filter_by: Optional[str] = None,
-):
-    queryset = select(Field).order_by(desc(Field.creation_date))
+def _fields_source(filter_by: Optional[str]):
+    """
+    The fields to query for `filter_by`. Active fields are all in `fields`,
+    deleted ones may have been moved to `fields_archive`.
+    """
+    if filter_by is None:
+        return Field
+
+    archived = select(*(FieldArchive.__table__.c[name] for name in FIELD_COLUMNS))
+    return aliased(
+        Field,
+        union_all(select(Field.__table__), archived).subquery("all_fields"),
+    )
+
 
+def _filter_fields(
+    queryset,
+    boundary: Optional[str],
+    filter_by: Optional[str],
+    bbox: Optional[tuple[float, float, float, float]] = None,
+    source=Field,
+):
     if filter_by is None:
-        queryset = queryset.where(Field.deletion_date == None)
+        queryset = queryset.where(source.deletion_date == None)
     elif filter_by == "deleted":
-        queryset = queryset.where(Field.deletion_date != None)
+        queryset = queryset.where(source.deletion_date != None)
 
     if boundary is not None:
-        # Convert the GeoJSON string into a Shapely geometry
-        boundary_shape = shape(json.loads(boundary))
+        # Use ST_Intersects to filter fields
+        boundary_geom = canonicalize(json.loads(boundary)).to_sql()
+        queryset = queryset.where(func.ST_Intersects(source.boundary, boundary_geom))
 
-        # Convert Shapely shape to WKT and set SRID to 4326
-        boundary_geom = func.ST_SetSRID(func.ST_GeomFromText(boundary_shape.wkt), 4326)
+    if bbox is not None:
+        # Bounding box overlap only, answered by the GiST index
+        queryset = queryset.where(
+            source.boundary.op("&&")(func.ST_MakeEnvelope(*bbox, 4326))
+        )
 
-        # Use ST_Intersects to filter fields
-        queryset = queryset.where(func.ST_Intersects(Field.boundary, boundary_geom))
+    return queryset
+
+
+async def get_fields(
+    db: AsyncSession,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    boundary: Optional[str] = None,
+    filter_by: Optional[str] = None,
+    total: Optional[int] = None,
+):
+    """
+    Matching fields, newest first, and their total count. Pass `total` when it is
+    already known (e.g. from `get_fields_validators`) to skip the count query.
+    """
+    source = _fields_source(filter_by)
+    queryset = _filter_fields(
+        select(source).order_by(desc(source.creation_date)),
+        boundary,
+        filter_by,
+        source=source,
+    )
 
     # Calculate total count after applying filters
-    total_query = select(func.count()).select_from(queryset.subquery())
-    total = await db.scalar(total_query)
+    if total is None:
+        total_query = select(func.count()).select_from(queryset.subquery())
+        total = await db.scalar(total_query)
 
     # Apply pagination if limit and offset are provided
     if limit is not None and offset is not None:
@@ -52,60 +149,260 @@ async def get_fields(
     return fields, total
 
 
+async def get_fields_validators(
+    db: AsyncSession,
+    boundary: Optional[str] = None,
+    filter_by: Optional[str] = None,
+) -> tuple[int, Optional[datetime]]:
+    """
+    Count and latest `updated_at` of the fields matching the filters. Any insert, update
+    or delete of a matching field changes one of them, so they validate cached lists
+    without loading the fields.
+    """
+    source = _fields_source(filter_by)
+    queryset = _filter_fields(
+        select(func.count(), func.max(source.updated_at)),
+        boundary,
+        filter_by,
+        source=source,
+    )
+    total, last_updated = (await db.execute(queryset)).one()
+    return total, last_updated
+
+
+async def get_fields_summary(
+    db: AsyncSession,
+    boundary: Optional[str] = None,
+    filter_by: Optional[str] = None,
+    bbox: Optional[tuple[float, float, float, float]] = None,
+) -> dict[str, Any]:
+    """Count, area in square meters, extent and deletion state counts of the matching fields."""
+    source = _fields_source(filter_by)
+    extent = func.ST_Extent(source.boundary)
+    queryset = _filter_fields(
+        select(
+            func.count().label("field_count"),
+            func.count().filter(source.deletion_date == None).label("active_count"),
+            func.count().filter(source.deletion_date != None).label("deleted_count"),
+            func.coalesce(
+                func.sum(func.ST_Area(func.geography(source.boundary))), 0
+            ).label("total_area_m2"),
+            func.ST_XMin(extent).label("min_lon"),
+            func.ST_YMin(extent).label("min_lat"),
+            func.ST_XMax(extent).label("max_lon"),
+            func.ST_YMax(extent).label("max_lat"),
+        ),
+        boundary,
+        filter_by,
+        bbox,
+        source,
+    )
+    row = (await db.execute(queryset)).one()
+
+    return {
+        "field_count": row.field_count,
+        "active_count": row.active_count,
+        "deleted_count": row.deleted_count,
+        "total_area_m2": float(row.total_area_m2),
+        "extent": (
+            None
+            if row.min_lon is None
+            else (row.min_lon, row.min_lat, row.max_lon, row.max_lat)
+        ),
+    }
+
+
+async def get_field_clusters(
+    bounds: tuple[float, float, float, float], grid_cells: int, db: AsyncSession
+) -> list[dict[str, Any]]:
+    """
+    Aggregate the active fields whose centroid lies in `bounds` into a grid of
+    `grid_cells` x `grid_cells` cells. Returns per non-empty cell the field count,
+    the mean centroid and the extent of its fields.
+    """
+    west, south, east, north = bounds
+    centroid = func.ST_Centroid(Field.boundary)
+    cell = func.ST_SnapToGrid(
+        centroid, west, south, (east - west) / grid_cells, (north - south) / grid_cells
+    )
+    center = func.ST_Centroid(func.ST_Collect(centroid))
+    extent = func.ST_Extent(Field.boundary)
+
+    result = await db.execute(
+        select(
+            func.count().label("count"),
+            func.ST_X(center).label("longitude"),
+            func.ST_Y(center).label("latitude"),
+            func.ST_XMin(extent).label("min_lon"),
+            func.ST_YMin(extent).label("min_lat"),
+            func.ST_XMax(extent).label("max_lon"),
+            func.ST_YMax(extent).label("max_lat"),
+        )
+        .where(Field.deletion_date.is_(None))
+        # The index narrows the candidates, the centroid test assigns each field to one tile
+        .where(Field.boundary.op("&&")(func.ST_MakeEnvelope(*bounds, 4326)))
+        .where(func.ST_X(centroid) >= west)
+        .where(func.ST_X(centroid) < east)
+        .where(func.ST_Y(centroid) >= south)
+        .where(func.ST_Y(centroid) < north)
+        .group_by(cell)
+    )
+
+    return [
+        {
+            "count": row.count,
+            "longitude": row.longitude,
+            "latitude": row.latitude,
+            "extent": (row.min_lon, row.min_lat, row.max_lon, row.max_lat),
+        }
+        for row in result.all()
+    ]
+
+
+@overload
 async def get_field(
-    field_id: UUID, db: AsyncSession, include_deleted: bool = False
-) -> Optional[Field]:
+    field_id: UUID,
+    db: AsyncSession,
+    include_deleted: bool = False,
+    include_archived: Literal[False] = False,
+) -> Field: ...
+
+
+@overload
+async def get_field(
+    field_id: UUID,
+    db: AsyncSession,
+    include_deleted: bool = False,
+    *,
+    include_archived: bool,
+) -> Field | FieldArchive: ...
+
+
+async def get_field(
+    field_id: UUID,
+    db: AsyncSession,
+    include_deleted: bool = False,
+    include_archived: bool = False,
+) -> Field | FieldArchive:
+    """
+    Get a field by ID. Archived fields are only looked up with `include_archived`,
+    for reading: they are not part of the `fields` table.
+    """
     query = select(Field).where(Field.id == field_id)
     if not include_deleted:
-        query = query.where(Field.deletion_date == None)
+        query = query.where(Field.deletion_date.is_(None))
 
-    db_field = (await db.scalars(query)).first()
+    db_field: Optional[Field | FieldArchive] = (await db.scalars(query)).first()
+    if db_field is None and include_archived:
+        db_field = await db.get(FieldArchive, field_id)
     if db_field is None:
         raise FieldNotFoundException(field_id=field_id)
     return db_field
 
 
-async def get_field_by_boundary(boundary: dict, db: AsyncSession) -> Optional[Field]:
-    # Convert GeoJSON boundary to WKT
-    boundary_wkt = conversion.validate_and_convert_geojson(boundary)
+async def get_fields_by_ids(
+    field_ids: list[UUID], db: AsyncSession, include_deleted: bool = False
+) -> list[Field]:
+    query = select(Field).where(Field.id.in_(field_ids))
+    if not include_deleted:
+        query = query.where(Field.deletion_date.is_(None))
+
+    return list((await db.scalars(query)).all())
 
-    boundary_geom = func.ST_SetSRID(func.ST_GeomFromText(boundary_wkt), 4326)
+
+async def get_field_by_boundary(
+    boundary: dict | CanonicalGeometry,
+    db: AsyncSession,
+    min_iou: Optional[float] = None,
+    max_hausdorff_meters: Optional[float] = None,
+) -> Optional[Field]:
+    """
+    Get the field with exactly the given boundary. With `min_iou` and/or `max_hausdorff_meters`,
+    an active field with a near-identical boundary is matched when there is no exact one:
+    the candidate with the highest intersection over union that meets every given threshold.
+    """
+    geometry = canonicalize(boundary)
+    region = geometry.to_sql()
 
     # Query the field that matches the given boundary
     result = await db.execute(
-        select(Field).where(func.ST_Equals(Field.boundary, boundary_geom))
+        select(Field).where(func.ST_Equals(Field.boundary, region))
+    )
+    field = result.scalar_one_or_none()
+    if field is not None or (min_iou is None and max_hausdorff_meters is None):
+        return field
+
+    # Degrees of longitude shrink towards the poles, scaled so both axes are in meters
+    _, south, _, north = geometry.bbox
+    lon_scale = math.cos(math.radians((south + north) / 2))
+    margin = (max_hausdorff_meters or 0) / METERS_PER_DEGREE
+
+    iou = func.ST_Area(func.ST_Intersection(Field.boundary, region)) / func.nullif(
+        func.ST_Area(func.ST_Union(Field.boundary, region)), 0
+    )
+    hausdorff_meters = (
+        func.ST_HausdorffDistance(
+            func.ST_Scale(Field.boundary, lon_scale, 1),
+            func.ST_Scale(region, lon_scale, 1),
+        )
+        * METERS_PER_DEGREE
+    )
+
+    conditions = []
+    if min_iou is not None:
+        conditions.append(iou >= min_iou)
+    if max_hausdorff_meters is not None:
+        conditions.append(hausdorff_meters <= max_hausdorff_meters)
+
+    result = await db.execute(
+        select(Field)
+        .where(Field.deletion_date.is_(None))
+        # The index narrows the candidates to boxes within the Hausdorff distance
+        .where(
+            Field.boundary.op("&&")(
+                func.ST_Expand(region, margin / max(lon_scale, 1e-6), margin)
+            )
+        )
+        .where(and_(*conditions))
+        .order_by(desc(iou))
+        .limit(1)
     )
 
     return result.scalar_one_or_none()
 
 
-async def create_field(field: FieldCreate, db: AsyncSession) -> Field:
-    # Validate and convert the boundary (GeoJSON) to WKTElement if provided
-    if field.boundary:
-        boundary_wkt = conversion.validate_and_convert_geojson(field.boundary)
-        field_wkt = WKTElement(boundary_wkt, srid=4326)
-    else:
-        field_wkt = None
+async def create_field(
+    field: FieldCreate,
+    db: AsyncSession,
+    geometry: Optional[CanonicalGeometry] = None,
+) -> Field:
+    """
+    Create a field. Callers that already canonicalized the boundary pass it as `geometry`.
+    """
+    # Validate the boundary (GeoJSON) if provided
+    if geometry is None and field.boundary:
+        geometry = canonicalize(field.boundary)
 
     # Prepare the field for the database
     db_field = Field(**field.model_dump())
 
-    # Assign WKTElement to the db_field's boundary attribute before saving
-    db_field.boundary = field_wkt  # type: ignore[assignment]
+    # Assign the geometry to the db_field's boundary attribute before saving
+    db_field.boundary = geometry.to_element() if geometry else None  # type: ignore[assignment]
 
     db.add(db_field)
-    await db.commit()
+    await _commit_field_changes(db, field_ids=[])
     await db.refresh(db_field)
 
     return db_field
 
 
 async def update_field(field_id: UUID, field: FieldUpdate, db: AsyncSession) -> Field:
+    # An archived field is moved back (as a deleted field) to be updated, like in batches
+    await _unarchive_fields(_id_in([field_id], FieldArchive.id), db=db)
     db_field = await get_field(field_id=field_id, db=db, include_deleted=True)
 
     if field.boundary:
-        boundary_wkt = conversion.validate_and_convert_geojson(field.boundary)
-        setattr(db_field, "boundary", WKTElement(boundary_wkt, srid=4326))
+        setattr(db_field, "boundary", canonicalize(field.boundary).to_element())
 
     field_data = field.model_dump(exclude_unset=True)
 
@@ -113,7 +410,7 @@ async def update_field(field_id: UUID, field: FieldUpdate, db: AsyncSession) ->
         if key != "boundary":  # Skip 'boundary' since it's already updated
             setattr(db_field, key, value)
 
-    await db.commit()
+    await _commit_field_changes(db, field_ids=[field_id])
     await db.refresh(db_field)
 
     return db_field
@@ -124,6 +421,147 @@ async def soft_delete_field(field_id: UUID, db: AsyncSession) -> Optional[Field]
 
     current_time = datetime.now()
     db_field.deletion_date = current_time  # type: ignore[assignment]
-    await db.commit()
+    await _commit_field_changes(db, field_ids=[field_id])
 
     return db_field
+
+
+def _id_in(field_ids: list[UUID], column=Field.id):
+    # One array parameter instead of one bind parameter per ID
+    return column == any_(
+        bindparam("field_ids", field_ids, type_=ARRAY(PG_UUID(as_uuid=True)))
+    )
+
+
+def _move_fields(source, target, where):
+    """INSERT ... SELECT of the rows that a DELETE ... RETURNING removes from `source`."""
+    moved = (
+        delete(source)
+        .where(where)
+        .returning(*(source.__table__.c[name] for name in FIELD_COLUMNS))
+        .cte("moved")
+    )
+    return insert(target).from_select(
+        FIELD_COLUMNS, select(*(moved.c[name] for name in FIELD_COLUMNS))
+    )
+
+
+async def archive_deleted_fields(
+    deleted_before: datetime, limit: int, db: AsyncSession
+) -> int:
+    """
+    Move up to `limit` fields deleted before `deleted_before` to `fields_archive` and commit.
+    Their NDVI statistics, time series and change scores are deleted with them.
+    Rows locked by concurrent writes are skipped. Returns the number of moved fields.
+    """
+    candidates = (
+        select(Field.id)
+        .where(Field.deletion_date < deleted_before)
+        .order_by(Field.deletion_date)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    # DML statements return a CursorResult, AsyncSession.execute is annotated with Result
+    result = cast(
+        CursorResult,
+        await db.execute(_move_fields(Field, FieldArchive, Field.id.in_(candidates))),
+    )
+    await db.commit()
+
+    # The fields keep their content, cached reads stay valid
+    return result.rowcount
+
+
+async def _unarchive_fields(where, db: AsyncSession) -> None:
+    # Part of the caller's transaction, archived fields come back as deleted fields
+    await db.execute(_move_fields(FieldArchive, Field, where))
+
+
+async def lock_fields(
+    field_ids: list[UUID], db: AsyncSession
+) -> dict[UUID, Optional[datetime]]:
+    """
+    Lock the existing fields among the IDs until the end of the transaction,
+    moving archived ones back to `fields` first.
+    Returns their deletion dates (None for active fields).
+    """
+    if not field_ids:
+        return {}
+
+    await _unarchive_fields(_id_in(field_ids, FieldArchive.id), db=db)
+
+    result = await db.execute(
+        select(Field.id, Field.deletion_date).where(_id_in(field_ids)).with_for_update()
+    )
+    return dict(result.tuples().all())
+
+
+async def apply_field_batch(
+    creates: list[dict[str, Any]],
+    updates: list[dict[str, Any]],
+    delete_ids: list[UUID],
+    restore_ids: list[UUID],
+    db: AsyncSession,
+) -> None:
+    """
+    Apply field mutations with set-based statements and commit them as one transaction.
+    Creates are complete rows including their `id`, updates hold the `id` and the changed columns.
+    """
+    # Chunked to stay below the bind parameter limit of the driver
+    for chunk_start in range(0, len(creates), INSERT_CHUNK_SIZE):
+        await db.execute(
+            insert(Field).values(creates[chunk_start : chunk_start + INSERT_CHUNK_SIZE])
+        )
+
+    # Bulk UPDATE by primary key, one executemany per set of changed columns
+    if updates:
+        await db.execute(update(Field), updates)
+
+    if delete_ids:
+        await db.execute(
+            update(Field).where(_id_in(delete_ids)).values(deletion_date=datetime.now())
+        )
+    if restore_ids:
+        await db.execute(
+            update(Field).where(_id_in(restore_ids)).values(deletion_date=None)
+        )
+
+    await _commit_field_changes(
+        db, field_ids=[values["id"] for values in updates] + delete_ids + restore_ids
+    )
+
+
+async def set_deleted_by_boundary(
+    boundary: dict | CanonicalGeometry,
+    deleted: bool,
+    db: AsyncSession,
+    predicate: Literal["within", "intersects"] = "within",
+) -> list[UUID]:
+    """
+    Soft-delete (or restore) all fields within or intersecting a boundary in one statement.
+    Returns the IDs of the changed fields.
+    """
+    region = canonicalize(boundary).to_sql()
+    spatial_predicate = func.ST_Within if predicate == "within" else func.ST_Intersects
+    spatial_filter = spatial_predicate(Field.boundary, region)
+
+    if not deleted:
+        await _unarchive_fields(spatial_predicate(FieldArchive.boundary, region), db=db)
+
+    statement = update(Field).where(spatial_filter)
+    if deleted:
+        statement = statement.where(Field.deletion_date.is_(None)).values(
+            deletion_date=datetime.now()
+        )
+    else:
+        statement = statement.where(Field.deletion_date.is_not(None)).values(
+            deletion_date=None
+        )
+
+    result = await db.execute(
+        statement.returning(Field.id).execution_options(synchronize_session=False)
+    )
+    field_ids = list(result.scalars().all())
+    await _commit_field_changes(db, field_ids=field_ids)
+
+    return field_ids
@@ -0,0 +1,56 @@
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.job import Job
+
+
+async def get_job(job_id: UUID, db: AsyncSession) -> Optional[Job]:
+    return await db.get(Job, job_id, populate_existing=True)
+
+
+async def get_or_create_job(
+    kind: str, key: str, params: dict[str, Any], db: AsyncSession
+) -> tuple[Job, bool]:
+    """
+    Return the job with the given key, creating it if there is none.
+    Returns the job and whether it was created.
+    """
+    result = await db.execute(
+        insert(Job)
+        .values(kind=kind, key=key, params=params, status="pending", progress=0)
+        .on_conflict_do_nothing(index_elements=[Job.key])
+        .returning(Job.id)
+    )
+    created_id = result.scalar_one_or_none()
+    await db.commit()
+
+    job = (
+        await db.execute(
+            select(Job).where(Job.key == key).execution_options(populate_existing=True)
+        )
+    ).scalar_one()
+    return job, created_id is not None
+
+
+async def update_job(job_id: UUID, db: AsyncSession, **values: Any) -> None:
+    await db.execute(update(Job).where(Job.id == job_id).values(**values))
+    await db.commit()
+
+
+async def restart_job(job_id: UUID, db: AsyncSession) -> None:
+    await update_job(
+        job_id,
+        db,
+        status="pending",
+        progress=0,
+        message=None,
+        result=None,
+        error=None,
+        creation_date=datetime.now(),
+        finished_at=None,
+    )
@@ -0,0 +1,130 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import select, func, desc
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from geoalchemy2 import WKTElement
+from shapely.geometry import shape
+
+from src.models.scene import Scene, SceneSync
+from src.utils.geometry import CanonicalGeometry, canonicalize
+
+INSERT_CHUNK_SIZE = 1000
+
+
+async def get_scenes(
+    db: AsyncSession,
+    collection: str,
+    boundary: Optional[dict] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    max_cloud: Optional[float] = None,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+):
+    queryset = (
+        select(Scene)
+        .where(Scene.collection == collection)
+        .order_by(desc(Scene.acquisition_time))
+    )
+
+    if boundary is not None:
+        boundary_geom = canonicalize(boundary).to_sql()
+
+        # ST_Intersects uses the GiST index on the footprint
+        queryset = queryset.where(func.ST_Intersects(Scene.footprint, boundary_geom))
+
+    if start is not None:
+        queryset = queryset.where(Scene.acquisition_time >= start)
+    if end is not None:
+        queryset = queryset.where(Scene.acquisition_time < end)
+    if max_cloud is not None:
+        queryset = queryset.where(Scene.cloudy_pixel_percentage < max_cloud)
+
+    total_query = select(func.count()).select_from(queryset.subquery())
+    total = await db.scalar(total_query)
+
+    if limit is not None and offset is not None:
+        queryset = queryset.limit(limit).offset(offset)
+
+    result = await db.execute(queryset)
+    scenes = result.scalars().all()
+
+    return scenes, total
+
+
+async def get_last_sync_time(
+    collection: str, boundary: dict | CanonicalGeometry, db: AsyncSession
+) -> Optional[datetime]:
+    boundary_geom = canonicalize(boundary).to_sql()
+
+    # The latest sync whose region fully covers the boundary
+    return await db.scalar(
+        select(SceneSync.synced_at)
+        .where(SceneSync.collection == collection)
+        .where(func.ST_Covers(SceneSync.region, boundary_geom))
+        .order_by(desc(SceneSync.synced_at))
+        .limit(1)
+    )
+
+
+async def create_scenes(
+    collection: str, scenes: list[dict[str, Any]], db: AsyncSession
+) -> int:
+    """
+    Insert scenes into the catalog, skipping the ones already known.
+    Returns the number of newly inserted scenes.
+    """
+    if not scenes:
+        return 0
+
+    rows = []
+    for scene in scenes:
+        footprint = shape(scene["footprint"])
+        if footprint.geom_type != "Polygon":
+            footprint = footprint.convex_hull
+
+        rows.append(
+            {
+                "collection": collection,
+                "scene_id": scene["scene_id"],
+                "tile": scene["tile"],
+                "acquisition_time": scene["acquisition_time"],
+                "cloudy_pixel_percentage": scene["cloudy_pixel_percentage"],
+                "footprint": WKTElement(footprint.wkt, srid=4326),
+            }
+        )
+
+    inserted = 0
+    # Chunked to stay below the bind parameter limit of the driver
+    for chunk_start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        result = await db.execute(
+            insert(Scene)
+            .values(rows[chunk_start : chunk_start + INSERT_CHUNK_SIZE])
+            .on_conflict_do_nothing(index_elements=[Scene.scene_id])
+            .returning(Scene.id)
+        )
+        inserted += len(result.all())
+    await db.commit()
+
+    return inserted
+
+
+async def create_sync(
+    collection: str,
+    boundary: dict | CanonicalGeometry,
+    synced_at: datetime,
+    db: AsyncSession,
+) -> SceneSync:
+    db_sync = SceneSync(
+        collection=collection,
+        region=canonicalize(boundary).to_element(),
+        synced_at=synced_at,
+    )
+
+    db.add(db_sync)
+    await db.commit()
+    await db.refresh(db_sync)
+
+    return db_sync
@@ -0,0 +1,72 @@
+from datetime import date
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.statistics import NdviStatistics
+
+INSERT_CHUNK_SIZE = 1000
+
+
+async def get_ndvi_statistics(
+    field_ids: list[UUID], date_start: date, date_end: date, db: AsyncSession
+) -> list[NdviStatistics]:
+    result = await db.scalars(
+        select(NdviStatistics)
+        .where(NdviStatistics.field_id.in_(field_ids))
+        .where(NdviStatistics.date_start == date_start)
+        .where(NdviStatistics.date_end == date_end)
+    )
+
+    return list(result.all())
+
+
+async def upsert_ndvi_statistics(
+    date_start: date,
+    date_end: date,
+    statistics: dict[UUID, dict[str, Any]],
+    db: AsyncSession,
+) -> None:
+    """Store NDVI statistics per field, replacing previous values for the same date range."""
+    rows = [
+        {
+            "field_id": field_id,
+            "date_start": date_start,
+            "date_end": date_end,
+            **values,
+        }
+        for field_id, values in statistics.items()
+    ]
+
+    # Chunked to stay below the bind parameter limit of the driver
+    for chunk_start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        statement = insert(NdviStatistics).values(
+            rows[chunk_start : chunk_start + INSERT_CHUNK_SIZE]
+        )
+        await db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[
+                    NdviStatistics.field_id,
+                    NdviStatistics.date_start,
+                    NdviStatistics.date_end,
+                ],
+                set_={
+                    column: statement.excluded[column]
+                    for column in (
+                        "mean",
+                        "median",
+                        "p10",
+                        "p25",
+                        "p75",
+                        "p90",
+                        "pixel_count",
+                        "histogram",
+                        "creation_date",
+                    )
+                },
+            )
+        )
+    await db.commit()
@@ -0,0 +1,106 @@
+from datetime import date, datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.time_series import NdviObservation, NdviTimeSeries
+
+INSERT_CHUNK_SIZE = 1000
+
+
+async def get_time_series_coverage(
+    field_id: UUID, db: AsyncSession
+) -> Optional[tuple[date, datetime]]:
+    """The date the stored series of a field is complete from and its last sync time."""
+    result = await db.execute(
+        select(NdviTimeSeries.covered_from, NdviTimeSeries.synced_at).where(
+            NdviTimeSeries.field_id == field_id
+        )
+    )
+
+    return result.tuples().one_or_none()
+
+
+async def get_latest_acquisition_time(
+    field_id: UUID, db: AsyncSession
+) -> Optional[datetime]:
+    return await db.scalar(
+        select(func.max(NdviObservation.acquisition_time)).where(
+            NdviObservation.field_id == field_id
+        )
+    )
+
+
+async def get_observations(
+    field_id: UUID,
+    db: AsyncSession,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> list[NdviObservation]:
+    query = (
+        select(NdviObservation)
+        .where(NdviObservation.field_id == field_id)
+        .order_by(NdviObservation.acquisition_time)
+    )
+    if start is not None:
+        query = query.where(NdviObservation.acquisition_time >= start)
+    if end is not None:
+        query = query.where(NdviObservation.acquisition_time < end)
+
+    return list((await db.scalars(query)).all())
+
+
+async def append_observations(
+    field_id: UUID,
+    observations: list[dict[str, Any]],
+    covered_from: date,
+    synced_at: datetime,
+    db: AsyncSession,
+) -> None:
+    """
+    Upsert observations of a field (scenes already stored are replaced) and
+    record how far the stored series reaches, in one transaction.
+    """
+    # An upsert cannot touch the same row twice, keep one observation per scene
+    rows = list(
+        {
+            observation["scene_id"]: {"field_id": field_id, **observation}
+            for observation in observations
+        }.values()
+    )
+
+    # Chunked to stay below the bind parameter limit of the driver
+    for chunk_start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        statement = insert(NdviObservation).values(
+            rows[chunk_start : chunk_start + INSERT_CHUNK_SIZE]
+        )
+        await db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[NdviObservation.field_id, NdviObservation.scene_id],
+                set_={
+                    column: statement.excluded[column]
+                    for column in (
+                        "acquisition_time",
+                        "ndvi_mean",
+                        "cloudy_pixel_percentage",
+                    )
+                },
+            )
+        )
+
+    statement = insert(NdviTimeSeries).values(
+        field_id=field_id, covered_from=covered_from, synced_at=synced_at
+    )
+    await db.execute(
+        statement.on_conflict_do_update(
+            index_elements=[NdviTimeSeries.field_id],
+            set_={
+                "covered_from": statement.excluded.covered_from,
+                "synced_at": statement.excluded.synced_at,
+            },
+        )
+    )
+    await db.commit()
@@ -0,0 +1,60 @@
+from datetime import datetime
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.weather import WeatherCacheEntry
+
+INSERT_CHUNK_SIZE = 1000
+
+
+async def get_cached_weather(
+    cells: list[str], db: AsyncSession, now: datetime
+) -> list[tuple[str, dict[str, Any], datetime]]:
+    """Cell, payload and expiry time of the unexpired cached weather of the grid cells."""
+    result = await db.execute(
+        select(
+            WeatherCacheEntry.cell,
+            WeatherCacheEntry.payload,
+            WeatherCacheEntry.expires_at,
+        )
+        .where(WeatherCacheEntry.cell.in_(cells))
+        .where(WeatherCacheEntry.expires_at > now)
+    )
+
+    return list(result.tuples().all())
+
+
+async def upsert_cached_weather(
+    entries: list[dict[str, Any]], db: AsyncSession
+) -> None:
+    """Store weather per grid cell, replacing previous entries of the same cells."""
+    # Chunked to stay below the bind parameter limit of the driver
+    for chunk_start in range(0, len(entries), INSERT_CHUNK_SIZE):
+        statement = insert(WeatherCacheEntry).values(
+            entries[chunk_start : chunk_start + INSERT_CHUNK_SIZE]
+        )
+        await db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[WeatherCacheEntry.cell],
+                set_={
+                    column: statement.excluded[column]
+                    for column in ("payload", "fetched_at", "expires_at")
+                },
+            )
+        )
+    await db.commit()
+
+
+async def delete_expired_weather(db: AsyncSession, now: datetime) -> int:
+    # DML statements return a CursorResult, AsyncSession.execute is annotated with Result
+    result = cast(
+        CursorResult,
+        await db.execute(
+            delete(WeatherCacheEntry).where(WeatherCacheEntry.expires_at <= now)
+        ),
+    )
+    await db.commit()
+    return result.rowcount
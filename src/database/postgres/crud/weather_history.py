@@ -0,0 +1,69 @@
+from datetime import date
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.weather_history import WeatherHistoryDay
+
+INSERT_CHUNK_SIZE = 1000
+
+HISTORY_COLUMNS = (
+    "temperature_max",
+    "temperature_min",
+    "temperature_mean",
+    "precipitation_sum",
+)
+
+
+async def get_coverage(
+    cells: list[str], db: AsyncSession
+) -> dict[str, tuple[date, date]]:
+    """First and last stored day per grid cell."""
+    result = await db.execute(
+        select(
+            WeatherHistoryDay.cell,
+            func.min(WeatherHistoryDay.date),
+            func.max(WeatherHistoryDay.date),
+        )
+        .where(WeatherHistoryDay.cell.in_(cells))
+        .group_by(WeatherHistoryDay.cell)
+    )
+
+    return {cell: (first, last) for cell, first, last in result.tuples().all()}
+
+
+async def get_days(
+    cells: list[str], date_start: date, date_end: date, db: AsyncSession
+) -> list[tuple]:
+    """Daily rows (cell, date, *HISTORY_COLUMNS) ordered by cell and date."""
+    result = await db.execute(
+        select(
+            WeatherHistoryDay.cell,
+            WeatherHistoryDay.date,
+            *(getattr(WeatherHistoryDay, column) for column in HISTORY_COLUMNS),
+        )
+        .where(WeatherHistoryDay.cell.in_(cells))
+        .where(WeatherHistoryDay.date >= date_start)
+        .where(WeatherHistoryDay.date <= date_end)
+        .order_by(WeatherHistoryDay.cell, WeatherHistoryDay.date)
+    )
+
+    return list(result.tuples().all())
+
+
+async def upsert_days(days: list[dict[str, Any]], db: AsyncSession) -> None:
+    """Store daily values, replacing provisional values of the same cell and day."""
+    # Chunked to stay below the bind parameter limit of the driver
+    for chunk_start in range(0, len(days), INSERT_CHUNK_SIZE):
+        statement = insert(WeatherHistoryDay).values(
+            days[chunk_start : chunk_start + INSERT_CHUNK_SIZE]
+        )
+        await db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[WeatherHistoryDay.cell, WeatherHistoryDay.date],
+                set_={column: statement.excluded[column] for column in HISTORY_COLUMNS},
+            )
+        )
+    await db.commit()
@@ -12,12 +12,16 @@ class PostgreSQLHandler(PostgreSQLCore):
     A subclass of PostgreSQLHandler to handle database queries.
     """
 
-    def __init__(self, db_url: URL = None, database: str = None) -> None:
+    def __init__(
+        self, db_url: URL = None, database: str = None, replica: bool = False
+    ) -> None:
         """
         Initializes the PostgreSQLCore with a database URL and connects to it.
 
         Args:
             db_url (str, optional): The database URL. Defaults to None.
             database (str, optional): The name of the database to connect to. Defaults to None.
+            replica (bool, optional): Connect to the read replica instead of the primary.
+                Defaults to False.
         """
-        super().__init__(db_url, database)
+        super().__init__(db_url, database, replica)
@@ -1,16 +1,40 @@
+import asyncio
 from logging import config, getLogger
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 
-from fastapi import FastAPI
-from fastapi.responses import RedirectResponse
+import ee
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi_pagination import add_pagination
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
+from src.api.common.compression import CompressionMiddleware
+from src.api.common.profiling import ProfilingMiddleware
+from src.api.common.timing import TimingMiddleware
+from src.api.routers.change import router as change_router
 from src.api.routers.field import router as field_router
+from src.api.routers.jobs import router as jobs_router
+from src.api.routers.ops import router as ops_router
+from src.api.routers.raster import router as raster_router
 from src.api.routers.satellite import router as satellite_router
+from src.api.routers.scene import router as scene_router
+from src.api.routers.statistics import router as statistics_router
+from src.api.routers.tiles import router as tiles_router
+from src.api.routers.time_series import router as time_series_router
 from src.api.routers.weather import router as weather_router
+from src.common.dependencies import close_replica
+from src.common.exceptions import GeeUnavailableException
+from src.config.base import settings
 from src.database.postgres.handler import PostgreSQLHandler as Database
+from src.services.change_scan import run_periodic_change_scan
+from src.services.field_archive import run_periodic_field_archival
+from src.services.field_events import listen_for_field_changes
+from src.services.google_earth import THUMBNAIL_URL_PREFIX
+from src.services import weather
+from src.services.jobs import cancel_jobs
+from src.utils import instrumentation
 
 FRONTEND_DIR = Path(__file__).resolve().parent.parent / "frontend"
 
@@ -34,9 +58,46 @@ async def lifespan(app: FastAPI):  # pylint: disable=W0621
     db_handler = Database()
     logger.info("Database Health-Check: %s", await db_handler.health_check())
 
+    await weather.open_client()
+
+    change_scan_task = (
+        asyncio.create_task(run_periodic_change_scan())
+        if settings.change_scan_enabled
+        else None
+    )
+    field_events_task = (
+        asyncio.create_task(listen_for_field_changes())
+        if settings.field_events_enabled
+        else None
+    )
+    field_archive_task = (
+        asyncio.create_task(run_periodic_field_archival())
+        if settings.field_archive_enabled
+        else None
+    )
+
     yield
 
     # shutdown-event
+    await cancel_jobs()
+
+    if change_scan_task:
+        change_scan_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await change_scan_task
+
+    if field_events_task:
+        field_events_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await field_events_task
+
+    if field_archive_task:
+        field_archive_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await field_archive_task
+
+    await weather.close_client()
+    await close_replica()
 
 
 def create_app() -> FastAPI:
@@ -52,9 +113,55 @@ def create_app() -> FastAPI:
 
     add_pagination(app)
 
+    if settings.profiling_enabled:
+        # Profiles expose code paths and timings, they are never served without a token
+        if not settings.profiling_token:
+            raise RuntimeError("profiling_enabled requires profiling_token to be set")
+        # Innermost, so the profiles show the request handling only
+        app.add_middleware(
+            ProfilingMiddleware,
+            directory=settings.profiling_dir,
+            token=settings.profiling_token,
+            sample_rate=settings.profiling_sample_rate,
+            interval=settings.profiling_interval_ms / 1000,
+            max_files=settings.profiling_max_files,
+            max_concurrent=settings.profiling_max_concurrent,
+        )
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        gzip_level=settings.compression_gzip_level,
+        brotli_quality=settings.compression_brotli_quality,
+    )
+    # Outermost, so the request duration includes the compression
+    app.add_middleware(TimingMiddleware, server_timing=settings.server_timing_enabled)
+    instrumentation.instrument_database()
+
     app.include_router(field_router, prefix="/api/v1")
     app.include_router(satellite_router, prefix="/api/v1")
+    app.include_router(scene_router, prefix="/api/v1")
+    app.include_router(raster_router, prefix="/api/v1")
+    app.include_router(tiles_router, prefix="/api/v1")
+    app.include_router(statistics_router, prefix="/api/v1")
+    app.include_router(time_series_router, prefix="/api/v1")
+    app.include_router(change_router, prefix="/api/v1")
     app.include_router(weather_router, prefix="/api/v1")
+    app.include_router(jobs_router, prefix="/api/v1")
+    app.include_router(ops_router, prefix="/api/v1")
+
+    @app.exception_handler(GeeUnavailableException)
+    async def gee_unavailable(_: Request, exc: GeeUnavailableException):
+        return JSONResponse(
+            status_code=503,
+            content={"detail": str(exc)},
+            headers={"Retry-After": str(max(1, round(exc.retry_after)))},
+        )
+
+    @app.exception_handler(ee.EEException)
+    async def gee_error(_: Request, exc: ee.EEException):
+        return JSONResponse(
+            status_code=502, content={"detail": f"Google Earth Engine error: {exc}"}
+        )
 
     @app.get("/", response_class=RedirectResponse, include_in_schema=False)
     async def index():
@@ -64,6 +171,20 @@ def create_app() -> FastAPI:
     async def docs():
         return RedirectResponse(url="/docs")
 
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        # Prometheus exposition of this process
+        return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+    if settings.thumbnail_tiling_enabled:
+        # Thumbnails rendered locally from tiles
+        Path(settings.thumbnail_dir).mkdir(parents=True, exist_ok=True)
+        app.mount(
+            THUMBNAIL_URL_PREFIX,
+            StaticFiles(directory=settings.thumbnail_dir),
+            name="thumbnails",
+        )
+
     if FRONTEND_DIR.exists():
         app.mount("/app", StaticFiles(directory=str(FRONTEND_DIR)), name="frontend")
 
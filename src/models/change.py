@@ -0,0 +1,23 @@
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.database.common.dependencies import BaseSQL
+
+
+class FieldChangeScore(BaseSQL):
+    __tablename__ = "field_change_scores"
+
+    field_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("fields.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+    ndvi_delta = Column(Float, nullable=True)
+    vv_delta = Column(Float, nullable=True)
+    score = Column(Float, nullable=False)
+    # Newest Sentinel-1/Sentinel-2 scene over the field at scan time
+    latest_scene_time = Column(DateTime, nullable=True)
+    scanned_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    __table_args__ = (Index("ix_field_change_scores_score", score.desc()),)
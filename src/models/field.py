@@ -1,11 +1,11 @@
-from sqlalchemy import Column, String, DateTime, func
+from sqlalchemy import Column, String, DateTime, Index, Integer, func, literal_column
 from geoalchemy2 import Geometry
 
 from src.database.common.dependencies import BaseSQL
 
 
-class Field(BaseSQL):
-    __tablename__ = "fields"
+class FieldColumns:
+    """Columns of a field, shared by the fields and the archive table."""
 
     boundary = Column(Geometry(geometry_type="POLYGON", srid=4326), nullable=False)
     image_url = Column(String, nullable=True)
@@ -14,3 +14,33 @@ class Field(BaseSQL):
     expiration_time = Column(DateTime, nullable=False, server_default=func.now())
     creation_date = Column(DateTime, nullable=False, server_default=func.now())
     deletion_date = Column(DateTime, nullable=True, default=None)
+    # HTTP cache validators, bumped by every UPDATE of the row
+    updated_at = Column(
+        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+    version = Column(
+        Integer,
+        nullable=False,
+        server_default="1",
+        onupdate=literal_column("version", Integer) + 1,
+    )
+
+
+class Field(FieldColumns, BaseSQL):
+    __tablename__ = "fields"
+    __table_args__ = (
+        # Lets the archival job find the deleted fields without scanning the active ones
+        Index(
+            "ix_fields_deletion_date",
+            "deletion_date",
+            postgresql_where=literal_column("deletion_date IS NOT NULL"),
+        ),
+    )
+
+
+class FieldArchive(FieldColumns, BaseSQL):
+    """Fields deleted longer than `field_archive_after_days`, moved out of `fields`."""
+
+    __tablename__ = "fields_archive"
+
+    archived_at = Column(DateTime, nullable=False, server_default=func.now())
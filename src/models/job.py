@@ -0,0 +1,20 @@
+from sqlalchemy import Column, DateTime, Float, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+
+from src.database.common.dependencies import BaseSQL
+
+
+class Job(BaseSQL):
+    __tablename__ = "jobs"
+
+    kind = Column(String, nullable=False)
+    # SHA-256 of the kind and the normalized parameters, identical jobs share it
+    key = Column(String(64), nullable=False, unique=True)
+    params = Column(JSONB, nullable=False)
+    status = Column(String, nullable=False, default="pending")
+    progress = Column(Float, nullable=False, default=0)
+    message = Column(String, nullable=True)
+    result = Column(JSONB, nullable=True)
+    error = Column(String, nullable=True)
+    creation_date = Column(DateTime, nullable=False, server_default=func.now())
+    finished_at = Column(DateTime, nullable=True)
@@ -0,0 +1,31 @@
+from sqlalchemy import Column, String, DateTime, Float, Index, func
+from geoalchemy2 import Geometry
+
+from src.database.common.dependencies import BaseSQL
+
+
+class Scene(BaseSQL):
+    __tablename__ = "scenes"
+
+    collection = Column(String, nullable=False)
+    scene_id = Column(String, nullable=False, unique=True)
+    # MGRS tile for Sentinel-2, relative orbit number for Sentinel-1
+    tile = Column(String, nullable=True)
+    acquisition_time = Column(DateTime, nullable=False)
+    cloudy_pixel_percentage = Column(Float, nullable=True)
+    footprint = Column(Geometry(geometry_type="POLYGON", srid=4326), nullable=False)
+    creation_date = Column(DateTime, nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        Index(
+            "ix_scenes_collection_acquisition_time", "collection", "acquisition_time"
+        ),
+    )
+
+
+class SceneSync(BaseSQL):
+    __tablename__ = "scene_syncs"
+
+    collection = Column(String, nullable=False)
+    region = Column(Geometry(geometry_type="POLYGON", srid=4326), nullable=False)
+    synced_at = Column(DateTime, nullable=False, server_default=func.now())
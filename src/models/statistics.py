@@ -0,0 +1,42 @@
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    func,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+
+from src.database.common.dependencies import BaseSQL
+
+
+class NdviStatistics(BaseSQL):
+    __tablename__ = "ndvi_statistics"
+
+    field_id = Column(
+        UUID(as_uuid=True), ForeignKey("fields.id", ondelete="CASCADE"), nullable=False
+    )
+    date_start = Column(Date, nullable=False)
+    date_end = Column(Date, nullable=False)
+    mean = Column(Float, nullable=True)
+    median = Column(Float, nullable=True)
+    p10 = Column(Float, nullable=True)
+    p25 = Column(Float, nullable=True)
+    p75 = Column(Float, nullable=True)
+    p90 = Column(Float, nullable=True)
+    pixel_count = Column(Integer, nullable=True)
+    histogram: Column[list[int]] = Column(ARRAY(Integer), nullable=True)
+    creation_date = Column(DateTime, nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        Index(
+            "ix_ndvi_statistics_field_id_dates",
+            "field_id",
+            "date_start",
+            "date_end",
+            unique=True,
+        ),
+    )
@@ -0,0 +1,45 @@
+from sqlalchemy import Column, Date, DateTime, Float, ForeignKey, Index, String, func
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.database.common.dependencies import BaseSQL
+
+
+class NdviObservation(BaseSQL):
+    __tablename__ = "ndvi_observations"
+
+    field_id = Column(
+        UUID(as_uuid=True), ForeignKey("fields.id", ondelete="CASCADE"), nullable=False
+    )
+    scene_id = Column(String, nullable=False)
+    acquisition_time = Column(DateTime, nullable=False)
+    ndvi_mean = Column(Float, nullable=False)
+    cloudy_pixel_percentage = Column(Float, nullable=True)
+    creation_date = Column(DateTime, nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        Index(
+            "ix_ndvi_observations_field_id_scene_id",
+            "field_id",
+            "scene_id",
+            unique=True,
+        ),
+        Index(
+            "ix_ndvi_observations_field_id_acquisition_time",
+            "field_id",
+            "acquisition_time",
+        ),
+    )
+
+
+class NdviTimeSeries(BaseSQL):
+    __tablename__ = "ndvi_time_series"
+
+    field_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("fields.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+    # Earliest date the stored observations of the field are complete from
+    covered_from = Column(Date, nullable=False)
+    synced_at = Column(DateTime, nullable=False, server_default=func.now())
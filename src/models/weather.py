@@ -0,0 +1,16 @@
+from sqlalchemy import Column, DateTime, Float, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+
+from src.database.common.dependencies import BaseSQL
+
+
+class WeatherCacheEntry(BaseSQL):
+    __tablename__ = "weather_cache"
+
+    # Grid cell of the snapped coordinates, e.g. "50.45,30.52"
+    cell = Column(String, nullable=False, unique=True)
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+    payload = Column(JSONB, nullable=False)
+    fetched_at = Column(DateTime, nullable=False, server_default=func.now())
+    expires_at = Column(DateTime, nullable=False, index=True)
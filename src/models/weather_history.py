@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Date, Float, Index, String
+
+from src.database.common.dependencies import BaseSQL
+
+
+class WeatherHistoryDay(BaseSQL):
+    __tablename__ = "weather_history"
+
+    # Grid cell of the snapped coordinates, e.g. "50.4,30.5"
+    cell = Column(String, nullable=False)
+    date = Column(Date, nullable=False)
+    temperature_max = Column(Float(precision=24), nullable=True)
+    temperature_min = Column(Float(precision=24), nullable=True)
+    temperature_mean = Column(Float(precision=24), nullable=True)
+    precipitation_sum = Column(Float(precision=24), nullable=True)
+
+    __table_args__ = (
+        Index("ix_weather_history_cell_date", "cell", "date", unique=True),
+    )
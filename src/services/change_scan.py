@@ -0,0 +1,184 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Any, Optional
+from uuid import UUID
+
+from geoalchemy2.shape import to_shape
+from shapely.geometry import mapping
+from sqlalchemy import func, select
+
+from src.config.base import settings
+from src.database.postgres.crud import change as crud_change
+from src.database.postgres.crud import field as crud_field
+from src.database.postgres.handler import PostgreSQLHandler as DatabaseHandler
+from src.services.google_earth import (
+    NDVI_DIFF_VIS,
+    SAR_DIFF_VIS,
+    get_change_deltas,
+    get_latest_scene_times,
+)
+
+logger = logging.getLogger(__name__)
+
+# Prevents the periodic scan and a manually triggered one from overlapping
+scan_lock = asyncio.Lock()
+# Key of the advisory lock that keeps the scans of several workers from overlapping
+SCAN_ADVISORY_LOCK_KEY = 7_302_026
+
+
+def compute_change_score(
+    ndvi_delta: Optional[float], vv_delta: Optional[float]
+) -> float:
+    """
+    Combine both deltas into one score, each scaled by the range of its difference palette,
+    so that a full-scale NDVI change weighs the same as a full-scale VV change.
+    """
+    score = 0.0
+    if ndvi_delta is not None:
+        score += abs(ndvi_delta) / NDVI_DIFF_VIS["max"]
+    if vv_delta is not None:
+        score += abs(vv_delta) / SAR_DIFF_VIS["max"]
+    return score
+
+
+def _scan_chunk(
+    boundaries: dict[str, dict],
+    scanned_scene_times: dict[str, Optional[datetime]],
+    recent_start: date,
+    recent_end: date,
+) -> list[dict[str, Any]]:
+    """
+    Scan one chunk of fields: skip the ones without new scenes since their last scan,
+    then compute the deltas of the rest in one server-side reduction.
+    """
+    latest_times = get_latest_scene_times(boundaries)
+
+    changed = {
+        key: boundary
+        for key, boundary in boundaries.items()
+        if latest_times.get(key) is not None
+        and (
+            scanned_scene_times.get(key) is None
+            or latest_times[key] > scanned_scene_times[key]
+        )
+    }
+    if not changed:
+        return []
+
+    deltas = get_change_deltas(
+        changed,
+        baseline_start=settings.change_scan_baseline_start,
+        baseline_end=settings.change_scan_baseline_end,
+        recent_start=recent_start,
+        recent_end=recent_end,
+    )
+
+    scanned_at = datetime.now()
+    return [
+        {
+            "field_id": UUID(key),
+            "ndvi_delta": values["ndvi_delta"],
+            "vv_delta": values["vv_delta"],
+            "score": compute_change_score(values["ndvi_delta"], values["vv_delta"]),
+            "latest_scene_time": latest_times[key],
+            "scanned_at": scanned_at,
+        }
+        for key, values in deltas.items()
+    ]
+
+
+async def _scan_fields(db_handler: DatabaseHandler) -> int:
+    async with db_handler.session_factory() as db:
+        fields, _ = await crud_field.get_fields(db=db)
+        scanned_scene_times = await crud_change.get_latest_scene_times(db=db)
+
+        boundaries = {
+            str(field.id): mapping(to_shape(field.boundary)) for field in fields
+        }
+        keys = list(boundaries)
+        chunk_size = settings.change_scan_chunk_size
+
+        recent_end = date.today()
+        recent_start = recent_end - timedelta(days=settings.change_scan_recent_days)
+
+        loop = asyncio.get_running_loop()
+        updated = 0
+
+        with ThreadPoolExecutor(max_workers=settings.change_scan_workers) as pool:
+            chunks = [
+                loop.run_in_executor(
+                    pool,
+                    _scan_chunk,
+                    {key: boundaries[key] for key in chunk_keys},
+                    {key: scanned_scene_times.get(UUID(key)) for key in chunk_keys},
+                    recent_start,
+                    recent_end,
+                )
+                for chunk_keys in (
+                    keys[start : start + chunk_size]
+                    for start in range(0, len(keys), chunk_size)
+                )
+            ]
+
+            for chunk in asyncio.as_completed(chunks):
+                try:
+                    scores = await chunk
+                except Exception as exc:  # pylint: disable=W0718
+                    logger.error("Change scan chunk failed: %s", exc)
+                    continue
+
+                await crud_change.upsert_change_scores(scores=scores, db=db)
+                updated += len(scores)
+
+    logger.info("Change scan updated %s of %s fields", updated, len(keys))
+    return updated
+
+
+async def run_change_scan() -> Optional[int]:
+    """
+    Scan all active fields for NDVI and SAR VV changes against the baseline period.
+
+    Fields are processed in chunks of `change_scan_chunk_size` on a pool of
+    `change_scan_workers` threads. Only fields with scenes newer than their last
+    scan are recomputed. One scan runs at a time: `scan_lock` within the process and a
+    PostgreSQL advisory lock across workers, a scan started while another one runs
+    is skipped. Returns the number of fields whose score was updated, or `None` if skipped.
+    """
+    # Nothing is awaited between the check and the acquisition, so this cannot race
+    if scan_lock.locked():
+        logger.info("Change scan skipped, a scan is already running")
+        return None
+
+    async with scan_lock:
+        db_handler = DatabaseHandler()
+        try:
+            # The advisory lock belongs to this connection until it is released
+            async with db_handler.engine.connect() as lock_connection:
+                acquired = await lock_connection.scalar(
+                    select(func.pg_try_advisory_lock(SCAN_ADVISORY_LOCK_KEY))
+                )
+                if not acquired:
+                    logger.info("Change scan skipped, another worker is scanning")
+                    return None
+
+                try:
+                    return await _scan_fields(db_handler)
+                finally:
+                    await lock_connection.scalar(
+                        select(func.pg_advisory_unlock(SCAN_ADVISORY_LOCK_KEY))
+                    )
+        finally:
+            await db_handler.engine.dispose()
+
+
+async def run_periodic_change_scan() -> None:
+    """Run the change scan every `change_scan_interval_minutes` until cancelled."""
+    while True:
+        try:
+            await run_change_scan()
+        except Exception as exc:  # pylint: disable=W0718
+            logger.error("Change scan failed: %s", exc)
+
+        await asyncio.sleep(settings.change_scan_interval_minutes * 60)
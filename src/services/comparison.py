@@ -0,0 +1,131 @@
+from datetime import datetime
+from typing import Callable
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.schemas.field import FieldCreate, FieldUpdate
+from src.api.schemas.ndvi_comparison import NdviComparisonRequest
+from src.api.schemas.sar import SarChangeRequest
+from src.database.postgres.crud import field as crud_field
+from src.models.field import Field
+from src.services import field_matching
+from src.services.google_earth import (
+    SENTINEL_1_COLLECTION,
+    THUMBNAIL_URL_TTL,
+    get_ndvi_comparison,
+    get_sar_change_detection,
+)
+from src.services.scene_catalog import resolve_scene_ids
+from src.utils.geometry import canonicalize
+
+# Progress callback: fraction done in [0, 1] and a short message
+ProgressCallback = Callable[[float, str], None]
+
+
+def _ignore_progress(progress: float, message: str) -> None:
+    pass
+
+
+async def compare_ndvi(
+    request: NdviComparisonRequest,
+    db: AsyncSession,
+    report: ProgressCallback = _ignore_progress,
+) -> dict[str, str]:
+    """Render NDVI before/after/difference thumbnails for two periods of a boundary."""
+    report(0.05, "Resolving scenes")
+    scene_ids_before = await resolve_scene_ids(
+        boundary=request.boundary,
+        start=request.date_before_start,
+        end=request.date_before_end,
+        max_cloud=20,
+        db=db,
+    )
+    scene_ids_after = await resolve_scene_ids(
+        boundary=request.boundary,
+        start=request.date_after_start,
+        end=request.date_after_end,
+        max_cloud=20,
+        db=db,
+    )
+
+    report(0.2, "Computing NDVI composites and thumbnails")
+    result = await run_in_threadpool(
+        get_ndvi_comparison,
+        boundary=request.boundary,
+        date_before_start=request.date_before_start,
+        date_before_end=request.date_before_end,
+        date_after_start=request.date_after_start,
+        date_after_end=request.date_after_end,
+        scene_ids_before=scene_ids_before,
+        scene_ids_after=scene_ids_after,
+    )
+
+    report(1.0, "Done")
+    return result
+
+
+async def detect_sar_change(
+    request: SarChangeRequest,
+    db: AsyncSession,
+    report: ProgressCallback = _ignore_progress,
+) -> Field:
+    """
+    Render the SAR VV change thumbnail for two periods of a boundary
+    and store it on the field of the boundary (created if missing).
+    """
+    report(0.05, "Resolving scenes")
+    scene_ids_before = await resolve_scene_ids(
+        boundary=request.boundary,
+        start=request.date_before_start,
+        end=request.date_before_end,
+        collection=SENTINEL_1_COLLECTION,
+        db=db,
+    )
+    scene_ids_after = await resolve_scene_ids(
+        boundary=request.boundary,
+        start=request.date_after_start,
+        end=request.date_after_end,
+        collection=SENTINEL_1_COLLECTION,
+        db=db,
+    )
+
+    report(0.2, "Computing SAR composites and thumbnail")
+    sar_url = await run_in_threadpool(
+        get_sar_change_detection,
+        boundary=request.boundary,
+        date_before_start=request.date_before_start,
+        date_before_end=request.date_before_end,
+        date_after_start=request.date_after_start,
+        date_after_end=request.date_after_end,
+        scene_ids_before=scene_ids_before,
+        scene_ids_after=scene_ids_after,
+    )
+
+    report(0.9, "Saving field")
+    geometry = canonicalize(request.boundary)
+    existing_field = await field_matching.get_matching_field(geometry=geometry, db=db)
+    current_time = datetime.now()
+
+    if existing_field:
+        field = await crud_field.update_field(
+            field_id=existing_field.id,  # type: ignore[arg-type]
+            field=FieldUpdate(
+                sar_change_url=sar_url,
+                expiration_time=current_time + THUMBNAIL_URL_TTL,
+            ),
+            db=db,
+        )
+    else:
+        field = await crud_field.create_field(
+            FieldCreate(
+                boundary=request.boundary,
+                sar_change_url=sar_url,
+                expiration_time=current_time + THUMBNAIL_URL_TTL,
+            ),
+            db=db,
+            geometry=geometry,
+        )
+
+    report(1.0, "Done")
+    return field
@@ -0,0 +1,47 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from src.config.base import settings
+from src.database.postgres.crud import field as crud_field
+from src.database.postgres.handler import PostgreSQLHandler as DatabaseHandler
+
+logger = logging.getLogger(__name__)
+
+
+async def run_field_archival() -> int:
+    """
+    Move the fields deleted more than `field_archive_after_days` ago to `fields_archive`,
+    `field_archive_batch_size` per transaction. Returns the number of moved fields.
+    """
+    deleted_before = datetime.now() - timedelta(days=settings.field_archive_after_days)
+    db_handler = DatabaseHandler()
+    archived = 0
+    try:
+        async with db_handler.session_factory() as db:
+            while True:
+                moved = await crud_field.archive_deleted_fields(
+                    deleted_before=deleted_before,
+                    limit=settings.field_archive_batch_size,
+                    db=db,
+                )
+                archived += moved
+                if moved < settings.field_archive_batch_size:
+                    break
+    finally:
+        await db_handler.engine.dispose()
+
+    if archived:
+        logger.info("Archived %d deleted fields", archived)
+    return archived
+
+
+async def run_periodic_field_archival() -> None:
+    """Run the field archival every `field_archive_interval_minutes` until cancelled."""
+    while True:
+        try:
+            await run_field_archival()
+        except Exception as exc:  # pylint: disable=W0718
+            logger.error("Field archival failed: %s", exc)
+
+        await asyncio.sleep(settings.field_archive_interval_minutes * 60)
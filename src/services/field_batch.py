@@ -0,0 +1,147 @@
+import uuid
+from collections import Counter
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.schemas.field import (
+    FieldBatchRequest,
+    FieldCreateOperation,
+    FieldDeleteOperation,
+    FieldRestoreOperation,
+    FieldUpdateOperation,
+)
+from src.common.exceptions import (
+    FieldNotFoundException,
+    InvalidGeoJSONException,
+    SelfIntersectionException,
+)
+from src.database.postgres.crud import field as crud_field
+from src.utils.geometry import canonicalize
+
+
+def _failed(op: str, field_id: Any, error: str) -> dict[str, Any]:
+    return {"op": op, "id": field_id, "status": "failed", "error": error}
+
+
+async def apply_field_batch(
+    request: FieldBatchRequest, db: AsyncSession
+) -> list[dict[str, Any]]:
+    """
+    Validate a batch of field operations and apply the valid ones in one transaction.
+
+    Referenced fields are locked while the batch is validated, so the results stay correct
+    under concurrent batches. A field may be referenced by one operation per batch.
+    With `atomic`, a single failed operation skips the whole batch.
+
+    Returns:
+        list: One result per operation, in order.
+    """
+    referenced = Counter(
+        operation.id
+        for operation in request.operations
+        if not isinstance(operation, FieldCreateOperation)
+    )
+    existing = await crud_field.lock_fields(field_ids=list(referenced), db=db)
+
+    results: list[dict[str, Any]] = []
+    creates: list[dict[str, Any]] = []
+    updates: list[dict[str, Any]] = []
+    delete_ids = []
+    restore_ids = []
+
+    for operation in request.operations:
+        if isinstance(operation, FieldCreateOperation):
+            try:
+                geometry = canonicalize(operation.field.boundary)
+            except (InvalidGeoJSONException, SelfIntersectionException) as e:
+                results.append(_failed(operation.op, None, str(e)))
+                continue
+
+            field_id = uuid.uuid4()
+            creates.append(
+                {
+                    "id": field_id,
+                    "boundary": geometry.to_element(),
+                    "image_url": operation.field.image_url,
+                    "ndvi_url": operation.field.ndvi_url,
+                    "sar_change_url": operation.field.sar_change_url,
+                    "expiration_time": operation.field.expiration_time or func.now(),
+                }
+            )
+            results.append({"op": operation.op, "id": field_id, "status": "applied"})
+            continue
+
+        field_id = operation.id
+        if referenced[field_id] > 1:
+            results.append(
+                _failed(
+                    operation.op,
+                    field_id,
+                    f"Field with ID {field_id} is referenced more than once in the batch",
+                )
+            )
+            continue
+
+        if field_id not in existing or (
+            isinstance(operation, FieldDeleteOperation)
+            and existing[field_id] is not None
+        ):
+            results.append(
+                _failed(operation.op, field_id, str(FieldNotFoundException(field_id)))
+            )
+            continue
+
+        if isinstance(operation, FieldUpdateOperation):
+            values = operation.field.model_dump(exclude_unset=True)
+            if operation.field.boundary:
+                try:
+                    values["boundary"] = canonicalize(
+                        operation.field.boundary
+                    ).to_element()
+                except (InvalidGeoJSONException, SelfIntersectionException) as e:
+                    results.append(_failed(operation.op, field_id, str(e)))
+                    continue
+            else:
+                values.pop("boundary", None)
+            if values.get("expiration_time", True) is None:
+                # The column is not nullable, None keeps the current value
+                del values["expiration_time"]
+
+            if values:
+                updates.append({"id": field_id, **values})
+        elif isinstance(operation, FieldDeleteOperation):
+            delete_ids.append(field_id)
+        elif isinstance(operation, FieldRestoreOperation):
+            if existing[field_id] is None:
+                results.append(
+                    _failed(
+                        operation.op,
+                        field_id,
+                        f"Field with ID {field_id} is not deleted",
+                    )
+                )
+                continue
+            restore_ids.append(field_id)
+
+        results.append({"op": operation.op, "id": field_id, "status": "applied"})
+
+    if request.atomic and any(result["status"] == "failed" for result in results):
+        # Releases the row locks
+        await db.rollback()
+        for result in results:
+            if result["status"] == "applied":
+                result["status"] = "skipped"
+                if result["op"] == "create":
+                    result["id"] = None
+        return results
+
+    await crud_field.apply_field_batch(
+        creates=creates,
+        updates=updates,
+        delete_ids=delete_ids,
+        restore_ids=restore_ids,
+        db=db,
+    )
+    return results
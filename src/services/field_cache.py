@@ -0,0 +1,60 @@
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.schemas.field import FieldRead
+from src.common.exceptions import FieldNotFoundException
+from src.config.base import settings
+from src.database.postgres.crud import field as crud_field
+from src.utils import instrumentation
+from src.utils.cache import TTLCache
+
+# Serialized fields by ID, deleted ones included. Invalidated on field writes of every
+# process (see field_events), the TTL bounds staleness if change events are missed.
+fields = TTLCache(
+    maxsize=settings.field_cache_size, ttl=settings.field_cache_ttl_seconds
+)
+instrumentation.register_cache("field", fields.stats)
+
+
+def _invalidate(field_ids: Optional[list[UUID]]) -> None:
+    if field_ids is None:
+        fields.clear()
+        return
+    for field_id in field_ids:
+        fields.pop(field_id)
+
+
+crud_field.on_fields_changed(_invalidate)
+
+
+async def get_field(
+    field_id: UUID, db: AsyncSession, include_deleted: bool = False
+) -> FieldRead:
+    """
+    Get a field by ID, from the cache when possible. Pass a session of the primary,
+    a lagging replica could cache a field as it was before the write that invalidated it.
+
+    Raises:
+        FieldNotFoundException: If the field does not exist, or is deleted and
+            `include_deleted` is not set.
+    """
+    field: Optional[FieldRead] = fields.get(field_id)
+    if field is None:
+        # A read that raced a write is not cached
+        generation = fields.generation
+        field = FieldRead.model_validate(
+            await crud_field.get_field(
+                field_id=field_id, db=db, include_deleted=True, include_archived=True
+            )
+        )
+        fields.set(field_id, field, generation=generation)
+
+    if field.deletion_date is not None and not include_deleted:
+        raise FieldNotFoundException(field_id=field_id)
+    return field
+
+
+def get_cache_stats() -> dict[str, int]:
+    return fields.stats()
@@ -0,0 +1,35 @@
+from typing import Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.base import settings
+from src.database.postgres.crud import field as crud_field
+from src.services.map_tiles import tile_bounds
+from src.utils import instrumentation
+from src.utils.cache import TTLCache
+
+# Per XYZ tile key, cleared on every field write
+clusters = TTLCache(
+    maxsize=settings.field_cluster_cache_size,
+    ttl=settings.field_cluster_cache_ttl_seconds,
+)
+crud_field.on_fields_changed(lambda _: clusters.clear())
+instrumentation.register_cache("field_clusters", clusters.stats)
+
+
+async def get_tile_clusters(
+    z: int, x: int, y: int, db: AsyncSession
+) -> list[dict[str, Any]]:
+    """Clusters of the active fields whose centroid lies in an XYZ tile, cached per tile."""
+    key = (z, x, y)
+    tile_clusters: Optional[list[dict[str, Any]]] = clusters.get(key)
+    if tile_clusters is None:
+        # A write during the query clears the cache, the stale tile is then not stored
+        generation = clusters.generation
+        tile_clusters = await crud_field.get_field_clusters(
+            bounds=tile_bounds(z, x, y),
+            grid_cells=settings.field_cluster_grid_cells,
+            db=db,
+        )
+        clusters.set(key, tile_clusters, generation=generation)
+    return tile_clusters
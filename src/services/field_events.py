@@ -0,0 +1,65 @@
+import asyncio
+import json
+import logging
+from uuid import UUID
+
+import asyncpg
+
+from src.config.base import settings
+from src.database.postgres.crud import field as crud_field
+from src.database.postgres.handler import PostgreSQLHandler as DatabaseHandler
+
+logger = logging.getLogger(__name__)
+
+
+def _on_notification(
+    _connection: asyncpg.Connection, _pid: int, _channel: str, payload: str
+) -> None:
+    try:
+        message = json.loads(payload)
+        if message["origin"] == crud_field.PROCESS_TOKEN:
+            return
+        field_ids = (
+            None
+            if message["ids"] is None
+            else [UUID(field_id) for field_id in message["ids"]]
+        )
+    except (ValueError, KeyError, TypeError):
+        # Unknown payload, any field may have changed
+        field_ids = None
+
+    crud_field.fields_changed(field_ids)
+
+
+async def listen_for_field_changes() -> None:
+    """
+    Apply the field writes of other processes to the local caches until cancelled,
+    by listening to the NOTIFY events sent with every field write.
+    Reconnects after a lost connection.
+    """
+    dsn = (
+        DatabaseHandler()
+        .db_url.set(drivername="postgresql")
+        .render_as_string(hide_password=False)
+    )
+
+    while True:
+        connection = None
+        try:
+            connection = await asyncpg.connect(dsn)
+            closed = asyncio.Event()
+            connection.add_termination_listener(lambda _: closed.set())
+            await connection.add_listener(
+                crud_field.FIELDS_CHANGED_CHANNEL, _on_notification
+            )
+            # Events may have been missed while disconnected
+            crud_field.fields_changed(None)
+            await closed.wait()
+            logger.warning("Field change listener lost its connection")
+        except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) as exc:
+            logger.warning("Field change listener failed: %s", exc)
+        finally:
+            if connection is not None:
+                await connection.close()
+
+        await asyncio.sleep(settings.field_events_reconnect_seconds)
@@ -0,0 +1,26 @@
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.base import settings
+from src.database.postgres.crud import field as crud_field
+from src.models.field import Field
+from src.utils.geometry import CanonicalGeometry
+
+
+async def get_matching_field(
+    geometry: CanonicalGeometry, db: AsyncSession
+) -> Optional[Field]:
+    """
+    Get the field for a boundary. Hand-drawn boundaries rarely repeat exactly, so when
+    enabled a near-identical field is reused with its imagery instead of creating a new one.
+    """
+    if not settings.boundary_match_enabled:
+        return await crud_field.get_field_by_boundary(boundary=geometry, db=db)
+
+    return await crud_field.get_field_by_boundary(
+        boundary=geometry,
+        db=db,
+        min_iou=settings.boundary_match_min_iou,
+        max_hausdorff_meters=settings.boundary_match_max_hausdorff_meters,
+    )
@@ -0,0 +1,35 @@
+from typing import Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.base import settings
+from src.database.postgres.crud import field as crud_field
+from src.utils import instrumentation
+from src.utils.cache import TTLCache
+
+# Cleared on every field write, the TTL bounds staleness if change events are missed
+summaries = TTLCache(
+    maxsize=settings.field_summary_cache_size,
+    ttl=settings.field_summary_cache_ttl_seconds,
+)
+crud_field.on_fields_changed(lambda _: summaries.clear())
+instrumentation.register_cache("field_summary", summaries.stats)
+
+
+async def get_fields_summary(
+    db: AsyncSession,
+    boundary: Optional[str] = None,
+    filter_by: Optional[str] = None,
+    bbox: Optional[tuple[float, float, float, float]] = None,
+) -> dict[str, Any]:
+    """Portfolio totals of the matching fields, computed by one aggregate query and cached."""
+    key = (boundary, filter_by, bbox)
+    summary: Optional[dict[str, Any]] = summaries.get(key)
+    if summary is None:
+        # A write during the query clears the cache, the stale summary is then not stored
+        generation = summaries.generation
+        summary = await crud_field.get_fields_summary(
+            db=db, boundary=boundary, filter_by=filter_by, bbox=bbox
+        )
+        summaries.set(key, summary, generation=generation)
+    return summary
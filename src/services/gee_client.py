@@ -0,0 +1,278 @@
+import functools
+import random
+import socket
+import threading
+import time
+from logging import getLogger
+from typing import Any, Callable, Optional, TypeVar, overload
+
+import ee
+import requests
+
+from src.common.exceptions import GeeUnavailableException
+from src.config.base import settings
+from src.utils import instrumentation
+
+logger = getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Substrings of EE error messages worth retrying: quota, concurrency and transient server errors
+RETRYABLE_MESSAGES = (
+    "too many",
+    "rate limit",
+    "quota",
+    "timed out",
+    "timeout",
+    "deadline",
+    "internal error",
+    "service unavailable",
+    "backend error",
+    "connection",
+)
+
+
+def is_retryable(error: Exception) -> bool:
+    if isinstance(error, (requests.ConnectionError, requests.Timeout, socket.timeout)):
+        return True
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    if isinstance(error, ee.EEException):
+        message = str(error).lower()
+        return any(fragment in message for fragment in RETRYABLE_MESSAGES)
+    return False
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at `rate` tokens per second."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def acquire(self, tokens: float = 1, timeout: float = 0) -> float:
+        """
+        Take tokens from the bucket, waiting up to `timeout` seconds for them.
+        Returns the time waited, or -1 if the tokens were not available in time.
+        """
+        started_at = time.monotonic()
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return time.monotonic() - started_at
+                wait = (tokens - self._tokens) / self.rate
+
+            if time.monotonic() - started_at + wait > timeout:
+                return -1
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and rejects calls for `reset_timeout`
+    seconds. Then a single trial call is let through (half-open): success closes the circuit,
+    failure opens it again. A trial call that never reached GEE is released, so that the
+    next call becomes the trial.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_thread: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def retry_after(self) -> float:
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and self.retry_after() == 0:
+                self.state = self.HALF_OPEN
+                self._trial_thread = threading.get_ident()
+                return True
+            return False
+
+    def release(self) -> None:
+        """Give back the trial call of the current thread without a result."""
+        with self._lock:
+            if (
+                self.state == self.HALF_OPEN
+                and self._trial_thread == threading.get_ident()
+            ):
+                self.state = self.OPEN
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> bool:
+        """Returns True if this failure opened the circuit."""
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or (
+                self.state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                return True
+            return False
+
+
+class GeeClient:
+    """
+    Runs GEE calls through a quota token bucket and a circuit breaker,
+    retrying retryable errors with jittered exponential backoff.
+    """
+
+    def __init__(self):
+        self.bucket = TokenBucket(
+            rate=settings.gee_requests_per_second, capacity=settings.gee_burst
+        )
+        self.breaker = CircuitBreaker(
+            failure_threshold=settings.gee_circuit_failure_threshold,
+            reset_timeout=settings.gee_circuit_reset_seconds,
+        )
+        self.metrics: dict[str, float] = {
+            "calls": 0,
+            "failures": 0,
+            "retries": 0,
+            "circuit_opened": 0,
+            "circuit_rejected": 0,
+            "rate_limited": 0,
+            "queue_wait_seconds_total": 0.0,
+            "queue_wait_seconds_max": 0.0,
+        }
+        self._metrics_lock = threading.Lock()
+        self._local = threading.local()
+
+    def _count(self, name: str, value: float = 1) -> None:
+        with self._metrics_lock:
+            self.metrics[name] += value
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter: uniform between 0 and the capped exponential delay
+        delay = min(
+            settings.gee_backoff_max_seconds,
+            settings.gee_backoff_base_seconds * 2**attempt,
+        )
+        return random.uniform(0, delay)
+
+    def call(self, func: Callable[..., Any], *args, cost: int = 1, **kwargs) -> Any:
+        """
+        Call `func` with resilience applied.
+
+        Raises:
+            GeeUnavailableException: If the circuit is open, the quota wait times out
+                or retryable errors persist after all retries.
+        """
+        # Nested calls (e.g. a thumbnail inside a comparison) run under the outer call
+        if getattr(self._local, "active", False):
+            return func(*args, **kwargs)
+
+        if not self.breaker.allow():
+            self._count("circuit_rejected")
+            raise GeeUnavailableException(retry_after=self.breaker.retry_after())
+
+        waited = self.bucket.acquire(cost, timeout=settings.gee_max_queue_wait_seconds)
+        if waited < 0:
+            # Not a GEE failure, but a trial call must not leave the circuit half-open
+            self.breaker.release()
+            self._count("rate_limited")
+            raise GeeUnavailableException(retry_after=cost / self.bucket.rate)
+
+        with self._metrics_lock:
+            self.metrics["calls"] += 1
+            self.metrics["queue_wait_seconds_total"] += waited
+            self.metrics["queue_wait_seconds_max"] = max(
+                self.metrics["queue_wait_seconds_max"], waited
+            )
+
+        self._local.active = True
+        try:
+            for attempt in range(settings.gee_max_retries + 1):
+                try:
+                    result = func(*args, **kwargs)
+                except Exception as e:  # pylint: disable=W0718
+                    if not is_retryable(e):
+                        # The request itself is wrong, GEE is healthy
+                        self.breaker.record_success()
+                        self._count("failures")
+                        raise
+
+                    if attempt == settings.gee_max_retries:
+                        self._count("failures")
+                        if self.breaker.record_failure():
+                            self._count("circuit_opened")
+                            logger.warning("GEE circuit opened after: %s", e)
+                        raise GeeUnavailableException(
+                            retry_after=self.breaker.retry_after()
+                        ) from e
+
+                    delay = self._backoff(attempt)
+                    self._count("retries")
+                    logger.info(
+                        "Retrying %s in %.2fs after: %s", func.__name__, delay, e
+                    )
+                    time.sleep(delay)
+                else:
+                    self.breaker.record_success()
+                    return result
+        finally:
+            self._local.active = False
+
+    def get_metrics(self) -> dict[str, Any]:
+        with self._metrics_lock:
+            metrics: dict[str, Any] = dict(self.metrics)
+        metrics["circuit_state"] = self.breaker.state
+        return metrics
+
+
+client = GeeClient()
+
+
+@overload
+def resilient(func: F) -> F: ...
+
+
+@overload
+def resilient(*, cost: int = 1) -> Callable[[F], F]: ...
+
+
+def resilient(func: Optional[F] = None, *, cost: int = 1) -> F | Callable[[F], F]:
+    """
+    Decorator running a `google_earth` function through the shared GEE client.
+    The quota wait and the retry backoff sleep, so async code calls these functions
+    through `run_in_threadpool`.
+    """
+
+    def decorate(wrapped: F) -> F:
+        @functools.wraps(wrapped)
+        def wrapper(*args, **kwargs):
+            with instrumentation.span("gee", wrapped.__name__):
+                return client.call(wrapped, *args, cost=cost, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate(func) if func else decorate
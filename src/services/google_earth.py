@@ -1,182 +1,788 @@
-from datetime import date
+import hashlib
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Optional, cast
 
 import ee
+import numpy as np
 
 from src.config.base import settings
+from src.services.gee_client import resilient
+from src.utils import rendering
+from src.utils.geometry import METERS_PER_DEGREE
 
 ee.Initialize(project=settings.gee_project)
 
+SENTINEL_2_COLLECTION = "COPERNICUS/S2_HARMONIZED"
+SENTINEL_1_COLLECTION = "COPERNICUS/S1_GRD"
+
+# Property identifying the acquisition footprint group of a scene:
+# the MGRS tile for Sentinel-2 and the relative orbit for Sentinel-1
+SCENE_TILE_PROPERTIES = {
+    SENTINEL_2_COLLECTION: "MGRS_TILE",
+    SENTINEL_1_COLLECTION: "relativeOrbitNumber_start",
+}
+
+RGB_VIS: dict[str, Any] = {"min": 0, "max": 3000, "bands": ["B4", "B3", "B2"]}
+
+# Color palette: red (dead/bare) -> yellow -> green (healthy vegetation)
+NDVI_VIS: dict[str, Any] = {
+    "min": -0.2,
+    "max": 0.8,
+    "palette": ["d73027", "fc8d59", "fee08b", "d9ef8b", "91cf60", "1a9850"],
+}
+
+# Red = vegetation loss, white = no change, green = recovery
+NDVI_DIFF_VIS: dict[str, Any] = {
+    "min": -0.5,
+    "max": 0.5,
+    "palette": [
+        "d73027",
+        "f46d43",
+        "fdae61",
+        "ffffff",
+        "a6d96a",
+        "66bd63",
+        "1a9850",
+    ],
+}
+
+# Red = backscatter decrease, white = no change, blue = increase
+SAR_DIFF_VIS: dict[str, Any] = {
+    "min": -5,
+    "max": 5,
+    "palette": [
+        "d73027",
+        "f46d43",
+        "fdae61",
+        "ffffff",
+        "abd9e9",
+        "74add1",
+        "4575b4",
+    ],
+}
+
+# Grayscale VV backscatter in dB
+SAR_VV_VIS: dict[str, Any] = {"min": -25, "max": 0, "palette": ["000000", "ffffff"]}
+
+SENTINEL_2_STACK_BANDS = ["B2", "B3", "B4", "B8"]
+SENTINEL_1_STACK_BANDS = ["VV"]
+
+NDVI_PERCENTILES = [10, 25, 75, 90]
+NDVI_HISTOGRAM_RANGE = (-1.0, 1.0)
+NDVI_HISTOGRAM_BINS = 20
+
+# Locally rendered (tiled) thumbnails are served from here
+THUMBNAIL_URL_PREFIX = "/thumbnails"
+# Thumbnail URLs are stored with the fields and reused for this long
+THUMBNAIL_URL_TTL = timedelta(minutes=50)
+
+# Value written to pixels outside the boundary when downloading band stacks
+RASTER_NODATA = -9999.0
+
+
+def _filter_sar_collection(collection: ee.ImageCollection) -> ee.ImageCollection:
+    return collection.filter(
+        ee.Filter.listContains("transmitterReceiverPolarisation", "VV")
+    ).filter(ee.Filter.eq("instrumentMode", "IW"))
+
+
+def _collection_from_scene_ids(
+    collection_id: str, scene_ids: list[str]
+) -> ee.ImageCollection:
+    """Build an image collection from exact scene IDs picked from the local catalog."""
+    # EE constructors are untyped, see ComputedObjectMetaclass
+    return cast(
+        ee.ImageCollection,
+        ee.ImageCollection(
+            [ee.Image(f"{collection_id}/{scene_id}") for scene_id in scene_ids]
+        ),
+    )
 
-def get_latest_sentinel_image(boundary: dict):
-    # Define the geometry
+
+@resilient
+def list_scenes(
+    collection_id: str, boundary: dict, newer_than: datetime
+) -> list[dict[str, Any]]:
+    """
+    List the scenes of a collection covering a boundary that were acquired after `newer_than`.
+    Returns one dict per scene with its ID, tile, acquisition time, cloud percentage and footprint.
+    """
     ee_geometry = ee.Geometry.Polygon(boundary["coordinates"])
 
+    collection = (
+        ee.ImageCollection(collection_id)
+        .filterBounds(ee_geometry)
+        .filter(ee.Filter.gt("system:time_start", int(newer_than.timestamp() * 1000)))
+    )
+    if collection_id == SENTINEL_1_COLLECTION:
+        collection = _filter_sar_collection(collection)
+
+    tile_property = SCENE_TILE_PROPERTIES[collection_id]
+
+    def to_feature(image: ee.Image) -> ee.Feature:
+        return cast(
+            ee.Feature,
+            ee.Feature(
+                image.geometry(),
+                {
+                    "scene_id": image.get("system:index"),
+                    "time_start": image.get("system:time_start"),
+                    "tile": image.get(tile_property),
+                    "cloudy_pixel_percentage": image.get("CLOUDY_PIXEL_PERCENTAGE"),
+                },
+            ),
+        )
+
+    # Oldest first, so a truncated sync still advances monotonically
+    features = (
+        ee.FeatureCollection(
+            collection.limit(
+                settings.scene_catalog_sync_limit, "system:time_start"
+            ).map(to_feature)
+        )
+        .getInfo()
+        .get("features", [])
+    )
+
+    return [
+        {
+            "scene_id": feature["properties"]["scene_id"],
+            "tile": (
+                str(feature["properties"]["tile"])
+                if feature["properties"].get("tile") is not None
+                else None
+            ),
+            "acquisition_time": datetime.fromtimestamp(
+                feature["properties"]["time_start"] / 1000, tz=timezone.utc
+            ).replace(tzinfo=None),
+            "cloudy_pixel_percentage": feature["properties"].get(
+                "cloudy_pixel_percentage"
+            ),
+            "footprint": feature["geometry"],
+        }
+        for feature in features
+    ]
+
+
+def _latest_sentinel_2_image(
+    ee_geometry: ee.Geometry, scene_id: Optional[str] = None
+) -> ee.Image:
+    if scene_id:
+        # Scene picked from the local catalog, no collection filtering needed
+        return cast(ee.Image, ee.Image(f"{SENTINEL_2_COLLECTION}/{scene_id}"))
+
     # Use the updated Sentinel-2 dataset, filter out cloudy images
     collection = (
-        ee.ImageCollection("COPERNICUS/S2_HARMONIZED")
+        ee.ImageCollection(SENTINEL_2_COLLECTION)
         .filterBounds(ee_geometry)
         .filter(ee.Filter.lt("CLOUDY_PIXEL_PERCENTAGE", 20))
         .sort("system:time_start", False)
     )
 
     # Get the newest clear image
-    newest_image = collection.first()
+    return cast(ee.Image, collection.first())
+
+
+def _sentinel_2_composite(
+    ee_geometry: ee.Geometry,
+    start: date,
+    end: date,
+    scene_ids: Optional[list[str]] = None,
+) -> ee.Image:
+    if scene_ids is not None:
+        collection = _collection_from_scene_ids(SENTINEL_2_COLLECTION, scene_ids)
+    else:
+        collection = (
+            ee.ImageCollection(SENTINEL_2_COLLECTION)
+            .filterBounds(ee_geometry)
+            .filterDate(start.isoformat(), end.isoformat())
+            .filter(ee.Filter.lt("CLOUDY_PIXEL_PERCENTAGE", 20))
+        )
+    return collection.median()
+
+
+def _sentinel_1_composite(
+    ee_geometry: ee.Geometry,
+    start: date,
+    end: date,
+    scene_ids: Optional[list[str]] = None,
+) -> ee.Image:
+    if scene_ids is not None:
+        collection = _collection_from_scene_ids(SENTINEL_1_COLLECTION, scene_ids)
+    else:
+        collection = _filter_sar_collection(
+            ee.ImageCollection(SENTINEL_1_COLLECTION)
+            .filterBounds(ee_geometry)
+            .filterDate(start.isoformat(), end.isoformat())
+        )
+    return cast(ee.Image, collection.select("VV").median())
+
+
+def _feature_collection(boundaries: dict[str, dict]) -> ee.FeatureCollection:
+    return cast(
+        ee.FeatureCollection,
+        ee.FeatureCollection(
+            [
+                ee.Feature(ee.Geometry.Polygon(boundary["coordinates"]), {"key": key})
+                for key, boundary in boundaries.items()
+            ]
+        ),
+    )
 
-    # Select RGB bands (B4 = Red, B3 = Green, B2 = Blue)
-    rgb_image = newest_image.select(["B4", "B3", "B2"])
 
-    # Apply visualization parameters
-    vis_params = {"min": 0, "max": 3000, "bands": ["B4", "B3", "B2"]}
+def _ndvi(image: ee.Image) -> ee.Image:
+    # NDVI = (NIR - Red) / (NIR + Red), where NIR = B8, Red = B4
+    return image.normalizedDifference(["B8", "B4"]).rename("NDVI")
 
-    url = rgb_image.getThumbURL(
-        {
-            "region": ee_geometry,
-            "scale": 10,
-            **vis_params,
-        }
+
+def _get_bounds(boundary: dict) -> tuple[float, float, float, float]:
+    longitudes = [point[0] for point in boundary["coordinates"][0]]
+    latitudes = [point[1] for point in boundary["coordinates"][0]]
+    return min(longitudes), min(latitudes), max(longitudes), max(latitudes)
+
+
+def _longitude_factor(min_y: float, max_y: float) -> float:
+    # Length of a degree of longitude relative to a degree of latitude, at the mid latitude
+    return max(math.cos(math.radians((min_y + max_y) / 2)), 0.01)
+
+
+def get_pixel_grid(boundary: dict, scale: float) -> dict[str, Any]:
+    """
+    Build an EPSG:4326 pixel grid covering the bounding box of a boundary,
+    with pixels of roughly `scale` meters.
+    """
+    min_x, min_y, max_x, max_y = _get_bounds(boundary)
+
+    scale_y = scale / METERS_PER_DEGREE
+    scale_x = scale_y / _longitude_factor(min_y, max_y)
+
+    return {
+        "dimensions": {
+            "width": max(math.ceil((max_x - min_x) / scale_x), 1),
+            "height": max(math.ceil((max_y - min_y) / scale_y), 1),
+        },
+        "affineTransform": {
+            "scaleX": scale_x,
+            "shearX": 0,
+            "translateX": min_x,
+            "shearY": 0,
+            "scaleY": -scale_y,
+            "translateY": max_y,
+        },
+        "crsCode": "EPSG:4326",
+    }
+
+
+def get_thumbnail_scale(boundary: dict) -> float:
+    """
+    Pick the thumbnail scale (meters per pixel) from the boundary's extent, so that its longer
+    side fits in `thumbnail_max_dimension` pixels, but never finer than `thumbnail_min_scale`.
+    """
+    min_x, min_y, max_x, max_y = _get_bounds(boundary)
+
+    height = (max_y - min_y) * METERS_PER_DEGREE
+    width = (max_x - min_x) * METERS_PER_DEGREE * _longitude_factor(min_y, max_y)
+
+    return max(
+        settings.thumbnail_min_scale,
+        max(width, height) / settings.thumbnail_max_dimension,
     )
 
-    return url
 
+def _store_thumbnail(png: bytes) -> str:
+    """Store a locally rendered thumbnail and return its URL."""
+    thumbnail_dir = Path(settings.thumbnail_dir)
+    thumbnail_dir.mkdir(parents=True, exist_ok=True)
+
+    name = f"{hashlib.sha256(png).hexdigest()}.png"
+    path = thumbnail_dir / name
+    if path.exists():
+        # Handed out again, restarts its lifetime
+        path.touch()
+    else:
+        path.write_bytes(png)
+
+        # Keep the directory bounded, oldest thumbnails go first. Thumbnails may still be
+        # referenced by stored fields and job results until their URLs expire.
+        max_age = max(
+            THUMBNAIL_URL_TTL, timedelta(minutes=settings.job_result_ttl_minutes)
+        )
+        expired_before = time.time() - max_age.total_seconds()
+        thumbnails = sorted(
+            (thumbnail.stat().st_mtime, thumbnail)
+            for thumbnail in thumbnail_dir.glob("*.png")
+        )
+        excess = len(thumbnails) - settings.thumbnail_max_files
+        for modified, thumbnail in thumbnails[: max(excess, 0)]:
+            if modified >= expired_before:
+                break
+            thumbnail.unlink(missing_ok=True)
+
+    return f"{THUMBNAIL_URL_PREFIX}/{name}"
 
-def get_ndvi_image(boundary: dict) -> str:
+
+def _render_tiled_thumbnail(
+    image: ee.Image, boundary: dict, vis_params: dict, grid: dict[str, Any]
+) -> str:
+    """
+    Render a thumbnail at full resolution by fetching the visualized image in tiles of
+    `thumbnail_tile_size` pixels concurrently and stitching them locally.
+    """
     ee_geometry = ee.Geometry.Polygon(boundary["coordinates"])
 
-    collection = (
-        ee.ImageCollection("COPERNICUS/S2_HARMONIZED")
-        .filterBounds(ee_geometry)
-        .filter(ee.Filter.lt("CLOUDY_PIXEL_PERCENTAGE", 20))
-        .sort("system:time_start", False)
+    visualized = image.visualize(**vis_params).clip(ee_geometry)
+    alpha = visualized.mask().reduce(ee.Reducer.min()).multiply(255)
+    rgba = (
+        ee.Image.cat([visualized.unmask(0), alpha.unmask(0)])
+        .rename(["red", "green", "blue", "alpha"])
+        .toUint8()
     )
 
-    newest_image = collection.first()
+    width = grid["dimensions"]["width"]
+    height = grid["dimensions"]["height"]
+    transform = grid["affineTransform"]
+    tile_size = settings.thumbnail_tile_size
+
+    def fetch_tile(offset: tuple[int, int]) -> tuple[int, int, np.ndarray]:
+        offset_x, offset_y = offset
+        tile_grid = {
+            **grid,
+            "dimensions": {
+                "width": min(tile_size, width - offset_x),
+                "height": min(tile_size, height - offset_y),
+            },
+            "affineTransform": {
+                **transform,
+                "translateX": transform["translateX"] + offset_x * transform["scaleX"],
+                "translateY": transform["translateY"] + offset_y * transform["scaleY"],
+            },
+        }
+        pixels = ee.data.computePixels(
+            {"expression": rgba, "fileFormat": "NUMPY_NDARRAY", "grid": tile_grid}
+        )
+        return (
+            offset_x,
+            offset_y,
+            np.stack([pixels[band] for band in ("red", "green", "blue", "alpha")], -1),
+        )
 
-    # NDVI = (NIR - Red) / (NIR + Red), where NIR = B8, Red = B4
-    ndvi = newest_image.normalizedDifference(["B8", "B4"]).rename("NDVI")
+    offsets = [
+        (offset_x, offset_y)
+        for offset_y in range(0, height, tile_size)
+        for offset_x in range(0, width, tile_size)
+    ]
 
-    # Color palette: red (dead/bare) -> yellow -> green (healthy vegetation)
-    vis_params = {
-        "min": -0.2,
-        "max": 0.8,
-        "palette": ["d73027", "fc8d59", "fee08b", "d9ef8b", "91cf60", "1a9850"],
-    }
+    canvas = np.zeros((height, width, 4), dtype=np.uint8)
+    with ThreadPoolExecutor(max_workers=settings.thumbnail_tile_workers) as pool:
+        for offset_x, offset_y, tile in pool.map(fetch_tile, offsets):
+            canvas[
+                offset_y : offset_y + tile.shape[0], offset_x : offset_x + tile.shape[1]
+            ] = tile
 
-    url = ndvi.getThumbURL(
+    return _store_thumbnail(rendering.encode_png(canvas))
+
+
+def get_thumbnail_url(image: ee.Image, boundary: dict, vis_params: dict) -> str:
+    """
+    Return a thumbnail URL for an image over a boundary with a scale adapted to its size.
+
+    With `thumbnail_tiling_enabled`, boundaries too large for `thumbnail_max_dimension` at
+    full resolution are rendered in tiles instead (up to `thumbnail_tiling_max_pixels`).
+    """
+    scale = get_thumbnail_scale(boundary)
+
+    if settings.thumbnail_tiling_enabled and scale > settings.thumbnail_min_scale:
+        grid = get_pixel_grid(boundary, settings.thumbnail_min_scale)
+        pixel_count = grid["dimensions"]["width"] * grid["dimensions"]["height"]
+        if pixel_count <= settings.thumbnail_tiling_max_pixels:
+            return _render_tiled_thumbnail(image, boundary, vis_params, grid)
+
+    return image.getThumbURL(
         {
-            "region": ee_geometry,
-            "scale": 10,
+            "region": ee.Geometry.Polygon(boundary["coordinates"]),
+            "scale": scale,
             **vis_params,
         }
     )
 
-    return url
+
+@resilient
+def get_latest_sentinel_image(boundary: dict, scene_id: Optional[str] = None):
+    # Define the geometry
+    ee_geometry = ee.Geometry.Polygon(boundary["coordinates"])
+
+    newest_image = _latest_sentinel_2_image(ee_geometry, scene_id)
+
+    # Select RGB bands (B4 = Red, B3 = Green, B2 = Blue)
+    rgb_image = newest_image.select(["B4", "B3", "B2"])
+
+    return get_thumbnail_url(rgb_image, boundary, RGB_VIS)
+
+
+@resilient
+def get_ndvi_image(boundary: dict, scene_id: Optional[str] = None) -> str:
+    ee_geometry = ee.Geometry.Polygon(boundary["coordinates"])
+
+    ndvi = _ndvi(_latest_sentinel_2_image(ee_geometry, scene_id))
+
+    return get_thumbnail_url(ndvi, boundary, NDVI_VIS)
+
+
+@resilient
+def get_map_tile_template(
+    boundary: dict, product: str, scene_id: Optional[str] = None
+) -> str:
+    """
+    Register a map of the latest Sentinel-2 scene clipped to the boundary and
+    return its XYZ tile URL template (`{z}`, `{x}`, `{y}` placeholders).
+    """
+    ee_geometry = ee.Geometry.Polygon(boundary["coordinates"])
+
+    image = _latest_sentinel_2_image(ee_geometry, scene_id)
+    if product == "ndvi":
+        image, vis_params = _ndvi(image), NDVI_VIS
+    else:
+        vis_params = RGB_VIS
+
+    map_id = image.clip(ee_geometry).getMapId(vis_params)
+
+    return str(map_id["tile_fetcher"].url_format)
 
 
+@resilient(cost=3)
 def get_ndvi_comparison(
     boundary: dict,
     date_before_start: date,
     date_before_end: date,
     date_after_start: date,
     date_after_end: date,
+    scene_ids_before: Optional[list[str]] = None,
+    scene_ids_after: Optional[list[str]] = None,
 ) -> dict[str, str]:
     """
     Compare NDVI between two time periods.
     Returns thumbnail URLs for before, after, and difference images.
+    When scene IDs are given, the composites are built from exactly those scenes.
     """
     ee_geometry = ee.Geometry.Polygon(boundary["coordinates"])
 
-    def get_ndvi_composite(start: date, end: date) -> ee.Image:
-        collection = (
-            ee.ImageCollection("COPERNICUS/S2_HARMONIZED")
-            .filterBounds(ee_geometry)
-            .filterDate(start.isoformat(), end.isoformat())
-            .filter(ee.Filter.lt("CLOUDY_PIXEL_PERCENTAGE", 20))
+    ndvi_before = _ndvi(
+        _sentinel_2_composite(
+            ee_geometry, date_before_start, date_before_end, scene_ids_before
         )
-        composite = collection.median()
-        return composite.normalizedDifference(["B8", "B4"]).rename("NDVI")
-
-    ndvi_before = get_ndvi_composite(date_before_start, date_before_end)
-    ndvi_after = get_ndvi_composite(date_after_start, date_after_end)
+    )
+    ndvi_after = _ndvi(
+        _sentinel_2_composite(
+            ee_geometry, date_after_start, date_after_end, scene_ids_after
+        )
+    )
     difference = ndvi_after.subtract(ndvi_before).rename("NDVI_change")
 
-    ndvi_vis = {
-        "min": -0.2,
-        "max": 0.8,
-        "palette": ["d73027", "fc8d59", "fee08b", "d9ef8b", "91cf60", "1a9850"],
-    }
-    diff_vis = {
-        "min": -0.5,
-        "max": 0.5,
-        "palette": [
-            "d73027",
-            "f46d43",
-            "fdae61",
-            "ffffff",
-            "a6d96a",
-            "66bd63",
-            "1a9850",
-        ],
-    }
-    thumb_params = {"region": ee_geometry, "scale": 10}
-
     return {
-        "ndvi_before_url": ndvi_before.getThumbURL({**thumb_params, **ndvi_vis}),
-        "ndvi_after_url": ndvi_after.getThumbURL({**thumb_params, **ndvi_vis}),
-        "ndvi_diff_url": difference.getThumbURL({**thumb_params, **diff_vis}),
+        "ndvi_before_url": get_thumbnail_url(ndvi_before, boundary, NDVI_VIS),
+        "ndvi_after_url": get_thumbnail_url(ndvi_after, boundary, NDVI_VIS),
+        "ndvi_diff_url": get_thumbnail_url(difference, boundary, NDVI_DIFF_VIS),
     }
 
 
+@resilient
 def get_sar_change_detection(
     boundary: dict,
     date_before_start: date,
     date_before_end: date,
     date_after_start: date,
     date_after_end: date,
+    scene_ids_before: Optional[list[str]] = None,
+    scene_ids_after: Optional[list[str]] = None,
 ) -> str:
     """
     Compute SAR change detection between two time periods using Sentinel-1 VV backscatter.
     Red = decrease in backscatter (potential destruction/change).
     Blue = increase in backscatter.
+    When scene IDs are given, the composites are built from exactly those scenes.
     """
     ee_geometry = ee.Geometry.Polygon(boundary["coordinates"])
 
-    def get_sar_composite(start: date, end: date) -> ee.Image:
-        return (
-            ee.ImageCollection("COPERNICUS/S1_GRD")
-            .filterBounds(ee_geometry)
-            .filterDate(start.isoformat(), end.isoformat())
-            .filter(ee.Filter.listContains("transmitterReceiverPolarisation", "VV"))
-            .filter(ee.Filter.eq("instrumentMode", "IW"))
-            .select("VV")
-            .median()
-        )
-
-    before_composite = get_sar_composite(date_before_start, date_before_end)
-    after_composite = get_sar_composite(date_after_start, date_after_end)
+    before_composite = _sentinel_1_composite(
+        ee_geometry, date_before_start, date_before_end, scene_ids_before
+    )
+    after_composite = _sentinel_1_composite(
+        ee_geometry, date_after_start, date_after_end, scene_ids_after
+    )
 
     # Positive = increase, negative = decrease in backscatter
     difference = after_composite.subtract(before_composite).rename("change")
 
-    vis_params = {
-        "min": -5,
-        "max": 5,
-        "palette": [
-            "d73027",
-            "f46d43",
-            "fdae61",
-            "ffffff",
-            "abd9e9",
-            "74add1",
-            "4575b4",
-        ],
-    }
+    return get_thumbnail_url(difference, boundary, SAR_DIFF_VIS)
+
+
+@resilient
+def get_band_stack(
+    boundary: dict,
+    sensor: str,
+    date_start: Optional[date] = None,
+    date_end: Optional[date] = None,
+    scene_ids: Optional[list[str]] = None,
+    scale: float = 10,
+) -> np.ndarray:
+    """
+    Download the raw band stack of a boundary as a (bands, height, width) float32 array.
 
-    url = difference.getThumbURL(
+    Sentinel-2 stacks contain B2/B3/B4/B8, Sentinel-1 stacks contain VV. Without dates the
+    newest clear Sentinel-2 scene is used, with dates a median composite of the range.
+    Pixels outside the boundary are set to NaN. Scale is coarsened as needed
+    so that the stack fits in `raster_max_bytes`.
+    """
+    ee_geometry = ee.Geometry.Polygon(boundary["coordinates"])
+
+    if sensor == "s1":
+        bands = SENTINEL_1_STACK_BANDS
+        image = _sentinel_1_composite(ee_geometry, date_start, date_end, scene_ids)
+    elif date_start and date_end:
+        bands = SENTINEL_2_STACK_BANDS
+        image = _sentinel_2_composite(ee_geometry, date_start, date_end, scene_ids)
+    else:
+        bands = SENTINEL_2_STACK_BANDS
+        image = _latest_sentinel_2_image(
+            ee_geometry, scene_ids[0] if scene_ids else None
+        )
+
+    # float32 per band and pixel, checked before anything is requested from GEE
+    grid = get_pixel_grid(boundary, scale)
+    size = grid["dimensions"]["width"] * grid["dimensions"]["height"] * len(bands) * 4
+    while size > settings.raster_max_bytes:
+        scale *= math.sqrt(size / settings.raster_max_bytes) * 1.01
+        grid = get_pixel_grid(boundary, scale)
+        size = (
+            grid["dimensions"]["width"] * grid["dimensions"]["height"] * len(bands) * 4
+        )
+
+    pixels = ee.data.computePixels(
         {
-            "region": ee_geometry,
-            "scale": 10,
-            **vis_params,
+            "expression": image.select(bands)
+            .toFloat()
+            .clip(ee_geometry)
+            .unmask(RASTER_NODATA),
+            "fileFormat": "NUMPY_NDARRAY",
+            "grid": grid,
+        }
+    )
+
+    stack = np.stack([pixels[band] for band in bands]).astype(np.float32)
+    stack[stack == RASTER_NODATA] = np.nan
+
+    return stack
+
+
+@resilient
+def get_ndvi_zonal_statistics(
+    boundaries: dict[str, dict], date_start: date, date_end: date
+) -> dict[str, dict[str, Any]]:
+    """
+    Compute NDVI statistics (mean, median, percentiles, pixel count and histogram) for many
+    boundaries at once, with a single `reduceRegions` over a median composite of the date range.
+    Returns the statistics keyed by the keys of `boundaries`.
+    """
+    feature_collection = _feature_collection(boundaries)
+
+    ndvi = _ndvi(
+        _sentinel_2_composite(feature_collection.geometry(), date_start, date_end)
+    )
+
+    reducer = (
+        ee.Reducer.mean()
+        .combine(ee.Reducer.median(), sharedInputs=True)
+        .combine(ee.Reducer.percentile(NDVI_PERCENTILES), sharedInputs=True)
+        .combine(ee.Reducer.count(), sharedInputs=True)
+        .combine(
+            ee.Reducer.fixedHistogram(*NDVI_HISTOGRAM_RANGE, NDVI_HISTOGRAM_BINS),
+            sharedInputs=True,
+        )
+    )
+
+    result = ndvi.reduceRegions(
+        collection=feature_collection, reducer=reducer, scale=10
+    ).getInfo()
+
+    statistics = {}
+    for feature in result.get("features", []):
+        properties = feature["properties"]
+        histogram = properties.get("histogram")
+        statistics[properties["key"]] = {
+            "mean": properties.get("mean"),
+            "median": properties.get("median"),
+            **{
+                f"p{percentile}": properties.get(f"p{percentile}")
+                for percentile in NDVI_PERCENTILES
+            },
+            "pixel_count": properties.get("count"),
+            # Pairs of [bin start, count], keep the counts only
+            "histogram": [int(count) for _, count in histogram] if histogram else None,
+        }
+
+    return statistics
+
+
+@resilient
+def get_ndvi_time_series(
+    boundary: dict, newer_than: datetime, older_than: Optional[datetime] = None
+) -> list[dict[str, Any]]:
+    """
+    Compute the mean NDVI over a boundary for every clear Sentinel-2 scene acquired in
+    (newer_than, older_than). The reducer is mapped over the collection server-side,
+    so the whole series costs a single request.
+    """
+    ee_geometry = ee.Geometry.Polygon(boundary["coordinates"])
+
+    collection = (
+        ee.ImageCollection(SENTINEL_2_COLLECTION)
+        .filterBounds(ee_geometry)
+        .filter(ee.Filter.gt("system:time_start", int(newer_than.timestamp() * 1000)))
+        .filter(ee.Filter.lt("CLOUDY_PIXEL_PERCENTAGE", 20))
+    )
+    if older_than is not None:
+        collection = collection.filter(
+            ee.Filter.lt("system:time_start", int(older_than.timestamp() * 1000))
+        )
+
+    def to_observation(image: ee.Image) -> ee.Feature:
+        ndvi_mean = (
+            _ndvi(image)
+            .reduceRegion(
+                reducer=ee.Reducer.mean(),
+                geometry=ee_geometry,
+                scale=10,
+                maxPixels=10**9,
+            )
+            .get("NDVI")
+        )
+        return cast(
+            ee.Feature,
+            ee.Feature(
+                None,
+                {
+                    "scene_id": image.get("system:index"),
+                    "time_start": image.get("system:time_start"),
+                    "cloudy_pixel_percentage": image.get("CLOUDY_PIXEL_PERCENTAGE"),
+                    "ndvi_mean": ndvi_mean,
+                },
+            ),
+        )
+
+    features = (
+        ee.FeatureCollection(collection.map(to_observation))
+        .filter(ee.Filter.notNull(["ndvi_mean"]))
+        .getInfo()
+        .get("features", [])
+    )
+
+    return [
+        {
+            "scene_id": feature["properties"]["scene_id"],
+            "acquisition_time": datetime.fromtimestamp(
+                feature["properties"]["time_start"] / 1000, tz=timezone.utc
+            ).replace(tzinfo=None),
+            "cloudy_pixel_percentage": feature["properties"].get(
+                "cloudy_pixel_percentage"
+            ),
+            "ndvi_mean": feature["properties"]["ndvi_mean"],
         }
+        for feature in features
+    ]
+
+
+@resilient
+def get_latest_scene_times(
+    boundaries: dict[str, dict]
+) -> dict[str, Optional[datetime]]:
+    """
+    Return the acquisition time of the newest clear Sentinel-2 or Sentinel-1 scene
+    over each boundary, in a single request.
+    """
+    sentinel_2 = ee.ImageCollection(SENTINEL_2_COLLECTION).filter(
+        ee.Filter.lt("CLOUDY_PIXEL_PERCENTAGE", 20)
     )
+    sentinel_1 = _filter_sar_collection(ee.ImageCollection(SENTINEL_1_COLLECTION))
+
+    def with_latest_times(feature: ee.Feature) -> ee.Feature:
+        # Element.set is annotated with the base class, it returns the feature
+        return cast(
+            ee.Feature,
+            feature.set(
+                {
+                    "s2_latest": sentinel_2.filterBounds(
+                        feature.geometry()
+                    ).aggregate_max("system:time_start"),
+                    "s1_latest": sentinel_1.filterBounds(
+                        feature.geometry()
+                    ).aggregate_max("system:time_start"),
+                }
+            ),
+        )
+
+    result = _feature_collection(boundaries).map(with_latest_times).getInfo()
+
+    latest_times: dict[str, Optional[datetime]] = {}
+    for feature in result.get("features", []):
+        properties = feature["properties"]
+        times = [
+            properties[name]
+            for name in ("s2_latest", "s1_latest")
+            if properties.get(name) is not None
+        ]
+        latest_times[properties["key"]] = (
+            datetime.fromtimestamp(max(times) / 1000, tz=timezone.utc).replace(
+                tzinfo=None
+            )
+            if times
+            else None
+        )
 
-    return url
+    return latest_times
+
+
+@resilient
+def get_change_deltas(
+    boundaries: dict[str, dict],
+    baseline_start: date,
+    baseline_end: date,
+    recent_start: date,
+    recent_end: date,
+) -> dict[str, dict[str, Optional[float]]]:
+    """
+    Compute the mean NDVI and SAR VV change between a baseline and a recent period
+    for many boundaries at once, with a single `reduceRegions`.
+    """
+    feature_collection = _feature_collection(boundaries)
+    region = feature_collection.geometry()
+
+    ndvi_delta = (
+        _ndvi(_sentinel_2_composite(region, recent_start, recent_end))
+        .subtract(_ndvi(_sentinel_2_composite(region, baseline_start, baseline_end)))
+        .rename("ndvi_delta")
+    )
+    vv_delta = (
+        _sentinel_1_composite(region, recent_start, recent_end)
+        .subtract(_sentinel_1_composite(region, baseline_start, baseline_end))
+        .rename("vv_delta")
+    )
+
+    result = (
+        ee.Image.cat([ndvi_delta, vv_delta])
+        .reduceRegions(
+            collection=feature_collection, reducer=ee.Reducer.mean(), scale=10
+        )
+        .getInfo()
+    )
+
+    return {
+        feature["properties"]["key"]: {
+            "ndvi_delta": feature["properties"].get("ndvi_delta"),
+            "vv_delta": feature["properties"].get("vv_delta"),
+        }
+        for feature in result.get("features", [])
+    }
@@ -0,0 +1,233 @@
+import asyncio
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.schemas.field import FieldRead
+from src.api.schemas.ndvi_comparison import NdviComparisonRequest
+from src.api.schemas.sar import SarChangeRequest
+from src.common.exceptions import JobQueueFullException
+from src.config.base import settings
+from src.database.postgres.crud import job as crud_job
+from src.database.postgres.handler import PostgreSQLHandler as DatabaseHandler
+from src.models.job import Job
+from src.services import comparison
+from src.services.comparison import ProgressCallback
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ("succeeded", "failed")
+
+
+async def _run_ndvi_comparison(
+    params: dict[str, Any], db: AsyncSession, report: ProgressCallback
+) -> dict[str, Any]:
+    return await comparison.compare_ndvi(
+        request=NdviComparisonRequest(**params), db=db, report=report
+    )
+
+
+async def _run_sar_change(
+    params: dict[str, Any], db: AsyncSession, report: ProgressCallback
+) -> dict[str, Any]:
+    field = await comparison.detect_sar_change(
+        request=SarChangeRequest(**params), db=db, report=report
+    )
+    return FieldRead.model_validate(field).model_dump(mode="json")
+
+
+JOB_HANDLERS: dict[
+    str,
+    Callable[[dict[str, Any], AsyncSession, ProgressCallback], Awaitable[Any]],
+] = {
+    "ndvi_comparison": _run_ndvi_comparison,
+    "sar_change": _run_sar_change,
+}
+
+# Bounds how many jobs run at once, the rest wait in the queue
+_workers: Optional[asyncio.Semaphore] = None
+_tasks: dict[UUID, asyncio.Task] = {}
+
+# Live state of the jobs of this process, so progress streams don't poll the database
+_states: dict[UUID, dict[str, Any]] = {}
+_changed: dict[UUID, asyncio.Event] = {}
+
+
+def build_job_key(kind: str, params: dict[str, Any]) -> str:
+    normalized = json.dumps(params, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{kind}:{normalized}".encode()).hexdigest()
+
+
+def job_state(job: Job) -> dict[str, Any]:
+    return {
+        "id": str(job.id),
+        "kind": job.kind,
+        "status": job.status,
+        "progress": job.progress,
+        "message": job.message,
+        "result": job.result,
+        "error": job.error,
+        "creation_date": job.creation_date.isoformat(),
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+
+def _publish(job_id: UUID, **values: Any) -> None:
+    if job_id in _states:
+        _states[job_id].update(values)
+    if job_id in _changed:
+        _changed[job_id].set()
+
+
+def _is_reusable(job: Job) -> bool:
+    if job.status in ("pending", "running"):
+        # Jobs run in the process that queued them, a stale one was interrupted
+        max_age = timedelta(minutes=settings.job_timeout_minutes)
+        return bool(job.id in _tasks or job.creation_date > datetime.now() - max_age)
+    if job.status == "succeeded":
+        # Results contain GEE thumbnail URLs, which expire
+        max_age = timedelta(minutes=settings.job_result_ttl_minutes)
+        return bool(
+            job.finished_at is not None and job.finished_at > datetime.now() - max_age
+        )
+    return False
+
+
+async def submit_job(kind: str, params: dict[str, Any], db: AsyncSession) -> Job:
+    """
+    Queue a job, or return the identical one that is still running or recently succeeded.
+
+    Raises:
+        JobQueueFullException: If `job_queue_size` jobs are already queued or running.
+    """
+    global _workers  # pylint: disable=W0603
+    if _workers is None:
+        _workers = asyncio.Semaphore(settings.job_workers)
+
+    job, created = await crud_job.get_or_create_job(
+        kind=kind, key=build_job_key(kind, params), params=params, db=db
+    )
+    if not created and _is_reusable(job):
+        return job
+
+    if len(_tasks) >= settings.job_queue_size:
+        raise JobQueueFullException(queue_size=settings.job_queue_size)
+
+    if not created:
+        await crud_job.restart_job(job.id, db)  # type: ignore[arg-type]
+        job = await crud_job.get_job(job.id, db)  # type: ignore[arg-type]
+
+    job_id: UUID = job.id  # type: ignore[assignment]
+    _states[job_id] = job_state(job)
+    _changed[job_id] = asyncio.Event()
+    _tasks[job_id] = asyncio.create_task(_execute(job_id, kind, params))
+    return job
+
+
+async def _execute(job_id: UUID, kind: str, params: dict[str, Any]) -> None:
+    db_handler = DatabaseHandler()
+    try:
+        async with _workers, db_handler.session_factory() as db:
+            await crud_job.update_job(job_id, db, status="running")
+            _publish(job_id, status="running")
+
+            def report(progress: float, message: str) -> None:
+                _publish(job_id, progress=progress, message=message)
+
+            try:
+                result = await JOB_HANDLERS[kind](params, db, report)
+            except Exception as exc:  # pylint: disable=W0718
+                logger.error("Job %s (%s) failed: %s", job_id, kind, exc)
+                await db.rollback()
+                values: dict[str, Any] = {
+                    "status": "failed",
+                    "error": str(exc),
+                    "finished_at": datetime.now(),
+                }
+            else:
+                values = {
+                    "status": "succeeded",
+                    "progress": 1.0,
+                    "result": result,
+                    "finished_at": datetime.now(),
+                }
+
+            values["message"] = _states[job_id]["message"]
+            await crud_job.update_job(job_id, db, **values)
+            _publish(
+                job_id,
+                **{
+                    **values,
+                    "finished_at": values["finished_at"].isoformat(),
+                },
+            )
+    finally:
+        _tasks.pop(job_id, None)
+        await db_handler.engine.dispose()
+
+        # Late subscribers read the finished job from the database
+        _states.pop(job_id, None)
+        _changed.pop(job_id, None)
+
+
+async def get_job_state(job_id: UUID, db: AsyncSession) -> Optional[dict[str, Any]]:
+    if job_id in _states:
+        return dict(_states[job_id])
+
+    job = await crud_job.get_job(job_id, db)
+    return job_state(job) if job else None
+
+
+async def stream_job(job_id: UUID) -> AsyncIterator[str]:
+    """
+    Server-Sent Events of a job: a `progress` event on every change
+    and a final `result` or `error` event, after which the stream ends.
+
+    The stream outlives the request's session, so it reads the job with its own
+    sessions, one per poll so that no connection is held between polls.
+    """
+    db_handler = DatabaseHandler()
+    try:
+        last_state = None
+        while True:
+            changed = _changed.get(job_id)
+            if changed:
+                changed.clear()
+
+            async with db_handler.session_factory() as db:
+                state = await get_job_state(job_id, db)
+            if state is None:
+                return
+
+            if state != last_state:
+                last_state = state
+                if state["status"] in TERMINAL_STATUSES:
+                    event = "result" if state["status"] == "succeeded" else "error"
+                    yield f"event: {event}\ndata: {json.dumps(state)}\n\n"
+                    return
+                yield f"event: progress\ndata: {json.dumps(state)}\n\n"
+
+            if changed is None:
+                # Job of another process (or already gone), fall back to polling
+                await asyncio.sleep(settings.job_poll_interval_seconds)
+                continue
+
+            try:
+                await asyncio.wait_for(
+                    changed.wait(), timeout=settings.job_keepalive_seconds
+                )
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+    finally:
+        await db_handler.engine.dispose()
+
+
+async def cancel_jobs() -> None:
+    for task in list(_tasks.values()):
+        task.cancel()
+    await asyncio.gather(*_tasks.values(), return_exceptions=True)
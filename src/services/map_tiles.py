@@ -0,0 +1,226 @@
+import math
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from pathlib import Path
+from typing import Optional
+from uuid import UUID
+
+import numpy as np
+import requests
+
+from src.config.base import settings
+from src.utils import instrumentation, rendering
+from src.utils.cache import TTLCache
+
+logger = getLogger(__name__)
+
+TILE_SIZE = 256
+
+# Served for tiles outside the field, without touching GEE or the disk cache
+EMPTY_TILE = rendering.encode_png(np.zeros((TILE_SIZE, TILE_SIZE, 4), dtype=np.uint8))
+
+# GEE map IDs expire, so tile templates are only reused for a while
+templates = TTLCache(
+    maxsize=settings.map_tile_template_cache_size,
+    ttl=settings.map_tile_template_ttl_minutes * 60,
+)
+instrumentation.register_cache("map_tile_templates", templates.stats)
+
+_prefetch_pool = ThreadPoolExecutor(
+    max_workers=settings.map_tile_prefetch_workers, thread_name_prefix="tile-prefetch"
+)
+_in_flight: set[Path] = set()
+_in_flight_lock = threading.Lock()
+
+_cache_lock = threading.Lock()
+_cache_bytes: Optional[int] = None
+
+
+def _tile_path(
+    field_id: UUID, version: int, product: str, z: int, x: int, y: int
+) -> Path:
+    # Tiles of a field are kept per version, an edited boundary never serves old tiles
+    return (
+        Path(settings.map_tile_cache_dir)
+        / str(field_id)
+        / f"v{version}"
+        / product
+        / str(z)
+        / str(x)
+        / f"{y}.png"
+    )
+
+
+def tile_bounds(z: int, x: int, y: int) -> tuple[float, float, float, float]:
+    """(min_lon, min_lat, max_lon, max_lat) of a Web Mercator XYZ tile."""
+    tiles = 2**z
+
+    def latitude(tile_y: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * tile_y / tiles))))
+
+    return (
+        x / tiles * 360 - 180,
+        latitude(y + 1),
+        (x + 1) / tiles * 360 - 180,
+        latitude(y),
+    )
+
+
+def tile_intersects(boundary: dict, z: int, x: int, y: int) -> bool:
+    longitudes: list[float] = [point[0] for point in boundary["coordinates"][0]]
+    latitudes: list[float] = [point[1] for point in boundary["coordinates"][0]]
+    min_lon, min_lat, max_lon, max_lat = tile_bounds(z, x, y)
+
+    return (
+        min(longitudes) <= max_lon
+        and max(longitudes) >= min_lon
+        and min(latitudes) <= max_lat
+        and max(latitudes) >= min_lat
+    )
+
+
+def get_cached_tile(
+    field_id: UUID, version: int, product: str, z: int, x: int, y: int
+) -> Optional[Path]:
+    """Return the path of a cached tile that has not expired yet, marking it as recently used."""
+    path = _tile_path(field_id, version, product, z, x, y)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+
+    now = time.time()
+    if stat.st_mtime < now - settings.map_tile_max_age_hours * 3600:
+        return None
+
+    # The access time tracks recency for the LRU eviction, the modification time the tile age
+    os.utime(path, (now, stat.st_mtime))
+    return path
+
+
+def _directory_size() -> int:
+    return sum(
+        path.stat().st_size
+        for path in Path(settings.map_tile_cache_dir).rglob("*.png")
+        if path.is_file()
+    )
+
+
+def _evict(added: int) -> None:
+    """Account for a newly written tile and evict the least recently used tiles over the budget."""
+    global _cache_bytes  # pylint: disable=W0603
+
+    with _cache_lock:
+        if _cache_bytes is None:
+            _cache_bytes = _directory_size()
+        else:
+            _cache_bytes += added
+
+        if _cache_bytes <= settings.map_tile_cache_max_bytes:
+            return
+
+        tiles = []
+        for path in Path(settings.map_tile_cache_dir).rglob("*.png"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            tiles.append((stat.st_atime, stat.st_size, path))
+        tiles.sort()
+
+        # Evict down to 90% of the budget, so not every write triggers a scan
+        _cache_bytes = sum(size for _, size, _ in tiles)
+        target = settings.map_tile_cache_max_bytes * 0.9
+        for _, size, path in tiles:
+            if _cache_bytes <= target:
+                break
+            path.unlink(missing_ok=True)
+            _cache_bytes -= size
+
+
+def fetch_tile(
+    field_id: UUID, version: int, product: str, z: int, x: int, y: int, template: str
+) -> Path:
+    """
+    Download a tile from its GEE tile template into the disk cache.
+
+    Raises:
+        requests.RequestException: If GEE does not return the tile.
+    """
+    response = requests.get(
+        template.format(z=z, x=x, y=y), timeout=settings.map_tile_timeout_seconds
+    )
+    response.raise_for_status()
+
+    path = _tile_path(field_id, version, product, z, x, y)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write next to the target and rename, so readers never serve a partial tile
+    descriptor, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as tmp_file:
+            tmp_file.write(response.content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    _evict(len(response.content))
+    return path
+
+
+def _prefetch_tile(
+    field_id: UUID,
+    version: int,
+    product: str,
+    z: int,
+    x: int,
+    y: int,
+    template: str,
+    path: Path,
+) -> None:
+    try:
+        fetch_tile(field_id, version, product, z, x, y, template)
+    except requests.RequestException as e:
+        logger.debug("Prefetch of tile %s failed: %s", path, e)
+    finally:
+        with _in_flight_lock:
+            _in_flight.discard(path)
+
+
+def prefetch_neighbors(
+    field_id: UUID,
+    version: int,
+    product: str,
+    z: int,
+    x: int,
+    y: int,
+    boundary: dict,
+    template: str,
+) -> None:
+    """Fetch the 8 neighbours of a tile in the background, skipping cached and empty ones."""
+    tiles = 2**z
+
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            nx, ny = (x + dx) % tiles, y + dy
+            if (dx, dy) == (0, 0) or not 0 <= ny < tiles:
+                continue
+            if not tile_intersects(boundary, z, nx, ny):
+                continue
+            if get_cached_tile(field_id, version, product, z, nx, ny):
+                continue
+
+            path = _tile_path(field_id, version, product, z, nx, ny)
+            with _in_flight_lock:
+                if path in _in_flight:
+                    continue
+                _in_flight.add(path)
+
+            _prefetch_pool.submit(
+                _prefetch_tile, field_id, version, product, z, nx, ny, template, path
+            )
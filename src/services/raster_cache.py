@@ -0,0 +1,142 @@
+import json
+import os
+import re
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Optional
+from uuid import UUID
+
+import numpy as np
+
+from src.common.exceptions import RasterNotCachedException
+from src.config.base import settings
+from src.services.google_earth import (
+    SENTINEL_1_STACK_BANDS,
+    SENTINEL_2_STACK_BANDS,
+    get_band_stack,
+)
+
+STACK_KEY = re.compile(r"^s[12]-[0-9a-z-]+$")
+
+
+def build_stack_key(
+    sensor: str, date_start: Optional[date] = None, date_end: Optional[date] = None
+) -> str:
+    if date_start and date_end:
+        return f"{sensor}-{date_start.isoformat()}-{date_end.isoformat()}"
+    return f"{sensor}-latest"
+
+
+def _field_dir(field_id: UUID) -> Path:
+    return Path(settings.raster_cache_dir) / str(field_id)
+
+
+def _atomic_write(path: Path, write) -> None:
+    # Write next to the target and rename, so readers never map a partial file
+    descriptor, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=path.suffix)
+    try:
+        with os.fdopen(descriptor, "wb") as tmp_file:
+            write(tmp_file)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def cache_band_stack(
+    field_id: UUID,
+    boundary: dict,
+    sensor: str,
+    date_start: Optional[date] = None,
+    date_end: Optional[date] = None,
+) -> dict[str, Any]:
+    """
+    Download a field's band stack from GEE once and store it as an NPY file
+    in the local raster cache. Returns the stack metadata.
+    """
+    stack = get_band_stack(
+        boundary=boundary,
+        sensor=sensor,
+        date_start=date_start,
+        date_end=date_end,
+        scale=settings.raster_scale_meters,
+    )
+
+    key = build_stack_key(sensor, date_start, date_end)
+    metadata = {
+        "key": key,
+        "sensor": sensor,
+        "bands": SENTINEL_1_STACK_BANDS if sensor == "s1" else SENTINEL_2_STACK_BANDS,
+        "width": int(stack.shape[2]),
+        "height": int(stack.shape[1]),
+        "date_start": date_start.isoformat() if date_start else None,
+        "date_end": date_end.isoformat() if date_end else None,
+        "creation_date": datetime.now().isoformat(),
+    }
+
+    field_dir = _field_dir(field_id)
+    field_dir.mkdir(parents=True, exist_ok=True)
+    _atomic_write(field_dir / f"{key}.npy", lambda file: np.save(file, stack))
+    _atomic_write(
+        field_dir / f"{key}.json",
+        lambda file: file.write(json.dumps(metadata).encode()),
+    )
+
+    return metadata
+
+
+def load_band_stack(field_id: UUID, key: str) -> tuple[np.ndarray, dict[str, Any]]:
+    """
+    Memory-map a cached band stack. Returns the (bands, height, width) array and its metadata.
+
+    Raises:
+        RasterNotCachedException: If the stack is not in the cache.
+    """
+    if not STACK_KEY.match(key):
+        raise RasterNotCachedException(field_id=field_id, key=key)
+
+    field_dir = _field_dir(field_id)
+    stack_path = field_dir / f"{key}.npy"
+    metadata_path = field_dir / f"{key}.json"
+
+    if not stack_path.is_file() or not metadata_path.is_file():
+        raise RasterNotCachedException(field_id=field_id, key=key)
+
+    metadata = json.loads(metadata_path.read_text())
+    return np.load(stack_path, mmap_mode="r"), metadata
+
+
+def get_stack_version(field_id: UUID, key: str) -> tuple[str, float]:
+    """
+    Validator of a cached band stack: a version string derived from the stack file
+    and its modification time. Both change when the stack is cached again.
+
+    Raises:
+        RasterNotCachedException: If the stack is not in the cache.
+    """
+    if not STACK_KEY.match(key):
+        raise RasterNotCachedException(field_id=field_id, key=key)
+
+    try:
+        stat = (_field_dir(field_id) / f"{key}.npy").stat()
+    except FileNotFoundError as e:
+        raise RasterNotCachedException(field_id=field_id, key=key) from e
+
+    return f"{stat.st_mtime_ns:x}-{stat.st_size:x}", stat.st_mtime
+
+
+def list_band_stacks(field_id: UUID) -> list[dict[str, Any]]:
+    field_dir = _field_dir(field_id)
+    if not field_dir.is_dir():
+        return []
+
+    return [
+        json.loads(metadata_path.read_text())
+        for metadata_path in sorted(field_dir.glob("*.json"))
+    ]
+
+
+def get_band(stack: np.ndarray, metadata: dict[str, Any], band: str) -> np.ndarray:
+    """Return one band of a cached stack as float32, with NaN outside the boundary."""
+    return np.asarray(stack[metadata["bands"].index(band)], dtype=np.float32)
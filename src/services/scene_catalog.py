@@ -0,0 +1,125 @@
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.base import settings
+from src.database.postgres.crud import scene as crud_scene
+from src.services.google_earth import SENTINEL_2_COLLECTION, list_scenes
+
+
+async def sync_scene_catalog(
+    boundary: dict, collection: str, db: AsyncSession
+) -> tuple[int, datetime]:
+    """
+    Incrementally sync the local scene catalog for a boundary.
+
+    Only scenes acquired after the last sync covering the boundary are fetched from GEE
+    (minus a small overlap for late ingestion). A boundary that was never synced is
+    fetched from `scene_catalog_start_date`.
+
+    Returns:
+        tuple[int, datetime]: The number of newly stored scenes and the sync time.
+    """
+    last_synced_at = await crud_scene.get_last_sync_time(
+        collection=collection, boundary=boundary, db=db
+    )
+
+    if last_synced_at:
+        newer_than = last_synced_at - timedelta(
+            days=settings.scene_catalog_sync_overlap_days
+        )
+    else:
+        newer_than = datetime.combine(settings.scene_catalog_start_date, time())
+
+    synced_at = datetime.now()
+    scenes = await run_in_threadpool(
+        list_scenes, collection_id=collection, boundary=boundary, newer_than=newer_than
+    )
+
+    if len(scenes) >= settings.scene_catalog_sync_limit:
+        # Truncated sync: only claim coverage up to the newest fetched scene
+        # (acquisition times are naive UTC, sync times naive local)
+        synced_at = (
+            scenes[-1]["acquisition_time"]
+            .replace(tzinfo=timezone.utc)
+            .astimezone()
+            .replace(tzinfo=None)
+        )
+
+    added = await crud_scene.create_scenes(collection=collection, scenes=scenes, db=db)
+    await crud_scene.create_sync(
+        collection=collection, boundary=boundary, synced_at=synced_at, db=db
+    )
+
+    return added, synced_at
+
+
+async def _is_catalog_fresh(boundary: dict, collection: str, db: AsyncSession) -> bool:
+    if not settings.scene_catalog_enabled:
+        return False
+
+    last_synced_at = await crud_scene.get_last_sync_time(
+        collection=collection, boundary=boundary, db=db
+    )
+    if last_synced_at is None:
+        return False
+
+    max_age = timedelta(hours=settings.scene_catalog_max_age_hours)
+    return last_synced_at > datetime.now() - max_age
+
+
+async def resolve_latest_scene_id(
+    boundary: dict,
+    db: AsyncSession,
+    collection: str = SENTINEL_2_COLLECTION,
+    max_cloud: Optional[float] = 20,
+) -> Optional[str]:
+    """
+    Pick the newest scene covering the boundary from the local catalog.
+    Returns None when the catalog is not fresh for the boundary, so callers fall back to GEE filtering.
+    """
+    if not await _is_catalog_fresh(boundary=boundary, collection=collection, db=db):
+        return None
+
+    scenes, _ = await crud_scene.get_scenes(
+        db=db,
+        collection=collection,
+        boundary=boundary,
+        max_cloud=max_cloud,
+        limit=1,
+        offset=0,
+    )
+
+    return str(scenes[0].scene_id) if scenes else None
+
+
+async def resolve_scene_ids(
+    boundary: dict,
+    start: date,
+    end: date,
+    db: AsyncSession,
+    collection: str = SENTINEL_2_COLLECTION,
+    max_cloud: Optional[float] = None,
+) -> Optional[list[str]]:
+    """
+    Pick the exact scenes covering the boundary within [start, end) from the local catalog.
+    Returns None when the catalog does not cover the boundary or the date range.
+    """
+    if start < settings.scene_catalog_start_date:
+        return None
+
+    if not await _is_catalog_fresh(boundary=boundary, collection=collection, db=db):
+        return None
+
+    scenes, _ = await crud_scene.get_scenes(
+        db=db,
+        collection=collection,
+        boundary=boundary,
+        start=datetime.combine(start, time()),
+        end=datetime.combine(end, time()),
+        max_cloud=max_cloud,
+    )
+
+    return [scene.scene_id for scene in scenes]
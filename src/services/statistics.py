@@ -0,0 +1,116 @@
+import logging
+from datetime import date
+from typing import Any, Optional
+from uuid import UUID
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.base import settings
+from src.database.postgres.crud import field as crud_field
+from src.database.postgres.crud import statistics as crud_statistics
+from src.services.google_earth import get_ndvi_zonal_statistics
+from src.utils.conversion import convert_wkb_to_geojson
+
+STATISTIC_COLUMNS = (
+    "mean",
+    "median",
+    "p10",
+    "p25",
+    "p75",
+    "p90",
+    "pixel_count",
+    "histogram",
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def get_ndvi_statistics(
+    field_ids: list[UUID],
+    date_start: date,
+    date_end: date,
+    db: AsyncSession,
+    refresh: bool = False,
+) -> tuple[dict[str, list[Any]], list[UUID]]:
+    """
+    Return NDVI statistics for many fields as columns.
+
+    Statistics already stored for the date range are reused. The remaining fields are
+    computed on GEE with one `reduceRegions` call per chunk of `zonal_statistics_chunk_size` fields.
+    Only computed statistics are stored, fields without imagery are queried again next time.
+
+    Returns:
+        tuple: The columns (`field_id`, one list per statistic and `error`, in the order
+            of `field_ids`) and the IDs of fields that do not exist or are deleted. Fields
+            without imagery in the date range have null statistics, fields of a chunk that
+            failed on GEE have null statistics and the error.
+    """
+    field_ids = list(dict.fromkeys(field_ids))
+
+    stored = (
+        []
+        if refresh
+        else await crud_statistics.get_ndvi_statistics(
+            field_ids=field_ids, date_start=date_start, date_end=date_end, db=db
+        )
+    )
+    # Rows without statistics (stored by earlier versions) are computed again
+    results: dict[UUID, dict[str, Any]] = {
+        row.field_id: {  # type: ignore[misc]
+            column: getattr(row, column) for column in STATISTIC_COLUMNS
+        }
+        for row in stored
+        if row.mean is not None
+    }
+    errors: dict[UUID, Optional[str]] = {}
+
+    missing_ids = [field_id for field_id in field_ids if field_id not in results]
+    fields = await crud_field.get_fields_by_ids(field_ids=missing_ids, db=db)
+    not_found_ids = set(missing_ids) - {field.id for field in fields}
+
+    chunk_size = settings.zonal_statistics_chunk_size
+    for chunk_start in range(0, len(fields), chunk_size):
+        boundaries = {
+            str(field.id): convert_wkb_to_geojson(field.boundary)
+            for field in fields[chunk_start : chunk_start + chunk_size]
+        }
+        try:
+            computed = await run_in_threadpool(
+                get_ndvi_zonal_statistics,
+                boundaries=boundaries,
+                date_start=date_start,
+                date_end=date_end,
+            )
+        except Exception as exc:  # pylint: disable=W0718
+            # The fields of a failed chunk get the error, the other chunks go on
+            logger.error("NDVI statistics chunk failed: %s", exc)
+            errors.update({UUID(key): f"GEE error: {exc}" for key in boundaries})
+            continue
+
+        # Fields without imagery in the range come back without a feature or with null
+        # statistics. They are not stored, so that a later request looks for imagery again.
+        statistics = {
+            UUID(key): values
+            for key, values in computed.items()
+            if values["mean"] is not None
+        }
+        await crud_statistics.upsert_ndvi_statistics(
+            date_start=date_start, date_end=date_end, statistics=statistics, db=db
+        )
+        results.update(statistics)
+
+    columns: dict[str, list[Any]] = {"field_id": []}
+    columns.update({column: [] for column in STATISTIC_COLUMNS})
+    columns["error"] = []
+    empty = dict.fromkeys(STATISTIC_COLUMNS)
+    for field_id in field_ids:
+        if field_id in not_found_ids:
+            continue
+        values = results.get(field_id, empty)
+        columns["field_id"].append(field_id)
+        for column in STATISTIC_COLUMNS:
+            columns[column].append(values[column])
+        columns["error"].append(errors.get(field_id))
+
+    return columns, sorted(not_found_ids, key=str)
@@ -0,0 +1,96 @@
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
+from uuid import UUID
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.base import settings
+from src.database.postgres.crud import field as crud_field
+from src.database.postgres.crud import time_series as crud_time_series
+from src.models.time_series import NdviObservation
+from src.services.google_earth import get_ndvi_time_series
+from src.utils.conversion import convert_wkb_to_geojson
+
+
+def _utc(value: datetime) -> datetime:
+    # Acquisition times are stored as naive UTC
+    return value.replace(tzinfo=timezone.utc)
+
+
+async def get_field_ndvi_time_series(
+    field_id: UUID,
+    date_start: date,
+    date_end: Optional[date],
+    db: AsyncSession,
+) -> list[NdviObservation]:
+    """
+    Return the per-scene NDVI series of a field between date_start and date_end.
+
+    Only scenes newer than the last stored one (minus `scene_catalog_sync_overlap_days`
+    for late ingestion) are computed on GEE, at most once per
+    `ndvi_time_series_refresh_minutes`, plus a one-off backfill when date_start is earlier
+    than anything requested before. Scenes computed again replace the stored values.
+
+    Raises:
+        FieldNotFoundException: If the field does not exist or is deleted.
+    """
+    field = await crud_field.get_field(field_id=field_id, db=db)
+    boundary = convert_wkb_to_geojson(field.boundary)
+
+    coverage = await crud_time_series.get_time_series_coverage(field_id=field_id, db=db)
+    observations = []
+
+    if coverage is None:
+        covered_from = date_start
+        synced_at = datetime.now()
+        observations = await run_in_threadpool(
+            get_ndvi_time_series,
+            boundary=boundary,
+            newer_than=_utc(datetime.combine(date_start, time())),
+        )
+    else:
+        stored_from, stored_synced_at = coverage
+        covered_from = min(stored_from, date_start)
+        synced_at = stored_synced_at
+
+        if date_start < stored_from:
+            # Backfill the part of the season that was never requested
+            observations += await run_in_threadpool(
+                get_ndvi_time_series,
+                boundary=boundary,
+                newer_than=_utc(datetime.combine(date_start, time())),
+                older_than=_utc(datetime.combine(stored_from, time())),
+            )
+
+        refresh_interval = timedelta(minutes=settings.ndvi_time_series_refresh_minutes)
+        if stored_synced_at < datetime.now() - refresh_interval:
+            latest = await crud_time_series.get_latest_acquisition_time(
+                field_id=field_id, db=db
+            )
+            newer_than = datetime.combine(stored_from, time())
+            if latest:
+                # Scenes can be ingested after newer ones, look back over an overlap
+                overlap = timedelta(days=settings.scene_catalog_sync_overlap_days)
+                newer_than = max(newer_than, latest - overlap)
+
+            synced_at = datetime.now()
+            observations += await run_in_threadpool(
+                get_ndvi_time_series, boundary=boundary, newer_than=_utc(newer_than)
+            )
+
+    if coverage is None or (covered_from, synced_at) != coverage:
+        await crud_time_series.append_observations(
+            field_id=field_id,
+            observations=observations,
+            covered_from=covered_from,
+            synced_at=synced_at,
+            db=db,
+        )
+
+    return await crud_time_series.get_observations(
+        field_id=field_id,
+        start=datetime.combine(date_start, time()),
+        end=datetime.combine(date_end, time()) if date_end else None,
+        db=db,
+    )
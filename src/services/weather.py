@@ -1,16 +1,77 @@
-from typing import Any
+from datetime import date
+from typing import Any, Optional
 
-import requests
+import httpx
 
+from src.config.base import settings
+from src.utils import instrumentation
 
 OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
+OPEN_METEO_ARCHIVE_URL = "https://archive-api.open-meteo.com/v1/archive"
 
+HISTORY_DAILY_VARIABLES = [
+    "temperature_2m_max",
+    "temperature_2m_min",
+    "temperature_2m_mean",
+    "precipitation_sum",
+]
 
-def get_weather_for_coordinates(latitude: float, longitude: float) -> dict[str, Any]:
+# Shared keep-alive connection pool, opened and closed with the application
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _create_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(
+            settings.weather_timeout_seconds,
+            connect=settings.weather_connect_timeout_seconds,
+            pool=settings.weather_pool_timeout_seconds,
+        ),
+        limits=httpx.Limits(
+            max_connections=settings.weather_max_connections,
+            max_keepalive_connections=settings.weather_max_keepalive_connections,
+        ),
+    )
+
+
+async def open_client() -> None:
+    global _client  # pylint: disable=W0603
+    if _client is None:
+        _client = _create_client()
+
+
+async def close_client() -> None:
+    global _client  # pylint: disable=W0603
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_client() -> httpx.AsyncClient:
+    # Outside the application lifespan (scripts, background runs) a pool is opened on demand
+    global _client  # pylint: disable=W0603
+    if _client is None:
+        _client = _create_client()
+    return _client
+
+
+async def get_weather_for_coordinates(
+    latitude: float, longitude: float
+) -> dict[str, Any]:
     """Fetch current weather and 7-day daily forecast from Open-Meteo API."""
-    params = {
-        "latitude": latitude,
-        "longitude": longitude,
+    return (await get_weather_for_locations([(latitude, longitude)]))[0]
+
+
+async def get_weather_for_locations(
+    locations: list[tuple[float, float]],
+) -> list[dict[str, Any]]:
+    """
+    Fetch current weather and 7-day daily forecast for many (latitude, longitude)
+    locations in one Open-Meteo request. Results are in the order of the locations.
+    """
+    params: dict[str, str | int] = {
+        "latitude": ",".join(str(latitude) for latitude, _ in locations),
+        "longitude": ",".join(str(longitude) for _, longitude in locations),
         "current": ",".join(
             [
                 "temperature_2m",
@@ -35,10 +96,46 @@ def get_weather_for_coordinates(latitude: float, longitude: float) -> dict[str,
         "forecast_days": 7,
     }
 
-    response = requests.get(OPEN_METEO_URL, params=params, timeout=10)
+    with instrumentation.span("open_meteo", "forecast"):
+        response = await get_client().get(OPEN_METEO_URL, params=params)
+    response.raise_for_status()
+
+    # A single location is returned as an object, several as a list
+    data = response.json()
+    return data if isinstance(data, list) else [data]
+
+
+async def get_daily_weather_for_locations(
+    locations: list[tuple[float, float]],
+    start_date: date,
+    end_date: date,
+    archive: bool = True,
+) -> list[dict[str, list]]:
+    """
+    Fetch daily temperature and precipitation between start_date and end_date (inclusive)
+    for many (latitude, longitude) locations. Past dates come from the reanalysis archive,
+    recent ones (`archive=False`) from the forecast API, which covers the last months.
+
+    Returns per location the `daily` arrays: `time` and `HISTORY_DAILY_VARIABLES`.
+    """
+    params = {
+        "latitude": ",".join(str(latitude) for latitude, _ in locations),
+        "longitude": ",".join(str(longitude) for _, longitude in locations),
+        "daily": ",".join(HISTORY_DAILY_VARIABLES),
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "timezone": "auto",
+    }
+
+    url = OPEN_METEO_ARCHIVE_URL if archive else OPEN_METEO_URL
+    with instrumentation.span("open_meteo", "archive" if archive else "daily"):
+        response = await get_client().get(url, params=params)
     response.raise_for_status()
 
-    return response.json()
+    data = response.json()
+    return [
+        location["daily"] for location in (data if isinstance(data, list) else [data])
+    ]
 
 
 # WMO Weather interpretation codes -> human-readable descriptions
@@ -0,0 +1,220 @@
+import asyncio
+from collections import Counter
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.base import settings
+from src.database.postgres.crud import weather as crud_weather
+from src.services.weather import get_weather_for_locations
+from src.utils import instrumentation
+from src.utils.cache import TTLCache
+
+# Per-process layer in front of the shared weather_cache table
+memory_cache = TTLCache(maxsize=settings.weather_cache_size, ttl=3600)
+
+metrics: dict[str, int] = {
+    "requests": 0,
+    "memory_hits": 0,
+    "database_hits": 0,
+    "upstream_calls": 0,
+}
+
+# One upstream call per grid cell at a time, concurrent requests wait for it
+_cell_locks: dict[str, asyncio.Lock] = {}
+# Requests holding or waiting for each cell lock, the lock is dropped after the last one
+_cell_lock_users: Counter[str] = Counter()
+_last_cleanup: Optional[datetime] = None
+_started_at = datetime.now()
+
+
+def snap_to_grid(
+    latitude: float, longitude: float, step: Optional[float] = None
+) -> tuple[float, float]:
+    """Snap coordinates to a grid of `step` degrees, by default `weather_grid_degrees`."""
+    step = step or settings.weather_grid_degrees
+    return round(round(latitude / step) * step, 6), round(
+        round(longitude / step) * step, 6
+    )
+
+
+def next_model_update(now: datetime) -> datetime:
+    """
+    The next time new model data is available: every hour,
+    `weather_update_offset_minutes` after the full hour.
+    """
+    offset = timedelta(minutes=settings.weather_update_offset_minutes)
+    update = now.replace(minute=0, second=0, microsecond=0) + offset
+    while update <= now:
+        update += timedelta(hours=1)
+    return update
+
+
+@asynccontextmanager
+async def _cell_lock(cell: str) -> AsyncIterator[None]:
+    lock = _cell_locks.setdefault(cell, asyncio.Lock())
+    _cell_lock_users[cell] += 1
+    try:
+        async with lock:
+            yield
+    finally:
+        _cell_lock_users[cell] -= 1
+        if not _cell_lock_users[cell]:
+            del _cell_lock_users[cell]
+            del _cell_locks[cell]
+
+
+async def get_cached_weather(
+    latitude: float, longitude: float, db: AsyncSession
+) -> dict[str, Any]:
+    """
+    Weather of the grid cell containing the coordinates, from the in-process LRU,
+    then the shared Postgres cache, then Open-Meteo. Entries expire at the next model update.
+    """
+    payload = (await get_cached_weather_many([(latitude, longitude)], db=db))[0]
+    if isinstance(payload, Exception):
+        raise payload
+    return payload
+
+
+async def get_cached_weather_many(
+    locations: list[tuple[float, float]], db: AsyncSession
+) -> list[dict[str, Any] | Exception]:
+    """
+    Weather of many (latitude, longitude) locations, in their order. Locations are
+    deduplicated by grid cell and cache misses are fetched from Open-Meteo in chunks of
+    `weather_batch_chunk_size` cells, concurrently. A location whose chunk failed gets the error.
+    """
+    cells: dict[str, tuple[float, float]] = {}
+    location_cells = []
+    for latitude, longitude in locations:
+        latitude, longitude = snap_to_grid(latitude, longitude)
+        cell = f"{latitude},{longitude}"
+        cells[cell] = (latitude, longitude)
+        location_cells.append(cell)
+
+    metrics["requests"] += len(cells)
+
+    payloads: dict[str, dict[str, Any] | Exception] = {}
+    for cell in cells:
+        payload = memory_cache.get(cell)
+        if payload is not None:
+            payloads[cell] = payload
+    metrics["memory_hits"] += len(payloads)
+
+    missing = sorted(cell for cell in cells if cell not in payloads)
+    if missing:
+        async with AsyncExitStack() as stack:
+            # One upstream call per grid cell at a time, concurrent requests wait for it.
+            # Locks are taken in sorted order, so overlapping batches cannot deadlock.
+            for cell in missing:
+                await stack.enter_async_context(_cell_lock(cell))
+            payloads.update(await _load(missing, cells, db))
+
+    return [payloads[cell] for cell in location_cells]
+
+
+async def _load(
+    missing: list[str], cells: dict[str, tuple[float, float]], db: AsyncSession
+) -> dict[str, dict[str, Any] | Exception]:
+    loaded: dict[str, dict[str, Any] | Exception] = {}
+
+    # Other requests may have filled the cache while this one waited
+    for cell in missing:
+        payload = memory_cache.get(cell)
+        if payload is not None:
+            loaded[cell] = payload
+    metrics["memory_hits"] += len(loaded)
+
+    now = datetime.now()
+    remaining = [cell for cell in missing if cell not in loaded]
+    if remaining:
+        cached = await crud_weather.get_cached_weather(cells=remaining, db=db, now=now)
+        metrics["database_hits"] += len(cached)
+        for cell, payload, expires_at in cached:
+            loaded[cell] = payload
+            memory_cache.set(cell, payload, ttl=(expires_at - now).total_seconds())
+
+    upstream = [cell for cell in remaining if cell not in loaded]
+    if not upstream:
+        return loaded
+
+    chunk_size = settings.weather_batch_chunk_size
+    chunks = [
+        upstream[start : start + chunk_size]
+        for start in range(0, len(upstream), chunk_size)
+    ]
+    semaphore = asyncio.Semaphore(settings.weather_batch_concurrency)
+
+    async def fetch(chunk: list[str]) -> list[dict[str, Any]] | Exception:
+        async with semaphore:
+            try:
+                return await get_weather_for_locations([cells[cell] for cell in chunk])
+            except Exception as e:
+                # The cells of a failed chunk get the error, the others their weather
+                return e
+
+    metrics["upstream_calls"] += len(chunks)
+    results = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+
+    expires_at = next_model_update(now)
+    entries: list[dict[str, Any]] = []
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, Exception):
+            loaded.update({cell: result for cell in chunk})
+            continue
+
+        for cell, payload in zip(chunk, result):
+            loaded[cell] = payload
+            memory_cache.set(cell, payload, ttl=(expires_at - now).total_seconds())
+            entries.append(
+                {
+                    "cell": cell,
+                    "latitude": cells[cell][0],
+                    "longitude": cells[cell][1],
+                    "payload": payload,
+                    "fetched_at": now,
+                    "expires_at": expires_at,
+                }
+            )
+
+    if entries:
+        await crud_weather.upsert_cached_weather(entries=entries, db=db)
+        await _cleanup(db, now)
+
+    return loaded
+
+
+async def _cleanup(db: AsyncSession, now: datetime) -> None:
+    global _last_cleanup  # pylint: disable=W0603
+    if _last_cleanup is None or now - _last_cleanup > timedelta(hours=1):
+        _last_cleanup = now
+        await crud_weather.delete_expired_weather(db=db, now=now)
+
+
+def _cache_stats() -> dict[str, int]:
+    # Database hits count as hits, only upstream calls are misses
+    return {
+        "size": memory_cache.stats()["size"],
+        "hits": metrics["memory_hits"] + metrics["database_hits"],
+        "misses": metrics["requests"]
+        - metrics["memory_hits"]
+        - metrics["database_hits"],
+    }
+
+
+instrumentation.register_cache("weather", _cache_stats)
+
+
+def get_metrics() -> dict[str, Any]:
+    requests = metrics["requests"] or 1
+    minutes = max((datetime.now() - _started_at).total_seconds() / 60, 1)
+    return {
+        **metrics,
+        "hit_ratio": (metrics["memory_hits"] + metrics["database_hits"]) / requests,
+        "upstream_call_ratio": metrics["upstream_calls"] / requests,
+        "upstream_calls_per_minute": metrics["upstream_calls"] / minutes,
+        "memory_entries": memory_cache.stats()["size"],
+    }
@@ -0,0 +1,237 @@
+import asyncio
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Any, Optional
+from uuid import UUID
+
+import numpy as np
+from geoalchemy2.shape import to_shape
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.base import settings
+from src.database.postgres.crud import field as crud_field
+from src.database.postgres.crud import weather_history as crud_weather_history
+from src.services.weather import get_daily_weather_for_locations
+from src.services.weather_cache import snap_to_grid
+
+ONE_DAY = timedelta(days=1)
+
+
+def _missing_ranges(
+    coverage: Optional[tuple[date, date]], date_start: date, date_end: date
+) -> list[tuple[date, date]]:
+    """
+    Date ranges to fetch so that a cell covers [date_start, date_end] contiguously.
+    Days newer than `weather_archive_lag_days` are provisional, so they are fetched
+    again whenever newer days are appended.
+    """
+    if coverage is None:
+        return [(date_start, date_end)]
+
+    first, last = coverage
+    ranges = []
+    if date_start < first:
+        ranges.append((date_start, first - ONE_DAY))
+    if date_end > last:
+        recent_start = date.today() - timedelta(days=settings.weather_archive_lag_days)
+        ranges.append((max(first, min(last + ONE_DAY, recent_start)), date_end))
+    return ranges
+
+
+async def sync_weather_history(
+    cells: dict[str, tuple[float, float]],
+    date_start: date,
+    date_end: date,
+    db: AsyncSession,
+) -> None:
+    """
+    Append the missing daily values of the grid cells between date_start and date_end.
+
+    Cells needing the same date range are fetched together with many locations per
+    Open-Meteo request. Days older than `weather_archive_lag_days` come from the archive.
+    """
+    date_end = min(date_end, date.today() - ONE_DAY)
+    if date_end < date_start:
+        return
+
+    coverage = await crud_weather_history.get_coverage(cells=list(cells), db=db)
+    recent_start = date.today() - timedelta(days=settings.weather_archive_lag_days)
+
+    # (start, end, archive) -> cells
+    requests: dict[tuple[date, date, bool], list[str]] = defaultdict(list)
+    for cell in cells:
+        for start, end in _missing_ranges(coverage.get(cell), date_start, date_end):
+            if start < recent_start:
+                requests[(start, min(end, recent_start - ONE_DAY), True)].append(cell)
+            if end >= recent_start:
+                requests[(max(start, recent_start), end, False)].append(cell)
+
+    if not requests:
+        return
+
+    semaphore = asyncio.Semaphore(settings.weather_batch_concurrency)
+    chunk_size = settings.weather_batch_chunk_size
+
+    async def fetch(
+        start: date, end: date, archive: bool, chunk: list[str]
+    ) -> list[dict[str, Any]]:
+        async with semaphore:
+            results = await get_daily_weather_for_locations(
+                [cells[cell] for cell in chunk], start, end, archive=archive
+            )
+
+        return [
+            {
+                "cell": cell,
+                "date": date.fromisoformat(day),
+                "temperature_max": daily["temperature_2m_max"][index],
+                "temperature_min": daily["temperature_2m_min"][index],
+                "temperature_mean": daily["temperature_2m_mean"][index],
+                "precipitation_sum": daily["precipitation_sum"][index],
+            }
+            for cell, daily in zip(chunk, results)
+            for index, day in enumerate(daily["time"])
+        ]
+
+    results = await asyncio.gather(
+        *(
+            fetch(start, end, archive, request_cells[offset : offset + chunk_size])
+            for (start, end, archive), request_cells in requests.items()
+            for offset in range(0, len(request_cells), chunk_size)
+        )
+    )
+
+    await crud_weather_history.upsert_days(
+        days=[day for days in results for day in days], db=db
+    )
+
+
+def compute_weather_indices(
+    temperature_max: np.ndarray,
+    temperature_min: np.ndarray,
+    precipitation: np.ndarray,
+    base_temperature: float,
+    upper_temperature: float,
+) -> dict[str, np.ndarray]:
+    """
+    Daily agro-weather indices of one series (NaN for missing values):
+    growing degree days with both temperatures clipped to [base, upper]
+    (horizontal cutoff method), precipitation and frost days (minimum below 0 °C),
+    each with its running total.
+    """
+    clipped_max = np.clip(temperature_max, base_temperature, upper_temperature)
+    clipped_min = np.clip(temperature_min, base_temperature, upper_temperature)
+    growing_degree_days = np.nan_to_num(
+        (clipped_max + clipped_min) / 2 - base_temperature
+    )
+    precipitation = np.nan_to_num(precipitation)
+    frost = np.nan_to_num(temperature_min, nan=np.inf) < 0
+
+    return {
+        "growing_degree_days": growing_degree_days,
+        "growing_degree_days_cumulative": np.cumsum(growing_degree_days),
+        "precipitation_cumulative": np.cumsum(precipitation),
+        "frost_days_cumulative": np.cumsum(frost),
+    }
+
+
+async def get_weather_indices(
+    field_ids: list[UUID],
+    date_start: date,
+    date_end: date,
+    base_temperature: float,
+    db: AsyncSession,
+    include_daily: bool = False,
+) -> tuple[dict[UUID, dict[str, Any]], list[UUID]]:
+    """
+    Season totals of growing degree days, precipitation and frost days per field,
+    after appending the missing days of their grid cells to the weather history.
+
+    Returns:
+        tuple: The indices per found field (with the daily series if `include_daily`)
+            and the IDs of the fields that do not exist or are deleted.
+    """
+    fields = await crud_field.get_fields_by_ids(field_ids=field_ids, db=db)
+
+    field_cells: dict[UUID, str] = {}
+    cells: dict[str, tuple[float, float]] = {}
+    for field in fields:
+        centroid = to_shape(field.boundary).centroid  # type: ignore[arg-type]
+        latitude, longitude = snap_to_grid(
+            centroid.y, centroid.x, step=settings.weather_history_grid_degrees
+        )
+        cell = f"{latitude},{longitude}"
+        field_cells[field.id] = cell  # type: ignore[index]
+        cells[cell] = (latitude, longitude)
+
+    not_found = [field_id for field_id in field_ids if field_id not in field_cells]
+    if not cells:
+        return {}, not_found
+
+    await sync_weather_history(
+        cells=cells, date_start=date_start, date_end=date_end, db=db
+    )
+    rows = await crud_weather_history.get_days(
+        cells=list(cells), date_start=date_start, date_end=date_end, db=db
+    )
+
+    indices: dict[str, dict[str, Any]] = {}
+    if rows:
+        columns = list(zip(*rows))
+        row_cells = np.array(columns[0])
+        temperature_max = np.array(columns[2], dtype=np.float64)
+        temperature_min = np.array(columns[3], dtype=np.float64)
+        precipitation = np.array(columns[5], dtype=np.float64)
+
+        # Rows are ordered by cell, so every cell is one contiguous slice
+        starts = [0, *(np.flatnonzero(row_cells[1:] != row_cells[:-1]) + 1)]
+        bounds = zip(starts, [*starts[1:], len(rows)])
+        for start, end in bounds:
+            daily = compute_weather_indices(
+                temperature_max[start:end],
+                temperature_min[start:end],
+                precipitation[start:end],
+                base_temperature=base_temperature,
+                upper_temperature=settings.gdd_upper_temperature,
+            )
+            cell_indices: dict[str, Any] = {
+                "days": int(end - start),
+                "growing_degree_days": float(
+                    daily["growing_degree_days_cumulative"][-1]
+                ),
+                "precipitation_sum": float(daily["precipitation_cumulative"][-1]),
+                "frost_days": int(daily["frost_days_cumulative"][-1]),
+            }
+            if include_daily:
+                cell_indices["daily"] = [
+                    {
+                        "date": columns[1][start + index],
+                        "temperature_max": columns[2][start + index],
+                        "temperature_min": columns[3][start + index],
+                        "precipitation_sum": columns[5][start + index],
+                        "growing_degree_days": float(
+                            daily["growing_degree_days_cumulative"][index]
+                        ),
+                        "precipitation_cumulative": float(
+                            daily["precipitation_cumulative"][index]
+                        ),
+                        "frost_days": int(daily["frost_days_cumulative"][index]),
+                    }
+                    for index in range(end - start)
+                ]
+            indices[row_cells[start]] = cell_indices
+
+    def empty() -> dict[str, Any]:
+        values: dict[str, Any] = {
+            "days": 0,
+            "growing_degree_days": 0.0,
+            "precipitation_sum": 0.0,
+            "frost_days": 0,
+        }
+        if include_daily:
+            values["daily"] = []
+        return values
+
+    return {
+        field_id: indices.get(cell) or empty() for field_id, cell in field_cells.items()
+    }, not_found
@@ -1,33 +1,16 @@
-from shapely.geometry import shape, mapping
-from shapely.validation import explain_validity
+from shapely.geometry import mapping
 from geoalchemy2.shape import to_shape
 
-from src.common.exceptions import InvalidGeoJSONException, SelfIntersectionException
+from src.utils.geometry import canonicalize
 
 
 def validate_and_convert_geojson(geojson_data: dict):
     """
     Validates the GeoJSON, converts it to WKT format, and fixes self-intersections if necessary.
     Raises exceptions if validation fails or the geometry cannot be fixed.
+    Results are memoized, see `src.utils.geometry.canonicalize`.
     """
-    try:
-        # Convert GeoJSON to a Shapely shape
-        geom = shape(geojson_data)
-    except (ValueError, TypeError) as exc:
-        raise InvalidGeoJSONException() from exc
-
-    # Check validity of the geometry
-    if not geom.is_valid:
-        if "Self-intersection" in explain_validity(geom):
-            # Attempt to fix self-intersecting geometry
-            geom = geom.buffer(0)
-            if not geom.is_valid:
-                raise SelfIntersectionException()
-        else:
-            raise InvalidGeoJSONException(message=explain_validity(geom))
-
-    # Return the WKT representation
-    return geom.wkt
+    return canonicalize(geojson_data).wkt
 
 
 def convert_wkb_to_geojson(wkb_element):
@@ -0,0 +1,101 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Optional, Union, cast
+
+from geoalchemy2 import WKBElement
+from shapely import wkb
+from shapely.geometry import mapping, shape
+from shapely.geometry.base import BaseGeometry
+from shapely.validation import explain_validity
+from sqlalchemy import func
+
+from src.common.exceptions import InvalidGeoJSONException, SelfIntersectionException
+from src.config.base import settings
+from src.utils import instrumentation
+from src.utils.cache import TTLCache
+
+METERS_PER_DEGREE = 111_320
+
+
+@dataclass(frozen=True)
+class CanonicalGeometry:
+    """A validated boundary with the representations the services need, computed once."""
+
+    geometry: BaseGeometry
+    ewkb: bytes
+    wkt: str
+    bbox: tuple[float, float, float, float]
+
+    @property
+    def geojson(self) -> dict[str, Any]:
+        return cast(dict[str, Any], mapping(self.geometry))
+
+    def to_element(self) -> WKBElement:
+        """The geometry as a column value, bound as EWKB without reparsing."""
+        return WKBElement(self.ewkb, srid=4326, extended=True)
+
+    def to_sql(self):
+        """The geometry as a SQL expression, for spatial predicates."""
+        return func.ST_GeomFromEWKB(self.ewkb)
+
+
+# Keyed on a hash of the raw GeoJSON, so repeated requests for a boundary skip Shapely
+_cache = TTLCache(maxsize=settings.geometry_cache_size, ttl=float("inf"))
+instrumentation.register_cache("geometry", _cache.stats)
+
+
+def _raw_key(geojson: dict) -> bytes:
+    raw = json.dumps(
+        [geojson.get("type"), geojson.get("coordinates")], separators=(",", ":")
+    )
+    return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+
+def _build(geojson: dict) -> CanonicalGeometry:
+    try:
+        geom = shape(geojson)
+    except (ValueError, TypeError, AttributeError) as exc:
+        raise InvalidGeoJSONException() from exc
+
+    if not geom.is_valid:
+        reason = explain_validity(geom)
+        if "Self-intersection" not in reason:
+            raise InvalidGeoJSONException(message=reason)
+
+        # Attempt to fix self-intersecting geometry
+        geom = geom.buffer(0)
+        if not geom.is_valid:
+            raise SelfIntersectionException()
+
+    return CanonicalGeometry(
+        geometry=geom,
+        ewkb=wkb.dumps(geom, srid=4326),
+        wkt=geom.wkt,
+        bbox=geom.bounds,
+    )
+
+
+def canonicalize(boundary: Union[dict, CanonicalGeometry]) -> CanonicalGeometry:
+    """
+    Validate a GeoJSON boundary once, fixing self-intersections if possible.
+    Already canonical boundaries are returned as is.
+
+    Raises:
+        InvalidGeoJSONException: If the GeoJSON cannot be parsed or the geometry is invalid.
+        SelfIntersectionException: If a self-intersecting geometry cannot be fixed.
+    """
+    if isinstance(boundary, CanonicalGeometry):
+        return boundary
+
+    key = _raw_key(boundary)
+    canonical: Optional[CanonicalGeometry] = _cache.get(key)
+    if canonical is None:
+        with instrumentation.span("shapely", "canonicalize"):
+            canonical = _build(boundary)
+        _cache.set(key, canonical)
+    return canonical
+
+
+def get_cache_stats() -> dict[str, int]:
+    return _cache.stats()
@@ -0,0 +1,178 @@
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Callable, Iterator, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import REGISTRY, Collector
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+# GEE calls take seconds to minutes, database queries milliseconds
+DURATION_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+    120,
+)
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Duration of HTTP requests until the end of the response body.",
+    ["method", "route", "status"],
+    buckets=DURATION_BUCKETS,
+)
+UPSTREAM_DURATION = Histogram(
+    "upstream_duration_seconds",
+    "Duration of calls to PostgreSQL, GEE, Open-Meteo and Shapely validation.",
+    ["upstream", "operation"],
+    buckets=DURATION_BUCKETS,
+)
+DB_CONNECTIONS_IN_USE = Gauge(
+    "db_connections_in_use", "Database connections checked out of their pools."
+)
+DB_CONNECTIONS_OPENED = Counter(
+    "db_connections_opened", "Database connections opened by the pools."
+)
+
+
+class RequestTimings:
+    """Time spent per upstream during one request, also by threadpool workers."""
+
+    def __init__(self) -> None:
+        self.durations: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, upstream: str, duration: float) -> None:
+        with self._lock:
+            self.durations[upstream] = self.durations.get(upstream, 0.0) + duration
+            self.counts[upstream] = self.counts.get(upstream, 0) + 1
+
+    def server_timing(self, total: float) -> str:
+        """The `Server-Timing` header value, durations in milliseconds."""
+        with self._lock:
+            metrics = [
+                f'{upstream};dur={duration * 1000:.1f};desc="{self.counts[upstream]} calls"'
+                for upstream, duration in self.durations.items()
+            ]
+        metrics.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(metrics)
+
+
+_timings: ContextVar[Optional[RequestTimings]] = ContextVar("timings", default=None)
+# Upstreams of the enclosing spans, nested calls are part of the outer one
+_active: ContextVar[frozenset[str]] = ContextVar("active", default=frozenset())
+
+
+def start_request(timings: RequestTimings) -> Token:
+    return _timings.set(timings)
+
+
+def end_request(token: Token) -> None:
+    _timings.reset(token)
+
+
+def record(upstream: str, operation: str, duration: float) -> None:
+    UPSTREAM_DURATION.labels(upstream, operation).observe(duration)
+    timings = _timings.get()
+    if timings is not None:
+        timings.add(upstream, duration)
+
+
+@contextmanager
+def span(upstream: str, operation: str) -> Iterator[None]:
+    """Time the enclosed call to `upstream`, for the metrics and the current request."""
+    active = _active.get()
+    if upstream in active:
+        yield
+        return
+
+    token = _active.set(active | {upstream})
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _active.reset(token)
+        record(upstream, operation, time.perf_counter() - started)
+
+
+def instrument_database() -> None:
+    """Time every statement and track the pooled connections of all engines."""
+
+    @event.listens_for(Engine, "before_cursor_execute")
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(Engine, "after_cursor_execute")
+    def after_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started"].pop()
+        operation = statement.lstrip().split(None, 1)[0].lower() if statement else ""
+        record("postgres", operation, time.perf_counter() - started)
+
+    @event.listens_for(Engine, "handle_error")
+    def on_error(context):
+        if context.connection is not None:
+            started = context.connection.info.get("query_started")
+            if started:
+                started.pop()
+
+    @event.listens_for(Pool, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        DB_CONNECTIONS_OPENED.inc()
+
+    @event.listens_for(Pool, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        DB_CONNECTIONS_IN_USE.inc()
+
+    @event.listens_for(Pool, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        DB_CONNECTIONS_IN_USE.dec()
+
+
+# Stats of the in-process caches by name, see register_cache
+_caches: dict[str, Callable[[], dict[str, int]]] = {}
+
+
+def register_cache(name: str, stats: Callable[[], dict[str, int]]) -> None:
+    """Expose a cache in the metrics. `stats` returns its `size`, `hits` and `misses`."""
+    _caches[name] = stats
+
+
+class _CacheCollector(Collector):
+    def collect(self):
+        size = GaugeMetricFamily(
+            "cache_entries", "Entries per cache.", labels=["cache"]
+        )
+        hits = CounterMetricFamily("cache_hits", "Hits per cache.", labels=["cache"])
+        misses = CounterMetricFamily(
+            "cache_misses", "Misses per cache.", labels=["cache"]
+        )
+        ratio = GaugeMetricFamily(
+            "cache_hit_ratio", "Hits per lookup since start.", labels=["cache"]
+        )
+        for name, stats in _caches.items():
+            values = stats()
+            lookups = values["hits"] + values["misses"]
+            size.add_metric([name], values["size"])
+            hits.add_metric([name], values["hits"])
+            misses.add_metric([name], values["misses"])
+            ratio.add_metric([name], values["hits"] / lookups if lookups else 0.0)
+        return [size, hits, misses, ratio]
+
+
+REGISTRY.register(_CacheCollector())
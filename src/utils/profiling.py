@@ -0,0 +1,181 @@
+import asyncio
+import json
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+# Stacks of worker threads are kept only when they run code of the application
+APP_DIR = str(Path(__file__).resolve().parent.parent)
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+PROFILE_SUFFIX = ".speedscope.json"
+
+Frame = tuple[str, str, int]
+
+
+class Sampler:
+    """
+    Sample the stacks of the threads working on one request every `interval` seconds.
+
+    The event loop thread is sampled while it runs the task of the request, so concurrent
+    requests do not show up in the profile. Worker threads (sync endpoints, GEE calls)
+    are sampled while they run application code, which under load may include the work
+    of concurrent requests.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.loop = asyncio.get_running_loop()
+        self.task = asyncio.current_task()
+        self.loop_thread_id = threading.get_ident()
+        # Stacks by thread with the time since the previous sample, the sampler thread
+        # competes for the GIL and may wake up later than every interval
+        self.samples: dict[int, list[tuple[tuple[Frame, ...], float]]] = {}
+        self.started = 0.0
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="request-profiler", daemon=True
+        )
+
+    def start(self) -> None:
+        self.started = time.perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.duration = time.perf_counter() - self.started
+
+    def _run(self) -> None:
+        own_thread_id = threading.get_ident()
+        last = self.started
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            elapsed, last = now - last, now
+            for (
+                thread_id,
+                frame,
+            ) in sys._current_frames().items():  # pylint: disable=W0212
+                if thread_id == own_thread_id:
+                    continue
+                on_loop = thread_id == self.loop_thread_id
+                if on_loop and asyncio.current_task(self.loop) is not self.task:
+                    continue
+
+                stack = _stack(frame)
+                if not on_loop and not any(
+                    file.startswith(APP_DIR) for _, file, _ in stack
+                ):
+                    continue
+                self.samples.setdefault(thread_id, []).append((stack, elapsed))
+
+    def to_speedscope(self, name: str) -> dict[str, Any]:
+        """The samples as a speedscope file, one sampled profile per thread."""
+        frames: list[Frame] = []
+        frame_index: dict[Frame, int] = {}
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+
+        profiles = []
+        for thread_id, stacks in self.samples.items():
+            samples = []
+            weights = []
+            for stack, elapsed in stacks:
+                indexes = []
+                for frame in stack:
+                    if frame not in frame_index:
+                        frame_index[frame] = len(frames)
+                        frames.append(frame)
+                    indexes.append(frame_index[frame])
+                samples.append(indexes)
+                weights.append(elapsed)
+
+            thread_name = (
+                "request"
+                if thread_id == self.loop_thread_id
+                else thread_names.get(thread_id, str(thread_id))
+            )
+            profiles.append(
+                {
+                    "type": "sampled",
+                    "name": thread_name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            )
+
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": f"{name} ({self.duration * 1000:.0f} ms)",
+            "exporter": "geo-location-service",
+            "activeProfileIndex": 0,
+            "shared": {
+                "frames": [
+                    {"name": function, "file": file, "line": line}
+                    for function, file, line in frames
+                ]
+            },
+            "profiles": profiles,
+        }
+
+
+def _stack(frame) -> tuple[Frame, ...]:
+    """The stack from the outermost to the innermost frame, by function."""
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append((code.co_qualname, code.co_filename, code.co_firstlineno))
+        frame = frame.f_back
+    stack.reverse()
+    return tuple(stack)
+
+
+def new_profile_name(method: str) -> str:
+    return f"{datetime.now():%Y%m%dT%H%M%S}-{method.lower()}-{uuid.uuid4().hex[:8]}"
+
+
+def save_profile(
+    sampler: Sampler, name: str, title: str, directory: str, max_files: int
+) -> None:
+    """Write a profile to `directory`, removing the oldest beyond `max_files`."""
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    (path / f"{name}{PROFILE_SUFFIX}").write_text(
+        json.dumps(sampler.to_speedscope(title), separators=(",", ":"))
+    )
+
+    profiles = sorted(
+        path.glob(f"*{PROFILE_SUFFIX}"), key=lambda file: file.stat().st_mtime
+    )
+    for stale in profiles[: max(len(profiles) - max_files, 0)]:
+        stale.unlink(missing_ok=True)
+
+
+def list_profiles(directory: str) -> list[dict[str, Any]]:
+    """The stored profiles, newest first."""
+    profiles = []
+    for file in Path(directory).glob(f"*{PROFILE_SUFFIX}"):
+        stat = file.stat()
+        profiles.append(
+            {
+                "name": file.name.removesuffix(PROFILE_SUFFIX),
+                "size": stat.st_size,
+                "created": datetime.fromtimestamp(stat.st_mtime),
+            }
+        )
+    return sorted(profiles, key=lambda profile: profile["created"], reverse=True)
+
+
+def get_profile_path(directory: str, name: str) -> Optional[Path]:
+    path = Path(directory) / f"{name}{PROFILE_SUFFIX}"
+    # Names come from requests, only plain file names inside the directory are served
+    if Path(name).name != name or not path.is_file():
+        return None
+    return path
@@ -0,0 +1,99 @@
+import struct
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+LUT_SIZE = 256
+
+
+@lru_cache(maxsize=64)
+def build_palette_lut(palette: tuple[str, ...]) -> np.ndarray:
+    """
+    Build a (256, 3) uint8 lookup table by linearly interpolating a list of hex colors,
+    the same way GEE stretches a `palette` between `min` and `max`.
+    """
+    colors = np.array(
+        [[int(color[i : i + 2], 16) for i in (0, 2, 4)] for color in palette],
+        dtype=np.float64,
+    )
+    stops = np.linspace(0, 1, len(colors))
+    positions = np.linspace(0, 1, LUT_SIZE)
+
+    lut = np.stack(
+        [np.interp(positions, stops, colors[:, channel]) for channel in range(3)],
+        axis=-1,
+    )
+    return np.round(lut).astype(np.uint8)
+
+
+def _normalize(values: np.ndarray, vmin: float, vmax: float) -> np.ndarray:
+    span = (vmax - vmin) or 1.0
+    return np.clip((values - vmin) / span, 0.0, 1.0)
+
+
+def apply_palette(
+    values: np.ndarray, vmin: float, vmax: float, palette: list[str]
+) -> np.ndarray:
+    """
+    Map a single band to an RGBA image through a palette lookup table.
+    NaN pixels become fully transparent.
+    """
+    lut = build_palette_lut(tuple(palette))
+    valid = ~np.isnan(values)
+
+    indices = (
+        _normalize(np.nan_to_num(values, nan=vmin), vmin, vmax) * (LUT_SIZE - 1)
+    ).astype(np.uint8)
+
+    rgba = np.empty(values.shape + (4,), dtype=np.uint8)
+    rgba[..., :3] = lut[indices]
+    rgba[..., 3] = np.where(valid, 255, 0)
+    return rgba
+
+
+def stretch_rgb(
+    red: np.ndarray, green: np.ndarray, blue: np.ndarray, vmin: float, vmax: float
+) -> np.ndarray:
+    """Linearly stretch three bands into an RGBA image. NaN pixels become fully transparent."""
+    bands = np.stack([red, green, blue], axis=-1)
+    valid = ~np.isnan(bands).any(axis=-1)
+
+    rgba = np.empty(red.shape + (4,), dtype=np.uint8)
+    rgba[..., :3] = (
+        _normalize(np.nan_to_num(bands, nan=vmin), vmin, vmax) * 255
+    ).astype(np.uint8)
+    rgba[..., 3] = np.where(valid, 255, 0)
+    return rgba
+
+
+def normalized_difference(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """(first - second) / (first + second), as computed by GEE's `normalizedDifference`."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.asarray((first - second) / (first + second))
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    return (
+        struct.pack(">I", len(data))
+        + chunk_type
+        + data
+        + struct.pack(">I", zlib.crc32(chunk_type + data) & 0xFFFFFFFF)
+    )
+
+
+def encode_png(rgba: np.ndarray, compression_level: int = 6) -> bytes:
+    """Encode a (height, width, 4) uint8 array as a PNG image."""
+    height, width = rgba.shape[:2]
+
+    # Every scanline is prefixed with filter type 0 (None)
+    scanlines = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    scanlines[:, 1:] = np.ascontiguousarray(rgba, dtype=np.uint8).reshape(height, -1)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + _png_chunk(b"IHDR", header)
+        + _png_chunk(b"IDAT", zlib.compress(scanlines.tobytes(), compression_level))
+        + _png_chunk(b"IEND", b"")
+    )
@@ -0,0 +1,119 @@
+"""
+Tests of the field batch against a scratch PostGIS database.
+
+The field tables of the database named by `TEST_POSTGRES_DATABASE` are recreated,
+the tests are skipped when it is not set.
+"""
+
+import asyncio
+import os
+from typing import cast
+
+import pytest
+from sqlalchemy import Table, func, select, text
+
+from src.api.schemas.field import FieldBatchRequest
+from src.config.base import settings
+from src.database.common.dependencies import BaseSQL
+from src.database.postgres.handler import PostgreSQLHandler as DatabaseHandler
+from src.models.field import Field, FieldArchive
+from src.services import field_batch
+
+TEST_DATABASE = os.environ.get("TEST_POSTGRES_DATABASE")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE or TEST_DATABASE == settings.postgres_database,
+    reason="TEST_POSTGRES_DATABASE is not set to a scratch database",
+)
+
+
+def _square(x: float, y: float) -> dict:
+    return {
+        "type": "Polygon",
+        "coordinates": [
+            [[x, y], [x + 0.01, y], [x + 0.01, y + 0.01], [x, y + 0.01], [x, y]]
+        ],
+    }
+
+
+async def _reset(db_handler: DatabaseHandler) -> None:
+    tables = [cast(Table, Field.__table__), cast(Table, FieldArchive.__table__)]
+    async with db_handler.engine.begin() as connection:
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
+        await connection.run_sync(BaseSQL.metadata.drop_all, tables=tables)
+        await connection.run_sync(BaseSQL.metadata.create_all, tables=tables)
+
+
+async def _batch_update() -> tuple[list[dict], dict]:
+    db_handler = DatabaseHandler(database=TEST_DATABASE)
+    try:
+        await _reset(db_handler)
+
+        async with db_handler.session_factory() as db:
+            created = await field_batch.apply_field_batch(
+                request=FieldBatchRequest.model_validate(
+                    {
+                        "operations": [
+                            {"op": "create", "field": {"boundary": _square(30 + i, 50)}}
+                            for i in range(3)
+                        ]
+                    }
+                ),
+                db=db,
+            )
+        first, second, third = (result["id"] for result in created)
+
+        # Updates of different columns end up in one bulk UPDATE by primary key
+        async with db_handler.session_factory() as db:
+            results = await field_batch.apply_field_batch(
+                request=FieldBatchRequest.model_validate(
+                    {
+                        "operations": [
+                            {"op": "update", "id": first, "field": {"image_url": "a"}},
+                            {
+                                "op": "update",
+                                "id": second,
+                                "field": {"ndvi_url": "b", "boundary": _square(40, 50)},
+                            },
+                            {"op": "delete", "id": third},
+                        ]
+                    }
+                ),
+                db=db,
+            )
+
+        async with db_handler.session_factory() as db:
+            rows = await db.execute(
+                select(
+                    Field.id,
+                    Field.image_url,
+                    Field.ndvi_url,
+                    Field.version,
+                    Field.deletion_date,
+                    func.ST_XMin(Field.boundary).label("x_min"),
+                )
+            )
+            fields = {row.id: row for row in rows}
+
+        return results, {"ids": (first, second, third), "fields": fields}
+    finally:
+        await db_handler.engine.dispose()
+
+
+def test_batch_update_applies_every_operation():
+    results, state = asyncio.run(_batch_update())
+    first, second, third = state["ids"]
+    fields = state["fields"]
+
+    assert [result["status"] for result in results] == ["applied"] * 3
+
+    assert fields[first].image_url == "a"
+    assert fields[first].ndvi_url is None
+    assert fields[first].version == 2
+
+    assert fields[second].image_url is None
+    assert fields[second].ndvi_url == "b"
+    assert fields[second].x_min == pytest.approx(40)
+    assert fields[second].version == 2
+
+    assert fields[third].deletion_date is not None
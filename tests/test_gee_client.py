@@ -0,0 +1,59 @@
+"""
+Tests of the GEE client resilience: circuit breaker and quota token bucket.
+"""
+
+import time
+
+import pytest
+
+from src.common.exceptions import GeeUnavailableException
+from src.config.base import settings
+from src.services.gee_client import CircuitBreaker, GeeClient, TokenBucket
+
+RESET_TIMEOUT = 0.05
+
+
+@pytest.fixture
+def client(monkeypatch) -> GeeClient:
+    monkeypatch.setattr(settings, "gee_max_queue_wait_seconds", 0)
+    monkeypatch.setattr(settings, "gee_max_retries", 0)
+
+    client = GeeClient()
+    client.breaker = CircuitBreaker(failure_threshold=1, reset_timeout=RESET_TIMEOUT)
+    return client
+
+
+def _open_circuit(client: GeeClient) -> None:
+    client.breaker.record_failure()
+    assert client.breaker.state == CircuitBreaker.OPEN
+    time.sleep(RESET_TIMEOUT)
+
+
+def test_open_circuit_rejects_calls(client):
+    client.breaker.record_failure()
+
+    with pytest.raises(GeeUnavailableException):
+        client.call(lambda: "result")
+
+    assert client.metrics["circuit_rejected"] == 1
+
+
+def test_trial_call_timing_out_on_quota_keeps_the_circuit_usable(client):
+    _open_circuit(client)
+
+    # No token left and none refilled within the (zero) queue wait
+    client.bucket = TokenBucket(rate=0.001, capacity=1)
+    client.bucket.acquire()
+
+    with pytest.raises(GeeUnavailableException):
+        client.call(lambda: "result")
+
+    assert client.metrics["rate_limited"] == 1
+    assert client.breaker.state == CircuitBreaker.OPEN
+
+    # The quota is back, the next call after reset_timeout is the trial
+    client.bucket = TokenBucket(rate=1000, capacity=1)
+    time.sleep(RESET_TIMEOUT)
+
+    assert client.call(lambda: "result") == "result"
+    assert client.breaker.state == CircuitBreaker.CLOSED